@@ -0,0 +1,174 @@
+// Initial payload and modeled time to interactive of the app's module graph.
+//
+// Walks the imports from the app entry without bundling: static imports
+// form the initial chunk, each `import()` target starts a lazy chunk (its
+// static imports not already in the initial chunk), and
+// `new URL(..., import.meta.url)` targets (the compute worker) are
+// separate. Sizes are source bytes and their gzip size, so they track a
+// real build's changes rather than its absolute numbers. npm packages are
+// not in the tree: React is the same in every build and left out, and
+// lucide-react icons are counted and charged --icon-kb each.
+//
+// Time to interactive is modeled as in bench/repeat-visit.mjs: the HTML
+// and then the initial chunk cost a round trip plus transfer time each, and
+// a first view that is not in the initial chunk costs one more of each,
+// since it is only requested once the initial chunk runs. The browser's own
+// figure is the `time-to-interactive` measure (lib/timing.js).
+//
+// With --ref, the same report is made for a git revision and the two are
+// compared.
+//
+// Usage: node bench/bundle-report.mjs [--ref HEAD~1] [--view components/BTechMode.jsx]
+//                                     [--rtt 300] [--kbps 1000] [--icon-kb 0.5]
+
+import { execFileSync } from 'node:child_process';
+import { readFile } from 'node:fs/promises';
+import { fileURLToPath } from 'node:url';
+import path from 'node:path';
+import { gzipSync } from 'node:zlib';
+
+const ROOT = fileURLToPath(new URL('..', import.meta.url));
+const ENTRY = 'import React, { useState, useEffect }.py';
+const EXTENSIONS = ['', '.js', '.jsx', '.mjs', '/index.js'];
+
+const option = (name, fallback) => {
+  const i = process.argv.indexOf(`--${name}`);
+  return i === -1 ? fallback : process.argv[i + 1];
+};
+
+const ref = option('ref', null);
+const view = option('view', 'components/BTechMode.jsx');
+const RTT = Number(option('rtt', 300));
+const KBPS = Number(option('kbps', 1000));
+const ICON_KB = Number(option('icon-kb', 0.5));
+
+const STATIC_IMPORT = /^\s*(?:import|export)\s+(?:[\s\S]*?\s+from\s+)?['"]([^'"]+)['"]/gm;
+const DYNAMIC_IMPORT = /import\(\s*['"]([^'"]+)['"]\s*\)/g;
+const WORKER_URL = /new URL\(\s*['"]([^'"]+)['"]\s*,\s*import\.meta\.url\s*\)/g;
+const ICON_IMPORT = /import\s*\{([^}]*)\}\s*from\s*['"]lucide-react['"]/g;
+
+// Reads a file of the working tree, or of `rev`; null if it does not exist
+const reader = (rev) => async (file) => {
+  try {
+    const source = rev
+      ? execFileSync('git', ['cat-file', 'blob', `${rev}:${file}`], { cwd: ROOT, encoding: 'utf8', stdio: ['ignore', 'pipe', 'ignore'] })
+      : await readFile(path.join(ROOT, file), 'utf8');
+    // Checkouts may differ in line endings only
+    return source.replace(/\r\n/g, '\n');
+  } catch (error) {
+    return null;
+  }
+};
+
+const matches = (pattern, source) => [...source.matchAll(pattern)].map(match => match[1]);
+
+// { [file]: { bytes, gzip, statics, dynamics, workers, icons } } for every
+// module reachable from the entry
+const scan = async (read) => {
+  const modules = {};
+
+  const resolve = async (from, specifier) => {
+    const base = path.posix.join(path.posix.dirname(from), specifier);
+    for (const extension of EXTENSIONS) {
+      const file = base + extension;
+      if (modules[file]) return file;
+      const source = await read(file);
+      if (source !== null) return { file, source };
+    }
+    throw new Error(`Cannot resolve ${specifier} from ${from}`);
+  };
+
+  const visit = async (file, source) => {
+    modules[file] = null;
+    const edges = { statics: [], dynamics: [], workers: [] };
+    const kinds = [['statics', STATIC_IMPORT], ['dynamics', DYNAMIC_IMPORT], ['workers', WORKER_URL]];
+    for (const [kind, pattern] of kinds) {
+      for (const specifier of matches(pattern, source)) {
+        if (!specifier.startsWith('.')) continue;
+        const resolved = await resolve(file, specifier);
+        const target = typeof resolved === 'string' ? resolved : resolved.file;
+        edges[kind].push(target);
+        if (typeof resolved !== 'string') await visit(resolved.file, resolved.source);
+      }
+    }
+    const icons = matches(ICON_IMPORT, source).flatMap(list => list.split(',').map(name => name.trim()).filter(Boolean));
+    modules[file] = { bytes: Buffer.byteLength(source), gzip: gzipSync(source).length, icons, ...edges };
+  };
+
+  const source = await read(ENTRY);
+  if (source === null) throw new Error(`No ${ENTRY}${ref ? ` at ${ref}` : ''}`);
+  await visit(ENTRY, source);
+  return modules;
+};
+
+// The module and everything it statically imports, minus `exclude`
+const closure = (modules, start, exclude = new Set()) => {
+  const seen = new Set();
+  const stack = [start];
+  while (stack.length > 0) {
+    const file = stack.pop();
+    if (seen.has(file) || exclude.has(file)) continue;
+    seen.add(file);
+    stack.push(...modules[file].statics);
+  }
+  return seen;
+};
+
+const measure = (modules, files) => {
+  const icons = new Set([...files].flatMap(file => modules[file].icons));
+  let bytes = 0;
+  let gzip = 0;
+  for (const file of files) {
+    bytes += modules[file].bytes;
+    gzip += modules[file].gzip;
+  }
+  return { modules: files.size, bytes, gzip, icons: icons.size, payload: gzip + icons.size * ICON_KB * 1024 };
+};
+
+const transferMs = (bytes) => (bytes * 8) / KBPS;
+
+const report = async (rev) => {
+  const modules = await scan(reader(rev));
+  const initialFiles = closure(modules, ENTRY);
+  const initial = measure(modules, initialFiles);
+
+  const chunks = {};
+  for (const [file, module] of Object.entries(modules)) {
+    for (const target of [...module.dynamics, ...module.workers]) {
+      if (!chunks[target] && !initialFiles.has(target)) {
+        chunks[target] = { worker: module.workers.includes(target), ...measure(modules, closure(modules, target, initialFiles)) };
+      }
+    }
+  }
+
+  const firstView = modules[view] && !initialFiles.has(view) ? chunks[view] : null;
+  const tti = 2 * RTT + transferMs(initial.payload) + (firstView ? RTT + transferMs(firstView.payload) : 0);
+  return { initial, chunks, firstView, tti };
+};
+
+const kb = (bytes) => `${(bytes / 1024).toFixed(1)} KB`;
+
+const print = (label, { initial, chunks, firstView, tti }) => {
+  console.log(`\n${label}`);
+  console.log(`  initial chunk   ${initial.modules} modules, ${kb(initial.bytes)} source, ${kb(initial.gzip)} gzip, ${initial.icons} icons`);
+  console.log(`  first view      ${firstView ? `${kb(firstView.payload)} (lazy)` : 'in the initial chunk'}`);
+  console.log(`  modeled TTI     ${tti.toFixed(0)} ms`);
+  console.log('  lazy chunks');
+  for (const [file, chunk] of Object.entries(chunks).sort(([a], [b]) => a.localeCompare(b))) {
+    console.log(`    ${file.padEnd(36)} ${kb(chunk.gzip).padStart(9)} gzip, ${chunk.icons} icons${chunk.worker ? ' (worker)' : ''}`);
+  }
+};
+
+console.log(`Network model: ${RTT} ms round trip, ${KBPS} kbps, ${ICON_KB} KB per icon; first view ${view}`);
+const current = await report(null);
+print('Working tree', current);
+
+if (ref) {
+  const previous = await report(ref);
+  print(ref, previous);
+  const change = (before, after) => `${after - before >= 0 ? '+' : ''}${(((after - before) / before) * 100).toFixed(0)}%`;
+  console.log(`\n${ref} -> working tree`);
+  console.log(`  initial payload ${kb(previous.initial.payload)} -> ${kb(current.initial.payload)} (${change(previous.initial.payload, current.initial.payload)})`);
+  console.log(`  icons           ${previous.initial.icons} -> ${current.initial.icons}`);
+  console.log(`  modeled TTI     ${previous.tti.toFixed(0)} ms -> ${current.tti.toFixed(0)} ms (${change(previous.tti, current.tti)})`);
+}
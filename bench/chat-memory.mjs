@@ -0,0 +1,107 @@
+// Memory and append cost of a long chat session, with and without the
+// bounded window (lib/chatWindow.js).
+//
+// Replays a session of question/answer pairs the way the chat tab handles
+// them: every exchange is appended to the in-memory history, the context
+// window is sliced for the engine, and every SAVE_EVERY messages autosave
+// archives the new ones to the chat log. The log's storage (lib/storage.js,
+// with chat segments uncached as in the app) sits on a stand-in for
+// window.storage that keeps values as Buffers, outside the JS heap, so the
+// archive itself does not count towards the heap figures.
+//
+//   unbounded   the previous behavior: `[...prev, question, answer]` and
+//               the whole history kept in memory
+//   window      appendMessages + trimWindow after each save
+//
+// Heap is sampled after a forced GC.
+//
+// Usage: node bench/chat-memory.mjs [--messages 100000]
+
+import vm from 'node:vm';
+import v8 from 'node:v8';
+import { performance } from 'node:perf_hooks';
+import { createChatLog } from '../lib/chatLog.js';
+import { EMPTY_WINDOW, appendMessages, trimWindow, contextWindow } from '../lib/chatWindow.js';
+import { createStorage, windowStorageBackend } from '../lib/storage.js';
+
+v8.setFlagsFromString('--expose-gc');
+const gc = vm.runInNewContext('gc');
+
+const arg = (name, fallback) => {
+  const i = process.argv.indexOf(`--${name}`);
+  return i === -1 ? fallback : Number(process.argv[i + 1]);
+};
+
+const MESSAGES = arg('messages', 100000);
+const SAMPLES = 5;
+const SAVE_EVERY = 20;
+const CONTEXT = 10;
+
+const createOffHeapStorage = () => {
+  const values = new Map();
+  return {
+    get: async (key) => (values.has(key) ? { value: values.get(key).toString() } : null),
+    set: async (key, value) => {
+      values.set(key, Buffer.from(value));
+    },
+    delete: async (key) => {
+      values.delete(key);
+    }
+  };
+};
+
+const exchange = (i) => [
+  { type: 'user', text: `Question ${i}: what is the difference between TCP and UDP in this case?` },
+  { type: 'ai', text: `Answer ${i}: `.padEnd(600, 'lorem ipsum dolor sit amet ') }
+];
+
+const heapMB = () => {
+  gc();
+  return process.memoryUsage().heapUsed / (1024 * 1024);
+};
+
+const run = async (name, bounded) => {
+  const offHeap = createOffHeapStorage();
+  const storage = createStorage({
+    backend: windowStorageBackend({ getStorage: () => offHeap }),
+    shouldCache: key => !key.startsWith('chat_log:')
+  });
+  const chatLog = createChatLog(storage);
+  let chat = bounded ? EMPTY_WINDOW : [];
+  let appendMs = 0;
+  let maxAppendMs = 0;
+  const samples = [];
+  const start = heapMB();
+
+  for (let i = 0; i < MESSAGES / 2; i++) {
+    const messages = bounded ? chat.messages : chat;
+    const context = contextWindow(messages, CONTEXT);
+    const t0 = performance.now();
+    chat = bounded ? appendMessages(chat, exchange(i)) : [...chat, ...exchange(i)];
+    const ms = performance.now() - t0;
+    appendMs += ms;
+    maxAppendMs = Math.max(maxAppendMs, ms);
+    if (context.length > CONTEXT) throw new Error('context window overflow');
+
+    const count = (i + 1) * 2;
+    if (count % SAVE_EVERY === 0 && bounded) {
+      await chatLog.sync(chat.messages, chat.base);
+      chat = trimWindow(chat, chat.base + chat.messages.length);
+      // Saves run from a timer; let the log's idle compaction in between
+      await new Promise(resolve => setTimeout(resolve, 0));
+    }
+    if (count % (MESSAGES / SAMPLES) === 0) {
+      samples.push(heapMB() - start);
+    }
+  }
+
+  const inMemory = bounded ? chat.messages.length : chat.length;
+  console.log(
+    `${name.padEnd(10)} heap ${samples.map(mb => `${mb.toFixed(1).padStart(6)}`).join(' ')} MB`
+    + `   in memory ${String(inMemory).padStart(6)}   append avg ${(appendMs / (MESSAGES / 2) * 1000).toFixed(1)} µs, max ${maxAppendMs.toFixed(2)} ms`
+  );
+};
+
+console.log(`${MESSAGES} messages, heap growth sampled every ${MESSAGES / SAMPLES}`);
+await run('unbounded', false);
+await run('window', true);
@@ -0,0 +1,11 @@
+// worker_threads host for lib/computeOps.js, standing in for
+// workers/compute.js in Node benchmarks.
+
+import { parentPort } from 'node:worker_threads';
+import { createComputeOps, handleComputeRequest } from '../lib/computeOps.js';
+
+const ops = createComputeOps();
+
+parentPort.on('message', (data) => {
+  handleComputeRequest(ops, data, (message, transfer) => parentPort.postMessage(message, transfer));
+});
@@ -0,0 +1,83 @@
+// Startup / per-keystroke cost of the inline `branches` literal versus the
+// lazily loaded curriculum bundle.
+//
+// The inline version re-evaluated the whole curriculum object graph on every
+// render of UltimateAIAssistant; the bundle evaluates a small manifest up
+// front and one branch module on selection, after which renders only do a
+// lookup. Rebuilding the graph with a deep copy stands in for evaluating the
+// literal, so this runs under plain Node without a DOM.
+//
+// Usage: node bench/content-startup.mjs [--scale 50] [--renders 2000]
+
+import { performance } from 'node:perf_hooks';
+import { branchManifest, loadBranch, getLoadedBranch } from '../curriculum/index.js';
+
+const arg = (name, fallback) => {
+  const i = process.argv.indexOf(`--${name}`);
+  return i === -1 ? fallback : Number(process.argv[i + 1]);
+};
+
+const scale = arg('scale', 50);
+const renders = arg('renders', 2000);
+
+const rebuild = (value) => {
+  if (Array.isArray(value)) return value.map(rebuild);
+  if (value && typeof value === 'object') {
+    const out = {};
+    for (const key of Object.keys(value)) out[key] = rebuild(value[key]);
+    return out;
+  }
+  return value;
+};
+
+// Grow the sample curriculum so every branch carries `scale` times as many
+// subjects, mirroring a real deployment.
+const scaleBranch = (content) => {
+  const subjects = {};
+  for (let copy = 0; copy < scale; copy++) {
+    for (const [key, subject] of Object.entries(content.subjects)) {
+      subjects[`${key}${copy}`] = subject;
+    }
+  }
+  return { subjects };
+};
+
+const keys = Object.keys(branchManifest);
+const scaled = {};
+for (const key of keys) {
+  scaled[key] = scaleBranch(await loadBranch(key));
+}
+const inlineLiteral = {};
+for (const key of keys) {
+  inlineLiteral[key] = { ...branchManifest[key], subjects: scaled[key].subjects };
+}
+
+const time = (fn, iterations = 1) => {
+  const start = performance.now();
+  for (let i = 0; i < iterations; i++) fn();
+  return (performance.now() - start) / iterations;
+};
+
+// Warm up the JIT on both paths before measuring
+time(() => rebuild(inlineLiteral), 20);
+time(() => rebuild(scaled.cse), 20);
+
+const inlineFirstPaint = time(() => rebuild(inlineLiteral));
+const bundleFirstPaint = time(() => {
+  rebuild(branchManifest);
+  rebuild(scaled.cse);
+});
+
+const inlineKeystroke = time(() => rebuild(inlineLiteral), renders);
+let sink = 0;
+const bundleKeystroke = time(() => {
+  sink += Object.keys(branchManifest).length + (getLoadedBranch('cse') ? 1 : 0);
+}, renders);
+
+const fmt = (ms) => `${ms.toFixed(4)} ms`;
+console.log(`curriculum scale: x${scale} (${keys.length} branches), ${renders} renders`);
+console.log('');
+console.log('                    inline literal    content bundle');
+console.log(`first paint         ${fmt(inlineFirstPaint).padEnd(18)}${fmt(bundleFirstPaint)}`);
+console.log(`per keystroke       ${fmt(inlineKeystroke).padEnd(18)}${fmt(bundleKeystroke)}`);
+if (sink < 0) console.log(sink);
@@ -0,0 +1,57 @@
+// Deterministic synthetic curriculum generator for benchmarks.
+//
+// Produces an object shaped like the curriculum bundle
+// ({ [branch]: { subjects: { [subject]: { name, topics } } } }) with the
+// requested number of topics, drawing words from a fixed vocabulary so runs
+// are comparable across machines. The vocabulary is deliberately small, so
+// every word appears in a large share of topics: posting lists are far
+// denser than in real content, which makes this a worst case for search.
+//
+// Usage: node bench/corpus.mjs --topics 10000 > corpus.json
+
+const VOCABULARY = (
+  'algorithm array binary cache circuit complexity compiler convection current ' +
+  'database deadlock diode dynamic efficiency entropy filter fourier frequency ' +
+  'gradient graph hash heap impedance inductor integral kernel laplace latency ' +
+  'matrix memory network normalization operator optimization paging pipeline ' +
+  'pressure process protocol queue recursion register resistance scheduling ' +
+  'semaphore signal sorting stack stress thermodynamics thread transform ' +
+  'transistor tree turbine velocity voltage vector viscosity wavelet'
+).split(' ');
+
+// Small seeded PRNG (mulberry32) so the corpus is reproducible
+const random = (seed) => () => {
+  seed = (seed + 0x6D2B79F5) | 0;
+  let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+  t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+  return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+};
+
+export const generateCorpus = ({ topics = 10000, branches = 6, topicsPerSubject = 20, seed = 1 } = {}) => {
+  const next = random(seed);
+  const word = () => VOCABULARY[Math.floor(next() * VOCABULARY.length)];
+  const phrase = (length) => Array.from({ length }, word).join(' ');
+  const list = (count, length) => Array.from({ length: count }, () => phrase(length));
+
+  const corpus = {};
+  for (let i = 0; i < topics; i++) {
+    const branchKey = `branch${i % branches}`;
+    const subjectKey = `${branchKey}s${Math.floor(i / (branches * topicsPerSubject))}`;
+    const branch = corpus[branchKey] || (corpus[branchKey] = { subjects: {} });
+    const subject = branch.subjects[subjectKey] || (branch.subjects[subjectKey] = { name: phrase(3), topics: [] });
+    subject.topics.push({
+      title: `${phrase(2)} ${i}`,
+      content: phrase(12),
+      formulas: list(2, 5),
+      keyPoints: list(3, 4),
+      examples: list(2, 4)
+    });
+  }
+  return corpus;
+};
+
+if (import.meta.url === `file://${process.argv[1]}`) {
+  const i = process.argv.indexOf('--topics');
+  const topics = i === -1 ? 10000 : Number(process.argv[i + 1]);
+  process.stdout.write(JSON.stringify(generateCorpus({ topics })));
+}
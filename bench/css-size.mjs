@@ -0,0 +1,123 @@
+// Size of the color utility CSS Tailwind has to generate for the app.
+//
+// Tailwind keeps a class only if it finds it written out in the content
+// files. A class assembled at runtime (`border-${color}-500`) is invisible
+// to it, so a deployment has to safelist the pattern for every palette
+// color. This scans the app sources as Tailwind's extractor would: literal
+// color classes are kept as found, and each runtime-built class costs the
+// safelist for all PALETTE colors.
+//
+// Only color utilities (bg, text, border, divide with a palette color or a
+// theme variable, as in bg-[var(--app-surface)]) are counted. They are the
+// only rules that differ. Rule text follows
+// Tailwind 3's minified output with one representative RGB value, so
+// byte counts are estimates within a few bytes per rule.
+//
+// With --ref, the sources at that git revision are scanned as well and the
+// two are compared.
+//
+// Usage: node bench/css-size.mjs [--ref HEAD~1]
+
+import { execFileSync } from 'node:child_process';
+import { readFile } from 'node:fs/promises';
+import { fileURLToPath } from 'node:url';
+import path from 'node:path';
+import { gzipSync } from 'node:zlib';
+
+const ROOT = fileURLToPath(new URL('..', import.meta.url));
+// The content globs a Tailwind config for this app would use
+const CONTENT = /^(components\/.*\.jsx|lib\/.*\.js|curriculum\/.*\.js|[^/]*\.py)$/;
+
+const PALETTE = [
+  'slate', 'gray', 'zinc', 'neutral', 'stone', 'red', 'orange', 'amber', 'yellow', 'lime', 'green',
+  'emerald', 'teal', 'cyan', 'sky', 'blue', 'indigo', 'violet', 'purple', 'fuchsia', 'pink', 'rose'
+];
+const COLOR_CLASS = new RegExp(`^(?:[a-z-]+:)*(bg|text|border|divide)-(?:(${PALETTE.join('|')})-(\\d{2,3})(?:/(\\d+))?|\\[var\\((--[\\w-]+)\\)\\])$`);
+// A class name; brackets may hold parentheses, as in bg-[var(--app-bg)]
+const TOKEN = /(?:[^<>"'`\s{}()[\]]|\[[^\]\s]*\])+/g;
+const RUNTIME_CLASS = /[\w:/.-]*\$\{[\w.?]+\}[\w:/.-]*/g;
+
+const option = (name, fallback) => {
+  const i = process.argv.indexOf(`--${name}`);
+  return i === -1 ? fallback : process.argv[i + 1];
+};
+
+const ref = option('ref', null);
+
+const git = (...args) => execFileSync('git', args, { cwd: ROOT, encoding: 'utf8', maxBuffer: 64 * 1024 * 1024 });
+
+const sources = async (rev) => {
+  const files = (rev
+    ? git('ls-tree', '-r', '--name-only', rev)
+    : git('ls-files', '--cached', '--others', '--exclude-standard')
+  ).split('\n').filter(file => CONTENT.test(file));
+  return Promise.all(files.map(file => (rev ? git('cat-file', 'blob', `${rev}:${file}`) : readFile(path.join(ROOT, file), 'utf8'))));
+};
+
+// Minified Tailwind 3 rule for a color class
+const rule = (name) => {
+  const [, property, , , opacity, variable] = name.match(COLOR_CLASS);
+  const escaped = `.${name.replace(/[:/[\]()]/g, '\\$&')}`;
+  // divide-* colors the borders between children
+  const selector = property === 'divide' ? `${escaped}>:not([hidden])~:not([hidden])` : escaped;
+  const css = { bg: 'background-color', text: 'color', border: 'border-color', divide: 'border-color' }[property];
+  if (variable) return `${selector}{${css}:var(${variable})}`;
+  const rgb = '59 130 246';
+  if (opacity) {
+    return `${selector}{${css}:rgb(${rgb}/${Number(opacity) / 100})}`;
+  }
+  if (property === 'bg') return `${selector}{--tw-bg-opacity:1;background-color:rgb(${rgb}/var(--tw-bg-opacity))}`;
+  if (property === 'text') return `${selector}{--tw-text-opacity:1;color:rgb(${rgb}/var(--tw-text-opacity))}`;
+  return `${selector}{--tw-border-opacity:1;border-color:rgb(${rgb}/var(--tw-border-opacity))}`;
+};
+
+const scan = async (rev) => {
+  const literal = new Set();
+  const safelisted = new Set();
+  const patterns = new Set();
+  for (const source of await sources(rev)) {
+    for (const pattern of source.match(RUNTIME_CLASS) ?? []) {
+      for (const color of PALETTE) {
+        const name = pattern.replace(/\$\{[\w.?]+\}/g, color);
+        if (!COLOR_CLASS.test(name)) break;
+        patterns.add(pattern);
+        safelisted.add(name);
+      }
+    }
+    for (const token of source.replace(RUNTIME_CLASS, ' ').match(TOKEN) ?? []) {
+      if (COLOR_CLASS.test(token)) literal.add(token);
+    }
+  }
+  const classes = new Set([...literal, ...safelisted]);
+  const css = [...classes].sort().map(rule).join('');
+  return {
+    patterns: [...patterns],
+    literal: literal.size,
+    safelisted: [...safelisted].filter(name => !literal.has(name)).length,
+    rules: classes.size,
+    bytes: Buffer.byteLength(css),
+    gzip: gzipSync(css).length
+  };
+};
+
+const kb = (bytes) => `${(bytes / 1024).toFixed(2)} KB`;
+
+const print = (label, result) => {
+  console.log(`\n${label}`);
+  console.log(`  runtime-built classes  ${result.patterns.length ? result.patterns.join(', ') : 'none'}`);
+  console.log(`  color rules            ${result.rules} (${result.literal} written out, ${result.safelisted} only from the safelist)`);
+  console.log(`  CSS                    ${kb(result.bytes)}, ${kb(result.gzip)} gzip`);
+};
+
+const current = await scan(null);
+print('Working tree', current);
+
+if (ref) {
+  const previous = await scan(ref);
+  print(ref, previous);
+  const change = (before, after) => `${after - before >= 0 ? '+' : ''}${(((after - before) / before) * 100).toFixed(0)}%`;
+  console.log(`\n${ref} -> working tree`);
+  console.log(`  color rules  ${previous.rules} -> ${current.rules} (${change(previous.rules, current.rules)})`);
+  console.log(`  CSS          ${kb(previous.bytes)} -> ${kb(current.bytes)} (${change(previous.bytes, current.bytes)})`);
+  console.log(`  gzip         ${kb(previous.gzip)} -> ${kb(current.gzip)} (${change(previous.gzip, current.gzip)})`);
+}
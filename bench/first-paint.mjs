@@ -0,0 +1,91 @@
+// First contentful paint of a curriculum deep link, client-only versus
+// prerendered (scripts/prerender.mjs).
+//
+// Prerenders every view against a minimal index.html and models the load
+// on a slow connection, as bench/repeat-visit.mjs does. Each request in the
+// critical path costs one round trip plus transfer time; script execution
+// costs --cpu-ms-per-kb per gzipped KB of bundle (the default is in line
+// with a low-end phone).
+//
+//   client-only   HTML shell, then stylesheet and bundle, then execution,
+//                 then the branch manifest and content JSON; the topic
+//                 paints after that
+//   prerendered   the page, then the stylesheet; the topic paints at once.
+//                 The bundle still loads and takes over, but the content
+//                 needs no fetch.
+//
+// Page sizes are measured; --bundle-kb and --css-kb are the app's gzipped
+// script and stylesheet (see bench/bundle-report.mjs).
+//
+// Usage: node bench/first-paint.mjs [--rtt 300] [--kbps 1000] [--bundle-kb 95]
+//                                   [--css-kb 10] [--cpu-ms-per-kb 10]
+
+import { gzipSync } from 'node:zlib';
+import { loadAllBranches } from '../scripts/build-curriculum.mjs';
+import { prerender } from '../scripts/prerender.mjs';
+import { withRelated } from '../lib/related.js';
+
+const arg = (name, fallback) => {
+  const i = process.argv.indexOf(`--${name}`);
+  return i === -1 ? fallback : Number(process.argv[i + 1]);
+};
+
+const RTT = arg('rtt', 300);
+const KBPS = arg('kbps', 1000);
+const BUNDLE_KB = arg('bundle-kb', 95);
+const CSS_KB = arg('css-kb', 10);
+const CPU_MS_PER_KB = arg('cpu-ms-per-kb', 10);
+
+const TEMPLATE = `<!doctype html>
+<html lang="en">
+  <head>
+    <meta charset="UTF-8" />
+    <meta name="viewport" content="width=device-width, initial-scale=1.0" />
+    <title>AI Study Assistant</title>
+    <script type="module" crossorigin src="/assets/index.js"></script>
+    <link rel="stylesheet" href="/assets/index.css">
+  </head>
+  <body>
+    <div id="root"></div>
+  </body>
+</html>
+`;
+
+const gzipKB = (text) => gzipSync(text).length / 1024;
+const request = (kb) => RTT + (kb * 1024 * 8) / KBPS;
+
+const contents = withRelated(await loadAllBranches());
+const pages = await prerender({ template: TEMPLATE, contents });
+
+const shellKB = gzipKB(TEMPLATE);
+const executeMs = BUNDLE_KB * CPU_MS_PER_KB;
+const assets = Math.max(request(BUNDLE_KB), request(CSS_KB));
+
+const rows = Object.entries(pages).map(([url, html]) => {
+  const branch = url.split('/')[2];
+  const pageKB = gzipKB(html);
+  const contentKB = gzipKB(JSON.stringify(contents[branch]));
+  // The app shell's own first paint (header, branch grid) comes after the
+  // bundle runs; the topic after its content arrives
+  const clientShell = request(shellKB) + assets + executeMs;
+  const clientTopic = clientShell + request(0.2) + request(contentKB);
+  const prerenderedTopic = request(pageKB) + request(CSS_KB);
+  // Interactive once the bundle has run, with the content already on the page
+  const prerenderedInteractive = request(pageKB) + assets + executeMs;
+  return { url, pageKB, clientShell, clientTopic, prerenderedTopic, prerenderedInteractive, clientInteractive: clientTopic };
+});
+
+const median = (values) => {
+  const sorted = [...values].sort((a, b) => a - b);
+  const mid = Math.floor(sorted.length / 2);
+  return sorted.length % 2 ? sorted[mid] : (sorted[mid - 1] + sorted[mid]) / 2;
+};
+const stat = (key) => `${median(rows.map(row => row[key])).toFixed(0).padStart(6)} ms median, ${Math.max(...rows.map(row => row[key])).toFixed(0).padStart(6)} ms max`;
+
+console.log(`${rows.length} views; ${RTT} ms round trip, ${KBPS} kbps, bundle ${BUNDLE_KB} KB, CSS ${CSS_KB} KB, ${CPU_MS_PER_KB} ms/KB to execute`);
+console.log(`prerendered pages: ${median(rows.map(row => row.pageKB)).toFixed(1)} KB gzip median, ${Math.max(...rows.map(row => row.pageKB)).toFixed(1)} KB max\n`);
+console.log(`client-only   first paint (app shell)  ${stat('clientShell')}`);
+console.log(`client-only   topic visible            ${stat('clientTopic')}`);
+console.log(`prerendered   topic visible            ${stat('prerenderedTopic')}`);
+console.log(`client-only   interactive              ${stat('clientInteractive')}`);
+console.log(`prerendered   interactive              ${stat('prerenderedInteractive')}`);
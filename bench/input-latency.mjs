@@ -0,0 +1,108 @@
+// Input latency while heavy compute work runs, with the work done inline on
+// the main thread versus through the compute worker.
+//
+// A keystroke is simulated every 16 ms; its latency is how late its handler
+// runs, which is the delay a user would see before the input reacts. The
+// synthetic load indexes a large corpus, runs chat retrievals and searches,
+// and round-trips a long chat history through JSON one storage segment at a
+// time, as lib/chatLog.js does.
+//
+// Usage: node bench/input-latency.mjs [--topics 10000] [--messages 50000]
+
+import { performance } from 'node:perf_hooks';
+import { Worker } from 'node:worker_threads';
+import { createComputeOps } from '../lib/computeOps.js';
+import { createComputeClient } from '../lib/computeClient.js';
+import { generateCorpus } from './corpus.mjs';
+
+const arg = (name, fallback) => {
+  const i = process.argv.indexOf(name);
+  return i === -1 ? fallback : Number(process.argv[i + 1]);
+};
+
+const topics = arg('--topics', 10000);
+const messageCount = arg('--messages', 50000);
+const KEY_INTERVAL = 16;
+
+const corpus = generateCorpus({ topics });
+const history = Array.from({ length: messageCount }, (_, i) => ({
+  type: i % 2 === 0 ? 'user' : 'ai',
+  text: `Message ${i}: explain the fourier transform of a periodic signal and its convergence`
+}));
+const SEGMENT_SIZE = 200;
+const segmentTexts = [];
+for (let i = 0; i < history.length; i += SEGMENT_SIZE) {
+  segmentTexts.push(JSON.stringify(history.slice(i, i + SEGMENT_SIZE)));
+}
+const QUERIES = ['explain fourier transform', 'memory paging formula', 'binary tree recursion example', 'voltage'];
+
+// Adapts a worker_threads Worker to the Web Worker interface the client uses
+const createNodeWorker = () => {
+  const worker = new Worker(new URL('./compute-worker.mjs', import.meta.url));
+  const adapter = {
+    onmessage: null,
+    onerror: null,
+    postMessage: (message, transfer) => worker.postMessage(message, transfer),
+    terminate: () => worker.terminate()
+  };
+  worker.on('message', (data) => adapter.onmessage({ data }));
+  worker.on('error', (error) => adapter.onerror({ message: error.message }));
+  return adapter;
+};
+
+const heavyLoad = async (call) => {
+  for (const [branch, content] of Object.entries(corpus)) {
+    await call('index', { branch: `synthetic-${branch}`, content });
+  }
+  for (let round = 0; round < 3; round++) {
+    for (const text of segmentTexts) {
+      await call('stringifyJSON', { value: await call('parseJSON', { text }) });
+    }
+    for (let i = 0; i < history.length; i += SEGMENT_SIZE) {
+      await call('encodeJSON', { values: history.slice(i, i + SEGMENT_SIZE), separator: ',' });
+    }
+    for (const query of QUERIES) {
+      await call('retrieve', { query });
+      await call('search', { query, limit: 8 });
+    }
+  }
+};
+
+const measureKeystrokes = async (load) => {
+  const latencies = [];
+  let typing = true;
+  const keystroke = (expected) => {
+    const now = performance.now();
+    latencies.push(now - expected);
+    if (typing) setTimeout(() => keystroke(now + KEY_INTERVAL), KEY_INTERVAL);
+  };
+  setTimeout(() => keystroke(performance.now() + KEY_INTERVAL), KEY_INTERVAL);
+  const start = performance.now();
+  await load();
+  const elapsed = performance.now() - start;
+  typing = false;
+  await new Promise(resolve => setTimeout(resolve, KEY_INTERVAL * 2));
+  latencies.sort((a, b) => a - b);
+  const pct = (p) => latencies[Math.min(latencies.length - 1, Math.floor(p * latencies.length))] ?? 0;
+  return { elapsed, keys: latencies.length, p50: pct(0.5), p95: pct(0.95), p99: pct(0.99), max: latencies[latencies.length - 1] ?? 0 };
+};
+
+const report = (label, r) => {
+  console.log(
+    `${label.padEnd(8)} load ${r.elapsed.toFixed(0).padStart(6)} ms  keys ${String(r.keys).padStart(5)}  ` +
+    `latency p50 ${r.p50.toFixed(1)}  p95 ${r.p95.toFixed(1)}  p99 ${r.p99.toFixed(1)}  max ${r.max.toFixed(1)} ms`
+  );
+};
+
+console.log(`corpus: ${topics} topics, history: ${messageCount} messages (${(segmentTexts.join('').length / 1e6).toFixed(1)} MB)`);
+
+report('idle', await measureKeystrokes(() => new Promise(resolve => setTimeout(resolve, 1000))));
+
+const ops = createComputeOps();
+report('inline', await measureKeystrokes(() => heavyLoad((op, args) => ops[op](args, () => {}))));
+
+const client = createComputeClient(createNodeWorker);
+// Start the worker and load its modules before measuring
+await client.call('search', { query: 'warm up' });
+report('worker', await measureKeystrokes(() => heavyLoad((op, args) => client.call(op, args))));
+client.terminate();
@@ -0,0 +1,37 @@
+// Module hooks that let Node import the app's components directly: .jsx
+// files are compiled with esbuild (a devDependency in package.json), and
+// relative imports written without an extension, or naming a directory,
+// resolve to the .jsx, .js or index.js file.
+//
+// Registered by scripts that render components (bench/render-count.mjs):
+//
+//   register('./jsx-loader.mjs', import.meta.url);
+
+import { readFile } from 'node:fs/promises';
+import { fileURLToPath } from 'node:url';
+import { transform } from 'esbuild';
+
+const EXTENSIONS = ['.jsx', '.js', '/index.js'];
+
+export const resolve = async (specifier, context, nextResolve) => {
+  try {
+    return await nextResolve(specifier, context);
+  } catch (error) {
+    if (!specifier.startsWith('.')) throw error;
+    for (const extension of EXTENSIONS) {
+      try {
+        return await nextResolve(specifier + extension, context);
+      } catch {
+        // try the next one
+      }
+    }
+    throw error;
+  }
+};
+
+export const load = async (url, context, nextLoad) => {
+  if (!url.endsWith('.jsx')) return nextLoad(url, context);
+  const source = await readFile(fileURLToPath(url), 'utf8');
+  const { code } = await transform(source, { loader: 'jsx', jsx: 'automatic', format: 'esm', sourcefile: fileURLToPath(url) });
+  return { format: 'module', source: code, shortCircuit: true };
+};
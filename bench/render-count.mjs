@@ -0,0 +1,140 @@
+// Render-count regression test for the memoized B.Tech view.
+//
+// Renders BTechMode with react-test-renderer inside a <Profiler>, with the
+// state and stable callbacks UltimateAIAssistant gives it, and opens a
+// subject. Then it expands, collapses and stars one topic card and checks
+// that each interaction commits once and re-renders that card alone: no
+// other TopicCard, no BranchGrid, no SubjectGrid. The render functions of
+// the memoized components are wrapped to count their calls.
+//
+// Needs the dependencies in package.json (npm install). Exits with 1 when
+// a check fails.
+//
+// Usage: npm test, or node bench/render-count.mjs
+
+import { register } from 'node:module';
+import { loadAllBranches } from '../scripts/build-curriculum.mjs';
+
+register('./jsx-loader.mjs', import.meta.url);
+
+globalThis.IS_REACT_ACT_ENVIRONMENT = true;
+
+const React = await import('react');
+const { default: TestRenderer, act } = await import('react-test-renderer');
+const { default: BTechMode } = await import('../components/BTechMode.jsx');
+const { default: TopicCard } = await import('../components/TopicCard.jsx');
+const { default: BranchGrid } = await import('../components/BranchGrid.jsx');
+const { default: SubjectGrid } = await import('../components/SubjectGrid.jsx');
+const { toggleFavorite } = await import('../lib/favorites.js');
+
+const { createElement: h, useCallback, useState, Profiler } = React;
+
+// Count calls of each memoized component's render function
+const renders = { TopicCard: [], BranchGrid: 0, SubjectGrid: 0 };
+const countRenders = (component, record) => {
+  const render = component.type;
+  component.type = (props) => {
+    record(props);
+    return render(props);
+  };
+};
+countRenders(TopicCard, props => renders.TopicCard.push(props.topicKey));
+countRenders(BranchGrid, () => renders.BranchGrid++);
+countRenders(SubjectGrid, () => renders.SubjectGrid++);
+
+let commits = 0;
+const onRender = () => {
+  commits++;
+};
+
+// The first branch with a subject of several topics
+const contents = await loadAllBranches();
+const [branch, subject] = Object.entries(contents).flatMap(([key, content]) => Object.entries(content.subjects)
+  .filter(([, { topics }]) => topics.length > 1)
+  .map(([subjectKey]) => [key, subjectKey]))[0];
+const topicCount = contents[branch].subjects[subject].topics.length;
+
+const noop = () => {};
+
+// The part of UltimateAIAssistant that drives BTechMode
+function Harness() {
+  const [selectedBranch, setSelectedBranch] = useState(branch);
+  const [selectedSubject, setSelectedSubject] = useState(subject);
+  const [expandedTopics, setExpandedTopics] = useState({});
+  const [favorites, setFavorites] = useState(() => new Set());
+
+  const handleSelectBranch = useCallback((key) => {
+    setSelectedBranch(key);
+    setSelectedSubject(null);
+  }, []);
+
+  const handleToggleTopic = useCallback((topicKey) => {
+    setExpandedTopics(prev => ({ ...prev, [topicKey]: !prev[topicKey] }));
+  }, []);
+
+  const handleToggleFavorite = useCallback((topicKey) => {
+    setFavorites(prev => toggleFavorite(prev, topicKey));
+  }, []);
+
+  return h(Profiler, { id: 'btech', onRender }, h(BTechMode, {
+    searchQuery: '',
+    searchResults: [],
+    onSearchChange: noop,
+    onSearchFocus: noop,
+    onOpenResult: noop,
+    selectedBranch,
+    onSelectBranch: handleSelectBranch,
+    branchContent: contents[selectedBranch],
+    selectedSubject,
+    onSelectSubject: setSelectedSubject,
+    expandedTopics,
+    favorites,
+    showFormulas: true,
+    showKeyPoints: true,
+    onToggleTopic: handleToggleTopic,
+    onToggleFavorite: handleToggleFavorite,
+    onOpenFormula: noop,
+    onOpenNotes: noop,
+    onOpenRelated: noop
+  }));
+}
+
+let renderer;
+await act(async () => {
+  renderer = TestRenderer.create(h(Harness));
+});
+
+let failed = false;
+const check = (name, actual, expected) => {
+  const ok = JSON.stringify(actual) === JSON.stringify(expected);
+  if (!ok) failed = true;
+  console.log(`${name.padEnd(44)} ${ok ? 'ok' : `FAIL (got ${JSON.stringify(actual)}, expected ${JSON.stringify(expected)})`}`);
+};
+
+// The card's own buttons: its title toggles it, the star favorites it.
+// (The test instance's type is the counting wrapper, so find it by its key.)
+const card = (idx) => renderer.root.findAll(node => node.props.topicKey === `${subject}-${idx}`)[0];
+const button = (idx, title) => card(idx).findAll(node => node.type === 'button' && (title === undefined || node.props.title === title))[0];
+
+const interact = async (name, press) => {
+  renders.TopicCard = [];
+  renders.BranchGrid = 0;
+  renders.SubjectGrid = 0;
+  commits = 0;
+  await act(async () => {
+    press();
+  });
+  check(`${name}: commits`, commits, 1);
+  check(`${name}: TopicCard renders`, renders.TopicCard, [`${subject}-1`]);
+  check(`${name}: BranchGrid and SubjectGrid renders`, renders.BranchGrid + renders.SubjectGrid, 0);
+};
+
+console.log(`${branch} / ${subject}: ${topicCount} topic cards\n`);
+check('mount: TopicCard renders', renders.TopicCard.length, topicCount);
+await interact('expand', () => button(1).props.onClick());
+await interact('collapse', () => button(1).props.onClick());
+await interact('favorite', () => button(1, 'Add to favorites').props.onClick());
+
+if (failed) {
+  process.exitCode = 1;
+}
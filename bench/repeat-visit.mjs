@@ -0,0 +1,217 @@
+// Repeat-visit cost with and without the service worker (public/sw.js).
+//
+// Runs the real service worker script in a VM against an in-memory Cache
+// Storage and a simulated server holding the app shell and the curriculum
+// built by scripts/build-curriculum.mjs, and records every network request
+// a visit makes. Load time is then modeled on a slow connection: requests
+// that block first render cost one round trip plus transfer time each, in
+// dependency order (HTML, then shell assets in parallel, then curriculum).
+//
+// Scenarios:
+//   no-sw       every visit downloads the shell and the opened branch
+//   first       first visit with the worker (installs and precaches)
+//   repeat      later visit, nothing changed
+//   update      later visit after one branch's content changed
+//   after       the visit after that
+//
+// Usage: node bench/repeat-visit.mjs [--rtt 300] [--kbps 1000] [--bundle-kb 320]
+
+import vm from 'node:vm';
+import { readFile } from 'node:fs/promises';
+import { buildCurriculum, loadAllBranches } from '../scripts/build-curriculum.mjs';
+
+const arg = (name, fallback) => {
+  const i = process.argv.indexOf(`--${name}`);
+  return i === -1 ? fallback : Number(process.argv[i + 1]);
+};
+
+const RTT = arg('rtt', 300);
+const KBPS = arg('kbps', 1000);
+const BUNDLE_KB = arg('bundle-kb', 320);
+const ORIGIN = 'https://app.test';
+const OPENED_BRANCH = 'cse';
+
+const transferMs = (bytes) => (bytes * 8) / KBPS;
+
+// --- Simulated server ------------------------------------------------------
+
+const files = new Map();
+const serve = (path, body) => files.set(path, body);
+
+const publishShell = () => {
+  serve('/', '<!doctype html><html><head><link rel="stylesheet" href="/assets/index-3f2a.css">'
+    + '<link rel="icon" href="/favicon.svg"></head><body><div id="root"></div>'
+    + '<script type="module" src="/assets/index-9c1d.js"></script></body></html>');
+  serve('/assets/index-9c1d.js', 'x'.repeat(BUNDLE_KB * 1024));
+  serve('/assets/index-3f2a.css', 'x'.repeat(24 * 1024));
+  serve('/favicon.svg', 'x'.repeat(1024));
+};
+
+const publishCurriculum = (contents) => {
+  const built = buildCurriculum(contents);
+  for (const [file, json] of Object.entries(built.files)) serve(`/curriculum/${file}`, json);
+  serve('/curriculum/manifest.json', JSON.stringify(built.manifest));
+  return built.manifest;
+};
+
+let requests = [];
+// Responses that came out of Cache Storage rather than the network
+const cacheHits = new WeakSet();
+const pathOf = (input) => new URL(typeof input === 'string' ? input : input.url, ORIGIN).pathname;
+
+const network = async (input) => {
+  const path = pathOf(input);
+  const body = files.get(path);
+  requests.push({ path, bytes: body ? Buffer.byteLength(body) : 0 });
+  return body === undefined ? new Response('', { status: 404 }) : new Response(body, { status: 200 });
+};
+
+// --- In-memory Cache Storage -------------------------------------------------
+
+const createCaches = () => {
+  const stores = new Map();
+  const open = async (name) => {
+    if (!stores.has(name)) stores.set(name, new Map());
+    const store = stores.get(name);
+    return {
+      match: async (request) => {
+        const response = store.get(pathOf(request))?.clone();
+        if (response) cacheHits.add(response);
+        return response;
+      },
+      put: async (request, response) => {
+        store.set(pathOf(request), new Response(await response.arrayBuffer(), { status: response.status }));
+      },
+      addAll: async (urls) => {
+        for (const url of urls) {
+          const response = await network(url);
+          store.set(pathOf(url), response);
+        }
+      },
+      keys: async () => [...store.keys()].map(path => ({ url: ORIGIN + path })),
+      delete: async (request) => store.delete(pathOf(request))
+    };
+  };
+  return {
+    open,
+    keys: async () => [...stores.keys()],
+    delete: async (name) => stores.delete(name)
+  };
+};
+
+// --- Service worker host -----------------------------------------------------
+
+const startWorker = async () => {
+  const listeners = {};
+  const self = {
+    location: { origin: ORIGIN },
+    addEventListener: (type, fn) => { listeners[type] = fn; },
+    skipWaiting: async () => {},
+    clients: { claim: async () => {} }
+  };
+  const context = vm.createContext({ self, caches: createCaches(), fetch: network, URL, Response, Set, console });
+  vm.runInContext(await readFile(new URL('../public/sw.js', import.meta.url), 'utf8'), context);
+
+  const dispatch = async (type, init = {}) => {
+    const pending = [];
+    let response = null;
+    listeners[type]?.({
+      ...init,
+      waitUntil: (promise) => pending.push(promise),
+      respondWith: (promise) => { response = promise; }
+    });
+    const result = response ? await response : null;
+    return { result, background: Promise.all(pending) };
+  };
+
+  await (await dispatch('install')).background;
+  await (await dispatch('activate')).background;
+
+  // fetch() as seen by the page: through the worker when it handles the
+  // request, straight to the network otherwise
+  return async (path, mode = 'cors', destination = '') => {
+    const { result, background } = await dispatch('fetch', {
+      request: { url: ORIGIN + path, method: 'GET', mode, destination }
+    });
+    return { response: result || (await network(path)), background };
+  };
+};
+
+// --- Visits -------------------------------------------------------------------
+
+// Loads the page the way the app does: HTML, its assets, then the curriculum
+// manifest and the opened branch. Returns the requests on the critical path
+// (grouped by step) and the ones the worker made in the background.
+const visit = async (pageFetch) => {
+  const start = requests.length;
+  const blocking = [];
+  const backgrounds = [];
+  const step = async (paths) => {
+    const results = await Promise.all(paths.map(([path, mode, destination]) => pageFetch(path, mode, destination)));
+    const group = [];
+    for (const [i, { response, background }] of results.entries()) {
+      backgrounds.push(background);
+      if (!cacheHits.has(response)) {
+        group.push({ path: paths[i][0], bytes: (await response.clone().arrayBuffer()).byteLength });
+      }
+    }
+    blocking.push(group);
+    return results.map(({ response }) => response);
+  };
+  const [html] = await step([['/', 'navigate', 'document']]);
+  const assets = [...(await html.text()).matchAll(/(?:src|href)="(\/[^"]*)"/g)].map(match => match[1]);
+  await step(assets.map(path => [path, 'no-cors', path.endsWith('.js') ? 'script' : path.endsWith('.css') ? 'style' : 'image']));
+  const [manifestResponse] = await step([['/curriculum/manifest.json']]);
+  const manifest = await manifestResponse.json();
+  await step([[`/curriculum/${manifest.branches[OPENED_BRANCH].file}`]]);
+
+  await Promise.all(backgrounds);
+  // Every network request not accounted for by the critical path
+  const background = requests.slice(start);
+  for (const { path } of blocking.flat()) {
+    background.splice(background.findIndex(request => request.path === path), 1);
+  }
+  return { blocking, background };
+};
+
+const report = (label, { blocking, background }) => {
+  const critical = blocking.flat();
+  const ms = blocking.reduce((sum, group) => (
+    group.length === 0 ? sum : sum + RTT + Math.max(...group.map(({ bytes }) => transferMs(bytes)))
+  ), 0);
+  const kb = (list) => (list.reduce((sum, { bytes }) => sum + bytes, 0) / 1024).toFixed(1);
+  console.log(
+    `${label.padEnd(8)} blocking ${String(critical.length).padStart(2)} req ${kb(critical).padStart(7)} KB  `
+    + `load ~${ms.toFixed(0).padStart(5)} ms   background ${String(background.length).padStart(2)} req ${kb(background).padStart(7)} KB`
+    + (background.length > 0 ? `  (${background.map(({ path }) => (path === '/' ? 'index.html' : path.split('/').pop())).join(', ')})` : '')
+  );
+};
+
+const contents = await loadAllBranches();
+publishShell();
+publishCurriculum(contents);
+console.log(`network: ${RTT} ms RTT, ${KBPS} kbps; bundle ${BUNDLE_KB} KB`);
+
+requests = [];
+report('no-sw', await visit(async (path) => ({ response: await network(path), background: null })));
+
+requests = [];
+const pageFetch = await startWorker();
+const install = requests;
+requests = [];
+report('first', await visit(async (path) => ({ response: await network(path), background: null })));
+console.log(`         (install precached ${install.length} files, ${(install.reduce((s, r) => s + r.bytes, 0) / 1024).toFixed(1)} KB)`);
+
+requests = [];
+report('repeat', await visit(pageFetch));
+
+// Change one topic in one branch and redeploy the curriculum
+const changed = structuredClone(contents);
+const [firstSubject] = Object.values(changed.ece.subjects);
+firstSubject.topics[0].content += ' (revised)';
+publishCurriculum(changed);
+
+requests = [];
+report('update', await visit(pageFetch));
+requests = [];
+report('after', await visit(pageFetch));
@@ -0,0 +1,52 @@
+// Index build time and per-keystroke query latency for lib/searchIndex.js.
+//
+// Every prefix of each query is run, as if typed one character at a time.
+//
+// Usage: node bench/search-index.mjs [--topics 10000]
+
+import { performance } from 'node:perf_hooks';
+import { createSearchIndex, indexBranch } from '../lib/searchIndex.js';
+import { generateCorpus } from './corpus.mjs';
+
+const i = process.argv.indexOf('--topics');
+const topics = i === -1 ? 10000 : Number(process.argv[i + 1]);
+
+const QUERIES = [
+  'fourier transform',
+  'memory paging',
+  'binary tree recursion',
+  'voltage',
+  'normalization database 42'
+];
+
+const corpus = generateCorpus({ topics });
+
+const buildStart = performance.now();
+const index = createSearchIndex();
+for (const [key, content] of Object.entries(corpus)) {
+  indexBranch(index, key, content);
+}
+const buildMs = performance.now() - buildStart;
+
+// Warm up
+for (const query of QUERIES) index.search(query, 10);
+
+const samples = [];
+for (let round = 0; round < 20; round++) {
+  for (const query of QUERIES) {
+    for (let len = 1; len <= query.length; len++) {
+      const start = performance.now();
+      index.search(query.slice(0, len), 10);
+      samples.push(performance.now() - start);
+    }
+  }
+}
+samples.sort((a, b) => a - b);
+const pct = (p) => samples[Math.min(samples.length - 1, Math.floor(p * samples.length))];
+
+console.log(`topics indexed: ${index.size}`);
+console.log(`build:          ${buildMs.toFixed(1)} ms`);
+console.log(`keystrokes:     ${samples.length}`);
+console.log(`query p50:      ${pct(0.5).toFixed(3)} ms`);
+console.log(`query p95:      ${pct(0.95).toFixed(3)} ms`);
+console.log(`query p99:      ${pct(0.99).toFixed(3)} ms`);
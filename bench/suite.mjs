@@ -0,0 +1,267 @@
+// Regression benchmark suite for the assistant's main interactions.
+//
+// Replays, at several data scales, the work UltimateAIAssistant does for
+// each interaction, through the same modules the component calls:
+//
+//   mount           hydrate settings, favorites and the response cache from
+//                   storage, read the newest chat page, load the first branch
+//   branch-switch   load another branch's content (as hashed JSON)
+//   topic-expand    parse a subject's formulas, as TopicCard does the first
+//                   time it shows them
+//   chat-send       retrieve topics, generate the reply, append to the window
+//   export          assemble the configuration file from the stored history
+//   import          parse that file back, batch by batch
+//   save            autosave flush: settings, favorites and the new messages
+//
+// Scales grow the curriculum (topics), the favorites set and the stored
+// chat history together. Each scenario gets a few warm-up runs, then
+// several samples; a sample repeats the scenario until it has taken at
+// least --sample-ms, so a scenario that takes microseconds is timed over
+// many calls rather than at the timer's resolution. The fastest sample's
+// time per call is reported, since noise (GC, other processes) only ever
+// adds time. It is compared with bench/baselines.json: a run slower than
+// baseline * (1 + tolerance) + slack fails, and the process exits with 1.
+// Rendering and layout need a browser and are not measured; the Profiler
+// numbers in Settings > Diagnostics cover those.
+//
+// Usage:
+//   node bench/suite.mjs [--scales small,medium,large] [--runs 10] [--warmup 5]
+//                        [--sample-ms 10] [--tolerance 0.25] [--slack-ms 0.5]
+//                        [--update]
+//
+// --update records the current times as the new baselines; record them with
+// the same settings the suite is checked with.
+
+import { readFile, writeFile } from 'node:fs/promises';
+import { performance } from 'node:perf_hooks';
+import { fileURLToPath } from 'node:url';
+import { generateCorpus } from './corpus.mjs';
+import { createContentDomain, activateDomain } from '../curriculum/domain.js';
+import { createChatLog } from '../lib/chatLog.js';
+import { EMPTY_WINDOW, appendMessages, contextWindow } from '../lib/chatWindow.js';
+import { createComputeOps } from '../lib/computeOps.js';
+import { createConfigParser, exportChunks } from '../lib/configStream.js';
+import { parseFormula } from '../lib/expression.js';
+import { parseFavorites } from '../lib/favorites.js';
+import { createAutosave } from '../lib/autosave.js';
+import { createResponseCache } from '../lib/responseCache.js';
+import { getEngine } from '../lib/responseEngine.js';
+import { createStorage, windowStorageBackend } from '../lib/storage.js';
+
+const BASELINES = fileURLToPath(new URL('./baselines.json', import.meta.url));
+
+const SCALES = {
+  small: { topics: 120, favorites: 20, messages: 200 },
+  medium: { topics: 1200, favorites: 1000, messages: 10000 },
+  large: { topics: 12000, favorites: 10000, messages: 100000 }
+};
+
+const QUERIES = ['explain fourier transform', 'formula for voltage gradient', 'difference between stack and queue'];
+
+const option = (name, fallback) => {
+  const i = process.argv.indexOf(`--${name}`);
+  return i === -1 ? fallback : process.argv[i + 1];
+};
+
+// Stands in for window.storage: values kept as strings
+const createMemoryStorage = () => {
+  const values = new Map();
+  return {
+    get: async (key) => (values.has(key) ? { value: values.get(key) } : null),
+    set: async (key, value) => {
+      values.set(key, value);
+    },
+    delete: async (key) => {
+      values.delete(key);
+    }
+  };
+};
+
+const message = (i) => (i % 2 === 0
+  ? { type: 'user', text: `Question ${i} about ${QUERIES[i % QUERIES.length]}` }
+  : { type: 'ai', text: `Answer ${i}: `.padEnd(400, 'the key points are listed below ') });
+
+// Storage and content as a returning user at this scale would have them
+const setup = async ({ topics, favorites, messages }) => {
+  const backing = createMemoryStorage();
+  const backend = windowStorageBackend({ getStorage: () => backing });
+  const storage = createStorage({ backend, shouldCache: key => !key.startsWith('chat_log:') });
+  const corpus = generateCorpus({ topics });
+  const branchKeys = Object.keys(corpus);
+  const json = Object.fromEntries(branchKeys.map(key => [key, JSON.stringify(corpus[key])]));
+
+  const topicKeys = [];
+  for (const content of Object.values(corpus)) {
+    for (const [subject, { topics: list }] of Object.entries(content.subjects)) {
+      list.forEach((_, idx) => topicKeys.push(`${subject}-${idx}`));
+    }
+  }
+  const favoriteKeys = Array.from({ length: favorites }, (_, i) => topicKeys[i % topicKeys.length] + (i >= topicKeys.length ? `-${i}` : ''));
+
+  const settings = { theme: 'dark', defaultMode: 'btech', defaultBranch: branchKeys[0], autoSave: true };
+  storage.set('user_settings', settings);
+  storage.set('favorites', favoriteKeys);
+  const log = createChatLog(storage);
+  const history = Array.from({ length: messages }, (_, i) => message(i));
+  for (let i = 0; i < history.length; i += 1000) {
+    await log.sync(history.slice(i, i + 1000), i);
+  }
+
+  const ops = createComputeOps();
+  for (const key of branchKeys) await ops.index({ branch: key, content: corpus[key] });
+
+  const createDomain = () => createContentDomain({
+    id: 'bench',
+    manifest: Object.fromEntries(branchKeys.map(key => [key, { name: key }])),
+    // Same cost as the hashed-JSON path: the content arrives as text
+    loaders: Object.fromEntries(branchKeys.map(key => [key, async () => ({ default: JSON.parse(json[key]) })])),
+    dataPath: '/bench'
+  });
+
+  await storage.flush();
+
+  return { backend, storage, corpus, branchKeys, settings, favoriteKeys, ops, createDomain, total: messages };
+};
+
+const scenarios = {
+  async mount(ctx) {
+    // A fresh store, as on page load: nothing cached yet
+    const storage = createStorage({ backend: ctx.backend });
+    const readSettings = storage.get('user_settings');
+    const readFavorites = storage.get('favorites').then(parseFavorites);
+    const cache = createResponseCache({ storage, version: 'bench' });
+    const [settings] = await Promise.all([readSettings, readFavorites, cache.load()]);
+    const domain = ctx.createDomain();
+    await domain.load(settings.defaultBranch);
+    await createChatLog(storage).loadRecent();
+  },
+
+  async 'branch-switch'(ctx) {
+    const domain = ctx.createDomain();
+    activateDomain('bench');
+    await domain.load(ctx.branchKeys[1 % ctx.branchKeys.length]);
+  },
+
+  'topic-expand'(ctx) {
+    const [subject] = Object.values(ctx.corpus[ctx.branchKeys[0]].subjects);
+    for (const topic of subject.topics) {
+      topic.formulas.forEach(parseFormula);
+    }
+  },
+
+  async 'chat-send'(ctx) {
+    const query = QUERIES[ctx.sent++ % QUERIES.length];
+    const { intent, topics } = await ctx.ops.retrieve({ query });
+    const history = contextWindow(ctx.window.messages, 10);
+    let text = '';
+    for await (const chunk of getEngine('advanced').stream(query, { intent, topics, history, branchName: 'bench' })) {
+      text += chunk;
+    }
+    ctx.window = appendMessages(ctx.window, [{ type: 'user', text: query }, { type: 'ai', text }]);
+  },
+
+  async export(ctx) {
+    const log = createChatLog(ctx.storage);
+    const parts = [];
+    for await (const chunk of exportChunks({ settings: ctx.settings, favorites: ctx.favoriteKeys, pages: log.pages() })) {
+      parts.push(chunk);
+    }
+    ctx.exported = parts.join('');
+  },
+
+  import(ctx) {
+    if (!ctx.exported) throw new Error('import runs after export');
+    let imported = 0;
+    const parser = createConfigParser({
+      onSettings: () => {},
+      onFavorites: () => {},
+      onMessages: (batch) => {
+        imported += batch.length;
+      }
+    });
+    const CHUNK = 64 * 1024;
+    for (let i = 0; i < ctx.exported.length; i += CHUNK) {
+      parser.write(ctx.exported.slice(i, i + CHUNK));
+    }
+    parser.end();
+    if (imported === 0 && ctx.total > 0) throw new Error('import found no messages');
+  },
+
+  // Last, since every run appends to the history that export reads
+  async save(ctx) {
+    const { storage } = ctx;
+    const autosave = createAutosave();
+    const log = createChatLog(storage);
+    const added = [message(ctx.total), message(ctx.total + 1)];
+    autosave.schedule('user_settings', () => storage.set('user_settings', ctx.settings));
+    autosave.schedule('favorites', () => storage.set('favorites', ctx.favoriteKeys));
+    autosave.schedule('chat_log', () => log.sync(added, ctx.total));
+    await autosave.flush();
+    ctx.total += added.length;
+  }
+};
+
+// Fastest time per call over `runs` samples
+const measure = async (run, ctx, { runs, warmup, sampleMs }) => {
+  // Warm-up runs let the JIT settle, and size the samples
+  let single = Infinity;
+  for (let i = 0; i < Math.max(1, warmup); i++) {
+    const start = performance.now();
+    await run(ctx);
+    single = Math.min(single, performance.now() - start);
+  }
+  const repeat = Math.max(1, Math.ceil(sampleMs / Math.max(single, 0.001)));
+  let best = Infinity;
+  for (let i = 0; i < runs; i++) {
+    const start = performance.now();
+    for (let r = 0; r < repeat; r++) await run(ctx);
+    best = Math.min(best, (performance.now() - start) / repeat);
+  }
+  return best;
+};
+
+const scales = option('scales', Object.keys(SCALES).join(',')).split(',');
+const runs = Number(option('runs', 10));
+const warmup = Number(option('warmup', 5));
+const sampleMs = Number(option('sample-ms', 10));
+const tolerance = Number(option('tolerance', 0.25));
+const slackMs = Number(option('slack-ms', 0.5));
+const update = process.argv.includes('--update');
+
+let baselines = {};
+try {
+  baselines = JSON.parse(await readFile(BASELINES, 'utf8'));
+} catch (error) {
+  if (!update) console.log('No bench/baselines.json yet; run with --update to record one.');
+}
+
+const results = {};
+const regressions = [];
+for (const scale of scales) {
+  if (!SCALES[scale]) throw new Error(`Unknown scale "${scale}"`);
+  const ctx = { ...(await setup(SCALES[scale])), window: EMPTY_WINDOW, sent: 0 };
+  const { topics, favorites, messages } = SCALES[scale];
+  console.log(`\n${scale}: ${topics} topics, ${favorites} favorites, ${messages} messages`);
+  results[scale] = {};
+  for (const [name, run] of Object.entries(scenarios)) {
+    const ms = await measure(run, ctx, { runs, warmup, sampleMs });
+    results[scale][name] = Number(ms.toFixed(3));
+    const baseline = baselines[scale]?.[name];
+    let verdict = '';
+    if (baseline !== undefined) {
+      const limit = baseline * (1 + tolerance) + slackMs;
+      const change = baseline > 0 ? `${ms >= baseline ? '+' : ''}${(((ms - baseline) / baseline) * 100).toFixed(0)}%` : '';
+      verdict = ms > limit ? `REGRESSION (baseline ${baseline.toFixed(2)} ms, ${change})` : `ok (${change})`;
+      if (ms > limit) regressions.push(`${scale}/${name}`);
+    }
+    console.log(`  ${name.padEnd(14)} ${ms.toFixed(2).padStart(9)} ms   ${verdict}`);
+  }
+}
+
+if (update) {
+  await writeFile(BASELINES, `${JSON.stringify({ ...baselines, ...results }, null, 2)}\n`);
+  console.log(`\nBaselines written to ${BASELINES}`);
+} else if (regressions.length > 0) {
+  console.log(`\n${regressions.length} regression(s): ${regressions.join(', ')}`);
+  process.exitCode = 1;
+}
@@ -0,0 +1,74 @@
+import React, { memo } from 'react';
+import { Brain } from 'lucide-react';
+import VirtualMessageList from './VirtualMessageList';
+
+const SUGGESTIONS = [
+  ['Explain time complexity', 'Explain time complexity'],
+  ['What is normalization?', 'What is normalization?'],
+  ['Solve circuit problem', 'Solve circuit problem'],
+  ['Difference between TCP and UDP', 'TCP vs UDP']
+];
+
+const renderMessage = (msg) => (
+  <div className={`flex ${msg.type === 'user' ? 'justify-end' : 'justify-start'}`}>
+    <div className={`max-w-3xl p-3 rounded-lg ${
+      msg.type === 'user' ? 'bg-cyan-600' : 'bg-[var(--app-surface)]'
+    }`}>
+      <p className="text-sm whitespace-pre-line">{msg.text}</p>
+    </div>
+  </div>
+);
+
+// AI Chat mode: the message window (see lib/chatWindow.js), starter
+// questions while it is empty, and the input box. `base` is the global
+// index of the first message; `onReachTop` loads older ones.
+function AIChatMode({ messages, base, inputValue, onInputChange, onSend, onReachTop }) {
+  return (
+    <div className="h-[600px] flex flex-col">
+      {base > 0 && (
+        <p className="text-center text-xs text-[var(--app-faint)] mb-2">Scroll up for earlier messages</p>
+      )}
+      {messages.length === 0 ? (
+        <div className="flex-1 overflow-y-auto p-4 bg-[var(--app-bg)] rounded-lg mb-4">
+          <div className="text-center py-20">
+            <Brain className="w-16 h-16 text-[var(--app-faint)] mx-auto mb-4" />
+            <p className="text-[var(--app-muted)]">Ask me anything about your studies!</p>
+            <div className="mt-4 grid grid-cols-2 gap-2 max-w-md mx-auto">
+              {SUGGESTIONS.map(([query, label]) => (
+                <button key={query} onClick={() => onSend(query)} className="p-2 bg-[var(--app-surface)] rounded text-sm hover:bg-[var(--app-raised)]">
+                  {label}
+                </button>
+              ))}
+            </div>
+          </div>
+        </div>
+      ) : (
+        <VirtualMessageList
+          messages={messages}
+          base={base}
+          onReachTop={onReachTop}
+          className="flex-1 bg-[var(--app-bg)] rounded-lg mb-4"
+          renderMessage={renderMessage}
+        />
+      )}
+      <div className="flex gap-2">
+        <input
+          type="text"
+          value={inputValue}
+          onChange={(e) => onInputChange(e.target.value)}
+          onKeyPress={(e) => e.key === 'Enter' && inputValue && onSend(inputValue)}
+          placeholder="Ask anything about your studies..."
+          className="flex-1 bg-[var(--app-surface)] px-4 py-3 rounded-lg border border-[var(--app-border)] focus:outline-none focus:border-cyan-500"
+        />
+        <button
+          onClick={() => inputValue && onSend(inputValue)}
+          className="px-6 py-3 bg-cyan-600 hover:bg-cyan-700 rounded-lg transition font-semibold"
+        >
+          Send
+        </button>
+      </div>
+    </div>
+  );
+}
+
+export default memo(AIChatMode);
@@ -0,0 +1,121 @@
+import React, { memo } from 'react';
+import { Code, Cpu, Zap, Droplet, Wrench, Radio, Search } from 'lucide-react';
+import { branchManifest } from '../curriculum';
+import BranchGrid from './BranchGrid';
+import SubjectGrid from './SubjectGrid';
+import TopicCard from './TopicCard';
+
+// Icons referenced by name from the curriculum manifest
+const branchIcons = { Code, Radio, Zap, Wrench, Cpu, Droplet };
+
+// B.Tech Studies mode: topic search, branch and subject grids and the
+// selected subject's topic cards. `branchContent` is the selected branch's
+// loaded content, or null while it loads; search runs in the app's worker.
+function BTechMode({
+  searchQuery, searchResults, onSearchChange, onSearchFocus, onOpenResult,
+  selectedBranch, onSelectBranch, branchContent, selectedSubject, onSelectSubject,
+  expandedTopics, favorites, showFormulas, showKeyPoints,
+  onToggleTopic, onToggleFavorite, onOpenFormula, onOpenNotes, onOpenRelated
+}) {
+  const currentBranch = branchManifest[selectedBranch];
+  const BranchIcon = branchIcons[currentBranch?.icon];
+  const subjects = branchContent?.subjects;
+
+  return (
+    <div>
+      <div className="mb-6">
+        <div className="flex items-center gap-2 bg-[var(--app-surface)] px-4 py-3 rounded-lg border border-[var(--app-border)] focus-within:border-cyan-500">
+          <Search className="w-4 h-4 text-[var(--app-muted)]" />
+          <input
+            type="text"
+            value={searchQuery}
+            onFocus={onSearchFocus}
+            onChange={(e) => onSearchChange(e.target.value)}
+            placeholder="Search topics, formulas, examples..."
+            className="flex-1 bg-transparent focus:outline-none"
+          />
+        </div>
+        {searchQuery.trim() && (
+          <div className="mt-2 bg-[var(--app-surface)] rounded-lg border border-[var(--app-border)] divide-y divide-[var(--app-border)]">
+            {searchResults.length === 0 ? (
+              <p className="p-3 text-sm text-[var(--app-muted)]">No matching topics</p>
+            ) : (
+              searchResults.map((result) => (
+                <button
+                  key={`${result.branch}-${result.topicKey}`}
+                  onClick={() => onOpenResult(result)}
+                  className="w-full p-3 text-left hover:bg-[var(--app-raised)] transition"
+                >
+                  <span className="block font-semibold text-cyan-300">{result.title}</span>
+                  <span className="block text-xs text-[var(--app-muted)]">
+                    {branchManifest[result.branch]?.name} · {result.subjectName}
+                  </span>
+                </button>
+              ))
+            )}
+          </div>
+        )}
+      </div>
+
+      <div className="mb-6">
+        <h2 className="text-lg font-semibold mb-3">Select Branch:</h2>
+        <BranchGrid
+          branches={branchManifest}
+          icons={branchIcons}
+          selectedBranch={selectedBranch}
+          onSelect={onSelectBranch}
+        />
+      </div>
+
+      {currentBranch && (
+        <>
+          <div className="mb-6">
+            <div className="flex items-center gap-3 mb-3">
+              <BranchIcon className="w-6 h-6" />
+              <h2 className="text-xl font-bold">{currentBranch.name}</h2>
+            </div>
+
+            {!subjects && (
+              <p className="text-sm text-[var(--app-muted)]">Loading subjects...</p>
+            )}
+
+            {subjects && (
+              <SubjectGrid
+                subjects={subjects}
+                selectedSubject={selectedSubject}
+                onSelect={onSelectSubject}
+              />
+            )}
+          </div>
+
+          {subjects?.[selectedSubject] && (
+            <div className="space-y-3">
+              {subjects[selectedSubject].topics.map((topic, idx) => {
+                const topicKey = `${selectedSubject}-${idx}`;
+                return (
+                  <TopicCard
+                    key={topicKey}
+                    topicKey={topicKey}
+                    topic={topic}
+                    related={branchContent.related?.[topicKey]}
+                    isExpanded={!!expandedTopics[topicKey]}
+                    isFavorite={favorites.has(topicKey)}
+                    showFormulas={showFormulas}
+                    showKeyPoints={showKeyPoints}
+                    onToggle={onToggleTopic}
+                    onToggleFavorite={onToggleFavorite}
+                    onOpenFormula={onOpenFormula}
+                    onOpenNotes={onOpenNotes}
+                    onOpenRelated={onOpenRelated}
+                  />
+                );
+              })}
+            </div>
+          )}
+        </>
+      )}
+    </div>
+  );
+}
+
+export default memo(BTechMode);
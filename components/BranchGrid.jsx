@@ -0,0 +1,29 @@
+import React, { memo } from 'react';
+import { accent } from '../lib/theme';
+
+// Branch picker. Memoized: only re-renders when the selection changes.
+function BranchGrid({ branches, icons, selectedBranch, onSelect }) {
+  return (
+    <div className="grid grid-cols-2 md:grid-cols-3 lg:grid-cols-6 gap-3">
+      {Object.entries(branches).map(([key, branch]) => {
+        const Icon = icons[branch.icon];
+        return (
+          <button
+            key={key}
+            onClick={() => onSelect(key)}
+            className={`p-4 rounded-lg border-2 transition flex flex-col items-center gap-2 ${
+              selectedBranch === key
+                ? accent(branch.color).selected
+                : 'border-[var(--app-border)] bg-[var(--app-surface)] hover:border-[var(--app-border-strong)]'
+            }`}
+          >
+            <Icon className="w-8 h-8" />
+            <span className="text-xs font-semibold text-center">{branch.name}</span>
+          </button>
+        );
+      })}
+    </div>
+  );
+}
+
+export default memo(BranchGrid);
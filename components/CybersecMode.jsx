@@ -0,0 +1,17 @@
+import React, { memo } from 'react';
+import { Network, Globe, Lock, Terminal, Bug } from 'lucide-react';
+import DomainView from './DomainView';
+
+// Icons referenced by name from the track manifest
+const trackIcons = { Network, Globe, Lock, Terminal, Bug };
+
+// Cybersecurity mode: DomainView over the cybersec content domain, which
+// is null until curriculum/cybersec has been imported.
+function CybersecMode({ domain, ...props }) {
+  if (!domain) {
+    return <p className="text-sm text-[var(--app-muted)]">Loading tracks...</p>;
+  }
+  return <DomainView domain={domain} icons={trackIcons} title="Select Track:" {...props} />;
+}
+
+export default memo(CybersecMode);
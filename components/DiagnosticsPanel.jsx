@@ -0,0 +1,119 @@
+import React, { useEffect, useRef, useState } from 'react';
+import { Download, RefreshCw } from 'lucide-react';
+
+const REFRESH_MS = 1000;
+
+const ms = (value) => `${value.toFixed(1)} ms`;
+const kb = (bytes) => `${(bytes / 1024).toFixed(1)} KB`;
+const avg = ({ count, totalMs }) => (count > 0 ? totalMs / count : 0);
+
+// Live view of lib/diagnostics.js and the storage stats (lib/storage.js),
+// refreshed once a second while mounted. `estimateMemory()` returns
+// { [label]: bytes } for the app's state.
+export default function DiagnosticsPanel({ diagnostics, storage, estimateMemory, onExport }) {
+  const [data, setData] = useState(() => diagnostics.snapshot());
+  const [storageStats, setStorageStats] = useState(() => storage.stats());
+  const [memory, setMemory] = useState(estimateMemory);
+  // Latest estimator, so a new function each parent render does not restart the timer
+  const estimate = useRef(estimateMemory);
+  estimate.current = estimateMemory;
+
+  useEffect(() => {
+    const timer = setInterval(() => {
+      setData(diagnostics.snapshot());
+      setStorageStats(storage.stats());
+      setMemory(estimate.current());
+    }, REFRESH_MS);
+    return () => clearInterval(timer);
+  }, [diagnostics, storage]);
+
+  const reset = () => {
+    diagnostics.reset();
+    storage.resetStats();
+    setData(diagnostics.snapshot());
+    setStorageStats(storage.stats());
+  };
+
+  const heap = typeof performance !== 'undefined' ? performance.memory : undefined;
+
+  return (
+    <div className="space-y-4 text-sm">
+      <div>
+        <h4 className="font-semibold mb-2">Renders</h4>
+        {Object.keys(data.renders).length === 0 ? (
+          <p className="text-[var(--app-muted)]">No renders recorded yet (render timings need a development or profiling build)</p>
+        ) : (
+          <table className="w-full text-left">
+            <thead className="text-[var(--app-muted)]">
+              <tr><th>View</th><th>Renders</th><th>Mounts</th><th>Last</th><th>Avg</th><th>Max</th></tr>
+            </thead>
+            <tbody className="font-mono">
+              {Object.entries(data.renders).map(([id, stat]) => (
+                <tr key={id}>
+                  <td>{id}</td><td>{stat.count}</td><td>{stat.mounts}</td>
+                  <td>{ms(stat.lastMs)}</td><td>{ms(avg(stat))}</td><td>{ms(stat.maxMs)}</td>
+                </tr>
+              ))}
+            </tbody>
+          </table>
+        )}
+      </div>
+
+      <div>
+        <h4 className="font-semibold mb-2">Storage ({storage.backend})</h4>
+        {Object.keys(storageStats).length === 0 ? (
+          <p className="text-[var(--app-muted)]">No storage calls recorded yet</p>
+        ) : (
+          <table className="w-full text-left">
+            <thead className="text-[var(--app-muted)]">
+              <tr><th>Key</th><th>Cache hits</th><th>Reads</th><th>Read avg</th><th>Writes</th><th>Write avg</th><th>Read</th><th>Written</th></tr>
+            </thead>
+            <tbody className="font-mono">
+              {Object.entries(storageStats).map(([key, stat]) => (
+                <tr key={key}>
+                  <td>{key}</td><td>{stat.hits}</td>
+                  <td>{stat.reads.count}</td><td>{ms(avg(stat.reads))}</td>
+                  <td>{stat.writes.count}</td><td>{ms(avg(stat.writes))}</td>
+                  <td>{kb(stat.bytesRead)}</td><td>{kb(stat.bytesWritten)}</td>
+                </tr>
+              ))}
+            </tbody>
+          </table>
+        )}
+      </div>
+
+      <div className="grid md:grid-cols-2 gap-4">
+        <div>
+          <h4 className="font-semibold mb-2">Chat replies</h4>
+          <p>Replies: {data.chat.replies.count} (+{data.chat.cached} from cache)</p>
+          <p>First text: avg {ms(avg(data.chat.firstChunk))}, max {ms(data.chat.firstChunk.maxMs)}</p>
+          <p>Complete: avg {ms(avg(data.chat.replies))}, max {ms(data.chat.replies.maxMs)}</p>
+        </div>
+        <div>
+          <h4 className="font-semibold mb-2">Memory (estimated)</h4>
+          {Object.entries(memory).map(([label, bytes]) => (
+            <p key={label}>{label}: {kb(bytes)}</p>
+          ))}
+          {heap && <p>JS heap: {kb(heap.usedJSHeapSize)} of {kb(heap.totalJSHeapSize)}</p>}
+        </div>
+      </div>
+
+      <div className="flex gap-3">
+        <button
+          onClick={onExport}
+          className="flex items-center gap-2 px-4 py-2 bg-[var(--app-raised)] hover:bg-[var(--app-raised-hover)] rounded-lg transition"
+        >
+          <Download className="w-4 h-4" />
+          Export Trace
+        </button>
+        <button
+          onClick={reset}
+          className="flex items-center gap-2 px-4 py-2 bg-[var(--app-raised)] hover:bg-[var(--app-raised-hover)] rounded-lg transition"
+        >
+          <RefreshCw className="w-4 h-4" />
+          Reset
+        </button>
+      </div>
+    </div>
+  );
+}
@@ -0,0 +1,116 @@
+import React, { memo, useCallback, useEffect, useState } from 'react';
+import BranchGrid from './BranchGrid';
+import SubjectGrid from './SubjectGrid';
+import TopicCard from './TopicCard';
+
+// Browser for a content domain (curriculum/domain.js) other than B.Tech:
+// section grid, subject grid and topic cards, with the section's content
+// loaded when it is first selected. Memoized; favorites, notes and the
+// calculator are shared with the rest of the app through the callbacks.
+function DomainView({ domain, icons, title, favorites, showFormulas, showKeyPoints, onToggleFavorite, onOpenFormula, onOpenNotes }) {
+  const [selectedSection, setSelectedSection] = useState(() => Object.keys(domain.manifest)[0]);
+  const [selectedSubject, setSelectedSubject] = useState(null);
+  const [expandedTopics, setExpandedTopics] = useState({});
+  const [content, setContent] = useState(() => domain.getLoaded(selectedSection));
+
+  useEffect(() => {
+    let cancelled = false;
+    setContent(domain.getLoaded(selectedSection));
+    domain.load(selectedSection)
+      .then((loaded) => {
+        if (!cancelled) {
+          setContent(loaded);
+        }
+      })
+      .catch((error) => {
+        console.error(`Error loading ${domain.id} content:`, error);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [domain, selectedSection]);
+
+  const handleSelectSection = useCallback((key) => {
+    setSelectedSection(key);
+    setSelectedSubject(null);
+  }, []);
+
+  const handleToggleTopic = useCallback((topicKey) => {
+    setExpandedTopics(prev => ({ ...prev, [topicKey]: !prev[topicKey] }));
+  }, []);
+
+  // Related topics can be in another section of the domain
+  const handleOpenRelated = useCallback(({ branch, subject, topicKey }) => {
+    setSelectedSection(branch);
+    setSelectedSubject(subject);
+    setExpandedTopics(prev => ({ ...prev, [topicKey]: true }));
+  }, []);
+
+  const currentSection = domain.manifest[selectedSection];
+  const SectionIcon = icons[currentSection?.icon];
+  const subjects = content?.subjects;
+
+  return (
+    <div>
+      <div className="mb-6">
+        <h2 className="text-lg font-semibold mb-3">{title}</h2>
+        <BranchGrid
+          branches={domain.manifest}
+          icons={icons}
+          selectedBranch={selectedSection}
+          onSelect={handleSelectSection}
+        />
+      </div>
+
+      {currentSection && (
+        <>
+          <div className="mb-6">
+            <div className="flex items-center gap-3 mb-3">
+              <SectionIcon className="w-6 h-6" />
+              <h2 className="text-xl font-bold">{currentSection.name}</h2>
+            </div>
+
+            {!subjects && (
+              <p className="text-sm text-[var(--app-muted)]">Loading subjects...</p>
+            )}
+
+            {subjects && (
+              <SubjectGrid
+                subjects={subjects}
+                selectedSubject={selectedSubject}
+                onSelect={setSelectedSubject}
+              />
+            )}
+          </div>
+
+          {subjects?.[selectedSubject] && (
+            <div className="space-y-3">
+              {subjects[selectedSubject].topics.map((topic, idx) => {
+                const topicKey = `${selectedSubject}-${idx}`;
+                return (
+                  <TopicCard
+                    key={topicKey}
+                    topicKey={topicKey}
+                    topic={topic}
+                    related={content.related?.[topicKey]}
+                    isExpanded={!!expandedTopics[topicKey]}
+                    isFavorite={favorites.has(topicKey)}
+                    showFormulas={showFormulas}
+                    showKeyPoints={showKeyPoints}
+                    onToggle={handleToggleTopic}
+                    onToggleFavorite={onToggleFavorite}
+                    onOpenFormula={onOpenFormula}
+                    onOpenNotes={onOpenNotes}
+                    onOpenRelated={handleOpenRelated}
+                  />
+                );
+              })}
+            </div>
+          )}
+        </>
+      )}
+    </div>
+  );
+}
+
+export default memo(DomainView);
@@ -0,0 +1,142 @@
+import React, { memo, useMemo, useState } from 'react';
+import { compileExpression, parseFormula, sweep } from '../lib/expression';
+
+const MAX_SWEEP_STEPS = 1000;
+
+const formatNumber = (value) => (Number.isFinite(value) ? String(Number(value.toPrecision(6))) : '—');
+
+// Expression is compiled once per edit; inputs and sweeps only re-evaluate
+const compile = (source) => {
+  if (!source.trim()) return { compiled: null, target: null, error: null };
+  try {
+    if (!source.includes('=')) {
+      return { compiled: compileExpression(source), target: null, error: null };
+    }
+    const formula = parseFormula(source);
+    if (formula) return { compiled: formula.compiled, target: formula.target, error: null };
+    // Surface the parser's message for the right-hand side if it has one
+    compileExpression(source.slice(source.lastIndexOf('=') + 1));
+    return { compiled: null, target: null, error: 'Use the form "name = expression"' };
+  } catch (error) {
+    return { compiled: null, target: null, error: error.message };
+  }
+};
+
+// Calculator mode. `formula` (a topic formula's text, if one was opened from
+// a topic card) pre-fills the expression and binds its variables to inputs.
+function FormulaCalculator({ formula }) {
+  const [source, setSource] = useState(() => formula ?? '');
+  const [values, setValues] = useState({});
+  const [sweepVariable, setSweepVariable] = useState(null);
+  const [range, setRange] = useState({ from: '0', to: '10', steps: '11' });
+
+  const { compiled, target, error } = useMemo(() => compile(source), [source]);
+  const variables = compiled?.variables ?? [];
+
+  const scope = useMemo(() => {
+    const numbers = {};
+    for (const name of variables) {
+      numbers[name] = values[name] === undefined || values[name] === '' ? NaN : Number(values[name]);
+    }
+    return numbers;
+  }, [compiled, values]);
+
+  const result = compiled ? compiled.evaluate(scope) : NaN;
+
+  const swept = sweepVariable && variables.includes(sweepVariable) ? sweepVariable : null;
+  const sweepResult = useMemo(() => {
+    if (!compiled || !swept) return null;
+    const steps = Math.min(MAX_SWEEP_STEPS, Math.max(2, Math.floor(Number(range.steps)) || 2));
+    return sweep(compiled, scope, swept, { from: Number(range.from), to: Number(range.to), steps });
+  }, [compiled, scope, swept, range]);
+
+  return (
+    <div className="space-y-6">
+      <div>
+        <label className="block text-sm font-semibold mb-2">Expression</label>
+        <input
+          type="text"
+          value={source}
+          onChange={(e) => setSource(e.target.value)}
+          placeholder="e.g. η = 1 - TL/TH"
+          className="w-full px-4 py-3 bg-[var(--app-surface)] rounded-lg border border-[var(--app-border)] font-mono focus:border-cyan-500 focus:outline-none"
+        />
+        {error && <p className="mt-2 text-sm text-red-400">{error}</p>}
+      </div>
+
+      {variables.length > 0 && (
+        <div className="grid grid-cols-2 md:grid-cols-3 gap-3">
+          {variables.map((name) => (
+            <label key={name} className="flex items-center gap-2 p-3 bg-[var(--app-surface)] rounded">
+              <span className="font-mono text-sm text-cyan-300 min-w-[3rem]">{name}</span>
+              <input
+                type="number"
+                value={values[name] ?? ''}
+                onChange={(e) => setValues(prev => ({ ...prev, [name]: e.target.value }))}
+                className="flex-1 min-w-0 px-2 py-1 bg-[var(--app-bg)] rounded border border-[var(--app-border)] focus:border-cyan-500 focus:outline-none"
+              />
+            </label>
+          ))}
+        </div>
+      )}
+
+      {compiled && (
+        <div className="p-4 bg-[var(--app-bg)] rounded-lg border border-green-500/50">
+          <span className="font-mono text-lg text-green-400">
+            {target ?? 'Result'} = {formatNumber(result)}
+          </span>
+        </div>
+      )}
+
+      {variables.length > 0 && (
+        <div className="p-4 bg-[var(--app-surface)] rounded-lg space-y-3">
+          <h3 className="font-semibold">Sweep</h3>
+          <div className="flex flex-wrap items-center gap-3 text-sm">
+            <select
+              value={swept ?? ''}
+              onChange={(e) => setSweepVariable(e.target.value || null)}
+              className="px-3 py-2 bg-[var(--app-bg)] rounded border border-[var(--app-border)]"
+            >
+              <option value="">Vary…</option>
+              {variables.map(name => <option key={name} value={name}>{name}</option>)}
+            </select>
+            {['from', 'to', 'steps'].map((field) => (
+              <label key={field} className="flex items-center gap-2">
+                {field}
+                <input
+                  type="number"
+                  value={range[field]}
+                  onChange={(e) => setRange(prev => ({ ...prev, [field]: e.target.value }))}
+                  className="w-24 px-2 py-1 bg-[var(--app-bg)] rounded border border-[var(--app-border)]"
+                />
+              </label>
+            ))}
+          </div>
+
+          {sweepResult && (
+            <div className="max-h-64 overflow-y-auto">
+              <table className="w-full text-sm font-mono">
+                <thead>
+                  <tr className="text-left text-[var(--app-muted)]">
+                    <th className="py-1">{swept}</th>
+                    <th className="py-1">{target ?? 'Result'}</th>
+                  </tr>
+                </thead>
+                <tbody>
+                  {Array.from(sweepResult.x, (x, i) => (
+                    <tr key={i} className="border-t border-[var(--app-border)]">
+                      <td className="py-1">{formatNumber(x)}</td>
+                      <td className="py-1 text-green-400">{formatNumber(sweepResult.y[i])}</td>
+                    </tr>
+                  ))}
+                </tbody>
+              </table>
+            </div>
+          )}
+        </div>
+      )}
+    </div>
+  );
+}
+
+export default memo(FormulaCalculator);
@@ -0,0 +1,166 @@
+import React, { memo, useEffect, useState } from 'react';
+import { Plus, Search, Trash2, Link2, X } from 'lucide-react';
+
+// Notes mode. The list comes from the store's manifest; a note's body is
+// only read when it is opened. `topic` ({ key, title }), when set, is the
+// topic the panel was opened from: the list starts filtered to its notes
+// and new notes are linked to it.
+function NotesPanel({ store, topic }) {
+  const [notes, setNotes] = useState(null);
+  const [query, setQuery] = useState('');
+  const [matches, setMatches] = useState(null);
+  const [onlyTopic, setOnlyTopic] = useState(!!topic);
+  const [current, setCurrent] = useState(null);
+
+  useEffect(() => {
+    let stale = false;
+    store.list().then((list) => {
+      if (!stale) setNotes(list);
+    });
+    return () => {
+      stale = true;
+    };
+  }, [store]);
+
+  useEffect(() => {
+    if (!query.trim()) {
+      setMatches(null);
+      return undefined;
+    }
+    let stale = false;
+    store.search(query).then((ids) => {
+      if (!stale) setMatches(new Set(ids));
+    });
+    return () => {
+      stale = true;
+    };
+  }, [store, query]);
+
+  const refreshList = () => store.list().then(setNotes);
+
+  const openNote = async (id) => {
+    setCurrent(await store.get(id));
+  };
+
+  const createNote = async () => {
+    const note = await store.create({ topics: topic ? [topic.key] : [] });
+    setCurrent(note);
+    refreshList();
+  };
+
+  const editNote = (changes) => {
+    const id = current.id;
+    setCurrent(prev => ({ ...prev, ...changes }));
+    store.update(id, changes).then(refreshList);
+  };
+
+  const deleteNote = async () => {
+    await store.remove(current.id);
+    setCurrent(null);
+    refreshList();
+  };
+
+  const visible = (notes ?? []).filter(note => (
+    (!matches || matches.has(note.id)) && (!onlyTopic || !topic || note.topics.includes(topic.key))
+  ));
+
+  return (
+    <div className="grid md:grid-cols-3 gap-4 min-h-[500px]">
+      <div className="space-y-3">
+        <div className="flex items-center gap-2 bg-[var(--app-surface)] px-3 py-2 rounded-lg border border-[var(--app-border)] focus-within:border-yellow-500">
+          <Search className="w-4 h-4 text-[var(--app-muted)]" />
+          <input
+            type="text"
+            value={query}
+            onChange={(e) => setQuery(e.target.value)}
+            placeholder="Search notes..."
+            className="flex-1 bg-transparent focus:outline-none"
+          />
+        </div>
+
+        {topic && (
+          <button
+            onClick={() => setOnlyTopic(!onlyTopic)}
+            className="w-full text-left text-xs px-3 py-2 bg-[var(--app-surface)] rounded hover:bg-[var(--app-raised)]"
+          >
+            {onlyTopic ? `Notes for ${topic.title} · show all` : `All notes · only ${topic.title}`}
+          </button>
+        )}
+
+        <button
+          onClick={createNote}
+          className="w-full flex items-center justify-center gap-2 px-3 py-2 bg-yellow-600 hover:bg-yellow-700 rounded-lg transition"
+        >
+          <Plus className="w-4 h-4" />
+          New Note
+        </button>
+
+        <div className="space-y-1 max-h-[400px] overflow-y-auto">
+          {notes === null && <p className="text-sm text-[var(--app-muted)]">Loading notes...</p>}
+          {notes !== null && visible.length === 0 && <p className="text-sm text-[var(--app-muted)]">No notes</p>}
+          {visible.map(note => (
+            <button
+              key={note.id}
+              onClick={() => openNote(note.id)}
+              className={`w-full p-2 rounded text-left transition ${current?.id === note.id ? 'bg-yellow-900/40 border border-yellow-500/50' : 'bg-[var(--app-surface)] hover:bg-[var(--app-raised)]'}`}
+            >
+              <span className="block text-sm font-semibold truncate">{note.title || 'Untitled note'}</span>
+              <span className="block text-xs text-[var(--app-faint)]">{new Date(note.updated).toLocaleString()}</span>
+            </button>
+          ))}
+        </div>
+      </div>
+
+      <div className="md:col-span-2">
+        {!current ? (
+          <div className="h-full flex items-center justify-center text-[var(--app-faint)] bg-[var(--app-bg)] rounded-lg">
+            Select or create a note
+          </div>
+        ) : (
+          <div className="space-y-3">
+            <div className="flex items-center gap-2">
+              <input
+                type="text"
+                value={current.title}
+                onChange={(e) => editNote({ title: e.target.value })}
+                className="flex-1 px-3 py-2 bg-[var(--app-surface)] rounded-lg border border-[var(--app-border)] font-semibold focus:border-yellow-500 focus:outline-none"
+              />
+              <button onClick={deleteNote} title="Delete note" className="p-2 rounded text-[var(--app-muted)] hover:text-red-400 hover:bg-[var(--app-surface)]">
+                <Trash2 className="w-4 h-4" />
+              </button>
+            </div>
+
+            <div className="flex flex-wrap items-center gap-2 text-xs">
+              {current.topics.map(key => (
+                <span key={key} className="flex items-center gap-1 px-2 py-1 bg-[var(--app-surface)] rounded font-mono">
+                  {key}
+                  <button onClick={() => editNote({ topics: current.topics.filter(other => other !== key) })} title="Unlink topic">
+                    <X className="w-3 h-3" />
+                  </button>
+                </span>
+              ))}
+              {topic && !current.topics.includes(topic.key) && (
+                <button
+                  onClick={() => editNote({ topics: [...current.topics, topic.key] })}
+                  className="flex items-center gap-1 px-2 py-1 bg-[var(--app-surface)] rounded hover:bg-[var(--app-raised)]"
+                >
+                  <Link2 className="w-3 h-3" />
+                  Link to {topic.title}
+                </button>
+              )}
+            </div>
+
+            <textarea
+              value={current.body}
+              onChange={(e) => editNote({ body: e.target.value })}
+              placeholder="Write your note..."
+              className="w-full h-[400px] p-3 bg-[var(--app-surface)] rounded-lg border border-[var(--app-border)] focus:border-yellow-500 focus:outline-none resize-none"
+            />
+          </div>
+        )}
+      </div>
+    </div>
+  );
+}
+
+export default memo(NotesPanel);
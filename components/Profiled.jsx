@@ -0,0 +1,16 @@
+import React, { Profiler } from 'react';
+
+// Wraps a view in a React Profiler that reports to `onRender` while
+// `enabled`. The Profiler is always rendered: adding or removing it would
+// change the element type above the view, so toggling diagnostics would
+// remount the view and lose its state.
+export default function Profiled({ id, enabled, onRender, children }) {
+  const handleRender = (...timings) => {
+    if (enabled) onRender(...timings);
+  };
+  return (
+    <Profiler id={id} onRender={handleRender}>
+      {children}
+    </Profiler>
+  );
+}
@@ -0,0 +1,25 @@
+import React, { memo } from 'react';
+
+// Subject picker for the current branch. Memoized: only re-renders when the
+// branch content or the selection changes.
+function SubjectGrid({ subjects, selectedSubject, onSelect }) {
+  return (
+    <div className="grid grid-cols-2 md:grid-cols-3 lg:grid-cols-4 gap-3">
+      {Object.entries(subjects).map(([key, subject]) => (
+        <button
+          key={key}
+          onClick={() => onSelect(key)}
+          className={`p-3 rounded-lg border transition ${
+            selectedSubject === key
+              ? 'border-cyan-500 bg-cyan-900/30'
+              : 'border-[var(--app-border)] bg-[var(--app-surface)] hover:border-[var(--app-border-strong)]'
+          }`}
+        >
+          <span className="text-sm font-semibold">{subject.name}</span>
+        </button>
+      ))}
+    </div>
+  );
+}
+
+export default memo(SubjectGrid);
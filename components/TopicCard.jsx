@@ -0,0 +1,111 @@
+import React, { memo } from 'react';
+import { ChevronDown, ChevronUp, Star, Calculator, StickyNote } from 'lucide-react';
+import { isEvaluableFormula } from '../lib/expression';
+
+// One collapsible topic. Memoized, and the callbacks take the topic key, so
+// the parent can pass the same functions to every card: expanding or
+// starring one card re-renders only that card. `related` is the topic's
+// precomputed neighbors (lib/related.js), if its content has them.
+function TopicCard({ topicKey, topic, related, isExpanded, isFavorite, showFormulas, showKeyPoints, onToggle, onToggleFavorite, onOpenFormula, onOpenNotes, onOpenRelated }) {
+  return (
+    <div className="bg-[var(--app-surface)] rounded-lg border border-[var(--app-border)]">
+      <div className="p-4 flex items-center justify-between">
+        <button
+          onClick={() => onToggle(topicKey)}
+          className="flex-1 text-left flex items-center gap-3"
+        >
+          <span className="font-semibold text-cyan-300">{topic.title}</span>
+        </button>
+        <div className="flex items-center gap-2">
+          {onOpenNotes && (
+            <button
+              onClick={() => onOpenNotes(topicKey, topic.title)}
+              title="Notes for this topic"
+              className="p-2 rounded text-[var(--app-muted)] hover:text-yellow-400 hover:bg-[var(--app-raised)]"
+            >
+              <StickyNote className="w-4 h-4" />
+            </button>
+          )}
+          <button
+            onClick={() => onToggleFavorite(topicKey)}
+            title={isFavorite ? 'Remove from favorites' : 'Add to favorites'}
+            className={`p-2 rounded hover:bg-[var(--app-raised)] ${isFavorite ? 'text-yellow-400' : 'text-[var(--app-muted)]'}`}
+          >
+            <Star className="w-4 h-4" fill={isFavorite ? 'currentColor' : 'none'} />
+          </button>
+          {isExpanded ? <ChevronUp className="w-5 h-5" /> : <ChevronDown className="w-5 h-5" />}
+        </div>
+      </div>
+
+      {isExpanded && (
+        <div className="px-4 pb-4 space-y-3">
+          <p className="text-sm text-[var(--app-muted)]">{topic.content}</p>
+
+          {showFormulas && topic.formulas && (
+            <div className="bg-[var(--app-bg)] p-3 rounded">
+              <h4 className="text-sm font-semibold text-yellow-400 mb-2">📐 Formulas:</h4>
+              <ul className="space-y-1">
+                {topic.formulas.map((formula, i) => (
+                  <li key={i} className="flex items-center gap-2 text-sm font-mono text-[var(--app-text-soft)]">
+                    {formula}
+                    {onOpenFormula && isEvaluableFormula(formula) && (
+                      <button
+                        onClick={() => onOpenFormula(formula)}
+                        title="Open in calculator"
+                        className="p-1 rounded text-[var(--app-muted)] hover:text-green-400 hover:bg-[var(--app-raised)]"
+                      >
+                        <Calculator className="w-3 h-3" />
+                      </button>
+                    )}
+                  </li>
+                ))}
+              </ul>
+            </div>
+          )}
+
+          {showKeyPoints && topic.keyPoints && (
+            <div className="bg-[var(--app-bg)] p-3 rounded">
+              <h4 className="text-sm font-semibold text-green-400 mb-2">💡 Key Points:</h4>
+              <ul className="space-y-1">
+                {topic.keyPoints.map((point, i) => (
+                  <li key={i} className="text-sm text-[var(--app-text-soft)]">• {point}</li>
+                ))}
+              </ul>
+            </div>
+          )}
+
+          {topic.examples && (
+            <div className="bg-[var(--app-bg)] p-3 rounded">
+              <h4 className="text-sm font-semibold text-blue-400 mb-2">📝 Examples:</h4>
+              <ul className="space-y-1">
+                {topic.examples.map((example, i) => (
+                  <li key={i} className="text-sm text-[var(--app-text-soft)]">• {example}</li>
+                ))}
+              </ul>
+            </div>
+          )}
+
+          {onOpenRelated && related?.length > 0 && (
+            <div className="bg-[var(--app-bg)] p-3 rounded">
+              <h4 className="text-sm font-semibold text-purple-400 mb-2">🔗 Related Topics:</h4>
+              <ul className="space-y-1">
+                {related.map((entry) => (
+                  <li key={`${entry.branch}:${entry.topicKey}`}>
+                    <button
+                      onClick={() => onOpenRelated(entry)}
+                      className="text-left text-sm text-[var(--app-text-soft)] hover:text-cyan-300"
+                    >
+                      {entry.title} <span className="text-xs text-[var(--app-faint)]">· {entry.subjectName}</span>
+                    </button>
+                  </li>
+                ))}
+              </ul>
+            </div>
+          )}
+        </div>
+      )}
+    </div>
+  );
+}
+
+export default memo(TopicCard);
@@ -0,0 +1,175 @@
+import React, { useState, useEffect, useLayoutEffect, useRef } from 'react';
+import { createHeightIndex } from '../lib/heightIndex';
+
+const ESTIMATED_HEIGHT = 72;
+// Rows rendered beyond each edge of the viewport
+const OVERSCAN = 6;
+// Distance (px) from an edge that still counts as "at" that edge
+const EDGE_THRESHOLD = 32;
+
+// Measured row heights, keyed by message object so they survive paging
+const measuredHeights = new WeakMap();
+
+const heightOf = (message) => measuredHeights.get(message) ?? ESTIMATED_HEIGHT;
+
+function MeasuredRow({ index, observer, children }) {
+  const ref = useRef(null);
+
+  useLayoutEffect(() => {
+    const node = ref.current;
+    const resizeObserver = observer.current;
+    if (!resizeObserver) return undefined;
+    resizeObserver.observe(node);
+    return () => resizeObserver.unobserve(node);
+  }, [observer]);
+
+  return (
+    <div ref={ref} data-index={index} className="px-4 pt-4">
+      {children}
+    </div>
+  );
+}
+
+// Scrollable message list that only mounts the rows in view (plus
+// overscan). `base` is the global index of messages[0]; it keeps row keys
+// stable and the scroll position anchored when older messages are
+// prepended. The list sticks to the bottom while the user is there.
+export default function VirtualMessageList({ messages, base = 0, renderMessage, onReachTop, className = '' }) {
+  const containerRef = useRef(null);
+  const indexRef = useRef(null);
+  const prevMessages = useRef([]);
+  const prevBase = useRef(base);
+  const messagesRef = useRef(messages);
+  const atBottom = useRef(true);
+  const firstVisible = useRef(0);
+  const pendingShift = useRef(0);
+  const frame = useRef(0);
+  const rowObserver = useRef(null);
+  const [scrollTop, setScrollTop] = useState(0);
+  const [viewportHeight, setViewportHeight] = useState(600);
+  const [, setMeasureCount] = useState(0);
+
+  messagesRef.current = messages;
+
+  // Bring the height index in line with `messages`. Appending and editing
+  // the last message (a streaming reply) are O(log n); anything else
+  // rebuilds from the cached measurements.
+  if (prevMessages.current !== messages) {
+    const prev = prevMessages.current;
+    const index = indexRef.current;
+    if (index && prev.length > 0 && base === prevBase.current && messages.length >= prev.length && messages[0] === prev[0]) {
+      const last = prev.length - 1;
+      if (messages[last] !== prev[last]) {
+        index.set(last, measuredHeights.get(messages[last]) ?? index.heightOf(last));
+      }
+      for (let i = prev.length; i < messages.length; i++) {
+        index.push(heightOf(messages[i]));
+      }
+    } else {
+      // Rows trimmed off the top (lib/chatWindow.js) must not move what the
+      // user sees either
+      const trimmed = base - prevBase.current;
+      if (index && prev.length > 0 && trimmed > 0) {
+        pendingShift.current -= index.offsetOf(trimmed);
+      }
+      indexRef.current = createHeightIndex(messages.map(heightOf));
+      const prepended = prevBase.current - base;
+      if (prev.length > 0 && prepended > 0) {
+        pendingShift.current += indexRef.current.offsetOf(prepended);
+      }
+    }
+    prevMessages.current = messages;
+    prevBase.current = base;
+  }
+
+  if (!rowObserver.current && typeof ResizeObserver !== 'undefined') {
+    rowObserver.current = new ResizeObserver((entries) => {
+      const index = indexRef.current;
+      let changed = false;
+      for (const entry of entries) {
+        const i = Number(entry.target.dataset.index);
+        const message = messagesRef.current[i];
+        if (!message || !entry.target.isConnected) continue;
+        const height = entry.target.offsetHeight;
+        measuredHeights.set(message, height);
+        const delta = index.set(i, height);
+        if (delta !== 0) {
+          changed = true;
+          // Rows above the viewport changing size must not move what the user sees
+          if (i < firstVisible.current) pendingShift.current += delta;
+        }
+      }
+      if (changed) setMeasureCount(n => n + 1);
+    });
+  }
+
+  useEffect(() => {
+    const el = containerRef.current;
+    const viewportObserver = new ResizeObserver(() => setViewportHeight(el.clientHeight));
+    viewportObserver.observe(el);
+    return () => {
+      viewportObserver.disconnect();
+      rowObserver.current?.disconnect();
+      cancelAnimationFrame(frame.current);
+    };
+  }, []);
+
+  // Runs after every render: apply anchoring corrections before paint
+  useLayoutEffect(() => {
+    const el = containerRef.current;
+    if (pendingShift.current !== 0 && !atBottom.current) {
+      el.scrollTop += pendingShift.current;
+    } else if (atBottom.current) {
+      el.scrollTop = el.scrollHeight;
+    }
+    pendingShift.current = 0;
+    if (el.scrollTop !== scrollTop) setScrollTop(el.scrollTop);
+  });
+
+  const handleScroll = () => {
+    const el = containerRef.current;
+    atBottom.current = el.scrollHeight - el.scrollTop - el.clientHeight < EDGE_THRESHOLD;
+    if (el.scrollTop < EDGE_THRESHOLD && onReachTop) onReachTop();
+    if (!frame.current) {
+      frame.current = requestAnimationFrame(() => {
+        frame.current = 0;
+        setScrollTop(el.scrollTop);
+      });
+    }
+  };
+
+  const index = indexRef.current;
+  let start = 0;
+  let end = 0;
+  if (messages.length > 0) {
+    const first = index.indexAt(scrollTop);
+    const last = index.indexAt(scrollTop + viewportHeight);
+    firstVisible.current = first;
+    start = Math.max(0, first - OVERSCAN);
+    end = Math.min(messages.length, last + 1 + OVERSCAN);
+  }
+
+  const rows = [];
+  for (let i = start; i < end; i++) {
+    rows.push(
+      <MeasuredRow key={base + i} index={i} observer={rowObserver}>
+        {renderMessage(messages[i], i)}
+      </MeasuredRow>
+    );
+  }
+
+  return (
+    <div
+      ref={containerRef}
+      onScroll={handleScroll}
+      className={`overflow-y-auto ${className}`}
+      style={{ overflowAnchor: 'none' }}
+    >
+      <div className="pb-4">
+        <div style={{ height: index.offsetOf(start) }} />
+        {rows}
+        <div style={{ height: index.total - index.offsetOf(end) }} />
+      </div>
+    </div>
+  );
+}
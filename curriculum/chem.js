@@ -0,0 +1,17 @@
+// Chemical Engineering
+export default {
+  subjects: {
+    transport: {
+      name: 'Transport Phenomena',
+      topics: [
+        {
+          title: 'Heat Transfer',
+          content: 'Conduction, Convection, Radiation',
+          formulas: ['Fourier: q = -kA(dT/dx)', 'Newton: q = hA∆T'],
+          keyPoints: ['Thermal conductivity', 'Heat exchangers'],
+          examples: ['Wall heat loss', 'Heat exchanger design']
+        }
+      ]
+    }
+  }
+};
@@ -0,0 +1,17 @@
+// Civil Engineering
+export default {
+  subjects: {
+    struct: {
+      name: 'Structural Analysis',
+      topics: [
+        {
+          title: 'Beam Analysis',
+          content: 'SFD and BMD',
+          formulas: ['V = dM/dx', 'Deflection formulas'],
+          keyPoints: ['Point loads', 'UDL', 'Moments'],
+          examples: ['Simply supported beam', 'Cantilever beam']
+        }
+      ]
+    }
+  }
+};
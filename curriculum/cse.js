@@ -0,0 +1,76 @@
+// Computer Science & Engineering
+export default {
+  subjects: {
+    dsa: {
+      name: 'Data Structures & Algorithms',
+      topics: [
+        {
+          title: 'Time Complexity',
+          content: 'O(1) < O(log n) < O(n) < O(n log n) < O(n²) < O(2ⁿ) < O(n!)',
+          formulas: ['Big O, Omega, Theta notations', 'Master Theorem: T(n) = aT(n/b) + f(n)'],
+          keyPoints: ['Best, Average, Worst cases', 'Space vs Time tradeoff'],
+          examples: ['Binary Search: O(log n)', 'Bubble Sort: O(n²)']
+        },
+        {
+          title: 'Arrays & Strings',
+          content: 'Contiguous memory, O(1) access, O(n) insertion/deletion',
+          formulas: ['2D array: arr[i][j] = base + (i×cols + j)×size'],
+          keyPoints: ['Sliding window', 'Two pointers', 'Kadane\'s algorithm'],
+          examples: ['Max subarray sum', 'String reversal', 'Anagram check']
+        },
+        {
+          title: 'Linked Lists',
+          content: 'Node-based, dynamic size',
+          formulas: ['Reverse: prev→next = curr', 'Cycle: Floyd\'s algorithm'],
+          keyPoints: ['Singly, Doubly, Circular', 'Dummy nodes'],
+          examples: ['Detect cycle', 'Merge sorted lists', 'Reverse in groups']
+        },
+        {
+          title: 'Trees & Graphs',
+          content: 'Hierarchical & Network structures',
+          formulas: ['DFS: O(V+E)', 'BFS: O(V+E)', 'Dijkstra: O(E log V)'],
+          keyPoints: ['Traversals', 'Shortest paths', 'MST algorithms'],
+          examples: ['Binary search tree', 'Level order traversal', 'Topological sort']
+        }
+      ]
+    },
+    dbms: {
+      name: 'Database Management Systems',
+      topics: [
+        {
+          title: 'SQL Fundamentals',
+          content: 'DDL, DML, DCL commands',
+          formulas: ['SELECT * FROM table WHERE condition', 'JOIN operations'],
+          keyPoints: ['CRUD operations', 'Aggregate functions', 'GROUP BY'],
+          examples: ['Find top salaries', 'Join multiple tables', 'Subqueries']
+        },
+        {
+          title: 'Normalization',
+          content: 'Remove redundancy',
+          formulas: ['1NF→2NF→3NF→BCNF'],
+          keyPoints: ['Functional dependencies', 'Decomposition'],
+          examples: ['Student-Course database', 'Employee records']
+        }
+      ]
+    },
+    os: {
+      name: 'Operating Systems',
+      topics: [
+        {
+          title: 'Process Scheduling',
+          content: 'CPU allocation algorithms',
+          formulas: ['Turnaround = Completion - Arrival', 'Waiting = Turnaround - Burst'],
+          keyPoints: ['FCFS, SJF, RR, Priority', 'Preemptive vs Non-preemptive'],
+          examples: ['Calculate average waiting time', 'Gantt charts']
+        },
+        {
+          title: 'Memory Management',
+          content: 'Paging, Segmentation',
+          formulas: ['Physical = Frame# + Offset', 'Page fault calculation'],
+          keyPoints: ['Virtual memory', 'Page replacement', 'TLB'],
+          examples: ['FIFO page replacement', 'LRU algorithm']
+        }
+      ]
+    }
+  }
+};
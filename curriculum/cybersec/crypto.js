@@ -0,0 +1,43 @@
+// Cybersecurity: cryptography
+export default {
+  subjects: {
+    'sec-symmetric': {
+      name: 'Symmetric Cryptography',
+      topics: [
+        {
+          title: 'Block Ciphers and Modes',
+          content: 'AES and the modes that turn it into a usable cipher',
+          formulas: ['CBC: Ci = E(K, Pi XOR Ci-1)', 'CTR: Ci = Pi XOR E(K, nonce || i)'],
+          keyPoints: ['AES has a 128-bit block and 128/192/256-bit keys', 'ECB leaks patterns and should not be used', 'GCM provides encryption and authentication (AEAD)', 'Never reuse a nonce with the same key in CTR or GCM'],
+          examples: ['Show the ECB penguin effect', 'Explain the impact of GCM nonce reuse']
+        },
+        {
+          title: 'Hashes and MACs',
+          content: 'Integrity and authenticity of messages',
+          formulas: ['HMAC: H((K XOR opad) || H((K XOR ipad) || m))'],
+          keyPoints: ['SHA-256 and SHA-3 are current hash standards', 'MD5 and SHA-1 have practical collisions', 'HMAC resists length-extension attacks', 'Compare MACs in constant time'],
+          examples: ['Verify a file checksum', 'Explain length extension against H(key || m)']
+        }
+      ]
+    },
+    'sec-asymmetric': {
+      name: 'Public-Key Cryptography',
+      topics: [
+        {
+          title: 'RSA',
+          content: 'Encryption and signatures based on factoring',
+          formulas: ['Modulus: n = p*q', 'Encrypt: c ≡ m^e (mod n)', 'Decrypt: m ≡ c^d (mod n)'],
+          keyPoints: ['d is the inverse of e modulo lcm(p-1, q-1)', 'Use OAEP for encryption and PSS for signatures', '2048-bit moduli are the current minimum', 'Textbook RSA without padding is insecure'],
+          examples: ['Work through RSA with small primes', 'Explain why padding is required']
+        },
+        {
+          title: 'Diffie-Hellman and Elliptic Curves',
+          content: 'Agreeing on a shared secret over an open channel',
+          formulas: ['Shared secret: s ≡ g^(ab) (mod p)'],
+          keyPoints: ['Security rests on the discrete logarithm problem', 'Unauthenticated DH is open to man-in-the-middle', 'X25519 and P-256 are common curves', 'Ephemeral keys give forward secrecy'],
+          examples: ['Compute a toy DH exchange', 'Show where a MITM inserts itself']
+        }
+      ]
+    }
+  }
+};
@@ -0,0 +1,31 @@
+// Cybersecurity content domain (see ../domain.js).
+//
+// Tracks use the branch schema, so the B.Tech grids and topic cards render
+// them unchanged. Subject keys carry a 'sec-' prefix so topic keys
+// (`${subject}-${idx}`, used by favorites and notes) never collide with
+// B.Tech ones.
+
+import { createContentDomain } from '../domain.js';
+
+export const trackManifest = {
+  protocols: { name: 'Network Protocols', icon: 'Network', color: 'blue' },
+  web: { name: 'Web Security', icon: 'Globe', color: 'orange' },
+  crypto: { name: 'Cryptography', icon: 'Lock', color: 'purple' },
+  tools: { name: 'Tools', icon: 'Terminal', color: 'green' },
+  vulns: { name: 'Vulnerabilities & CVEs', icon: 'Bug', color: 'red' }
+};
+
+const trackLoaders = {
+  protocols: () => import('./protocols.js'),
+  web: () => import('./web.js'),
+  crypto: () => import('./crypto.js'),
+  tools: () => import('./tools.js'),
+  vulns: () => import('./vulns.js')
+};
+
+export const cybersec = createContentDomain({
+  id: 'cybersec',
+  manifest: trackManifest,
+  loaders: trackLoaders,
+  dataPath: '/curriculum/cybersec'
+});
@@ -0,0 +1,43 @@
+// Cybersecurity: network protocols
+export default {
+  subjects: {
+    'sec-tcpip': {
+      name: 'TCP/IP Essentials',
+      topics: [
+        {
+          title: 'TCP Handshake and States',
+          content: 'Connection setup, teardown and what scanners observe',
+          formulas: [],
+          keyPoints: ['SYN, SYN-ACK, ACK opens a connection', 'RST answers a closed port', 'SYN floods exhaust half-open connection slots', 'SYN cookies avoid keeping state for half-open connections'],
+          examples: ['Read a handshake in a packet capture', 'Tell an open port from a closed or filtered one']
+        },
+        {
+          title: 'Common Ports',
+          content: 'Well-known services and their default ports',
+          formulas: [],
+          keyPoints: ['22 SSH, 23 Telnet, 25 SMTP', '53 DNS (UDP and TCP)', '80 HTTP, 443 HTTPS', '445 SMB, 3389 RDP'],
+          examples: ['Spot cleartext services on a host', 'Map a scan result to likely services']
+        }
+      ]
+    },
+    'sec-dns-tls': {
+      name: 'DNS & TLS',
+      topics: [
+        {
+          title: 'DNS Resolution and Attacks',
+          content: 'How names resolve and how resolution is abused',
+          formulas: [],
+          keyPoints: ['Recursive resolver walks root, TLD and authoritative servers', 'Cache poisoning injects forged answers', 'DNSSEC signs records to prove authenticity', 'DNS tunnelling hides data in queries'],
+          examples: ['Trace a lookup with dig +trace', 'Recognise unusually long subdomain queries']
+        },
+        {
+          title: 'TLS 1.3 Handshake',
+          content: 'Authenticated key exchange for HTTPS and other protocols',
+          formulas: [],
+          keyPoints: ['One round trip: ClientHello with key share, ServerHello', 'Ephemeral (EC)DHE gives forward secrecy', 'Certificate proves the server identity', 'Only AEAD cipher suites are allowed'],
+          examples: ['Inspect a certificate chain with openssl s_client', 'Compare TLS 1.2 and 1.3 round trips']
+        }
+      ]
+    }
+  }
+};
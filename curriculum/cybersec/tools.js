@@ -0,0 +1,36 @@
+// Cybersecurity: tool references
+export default {
+  subjects: {
+    'sec-recon': {
+      name: 'Reconnaissance',
+      topics: [
+        {
+          title: 'Nmap',
+          content: 'Host discovery, port scanning and service detection',
+          formulas: [],
+          keyPoints: ['-sS SYN scan, -sT full connect scan, -sU UDP scan', '-sV probes service versions, -O guesses the OS', '-p- scans all 65535 ports', '-oA writes normal, XML and grepable output'],
+          examples: ['nmap -sV -p 1-1000 10.0.0.5', 'nmap -sn 192.168.1.0/24 for a ping sweep']
+        }
+      ]
+    },
+    'sec-analysis': {
+      name: 'Traffic & Web Analysis',
+      topics: [
+        {
+          title: 'Wireshark',
+          content: 'Capturing and dissecting network traffic',
+          formulas: [],
+          keyPoints: ['Capture filters (BPF) limit what is recorded', 'Display filters narrow what is shown: http.request, tcp.port == 443', 'Follow TCP Stream rebuilds a conversation', 'TLS can be decrypted with an SSLKEYLOGFILE'],
+          examples: ['Filter DNS queries for one host', 'Extract a file from an HTTP capture']
+        },
+        {
+          title: 'Burp Suite',
+          content: 'Intercepting proxy for testing web applications',
+          formulas: [],
+          keyPoints: ['Proxy intercepts and edits requests in flight', 'Repeater resends a request with changes', 'Intruder automates parameter fuzzing', 'Only test applications you are authorised to test'],
+          examples: ['Replay a login request with a modified parameter', 'Fuzz an ID parameter for access control issues']
+        }
+      ]
+    }
+  }
+};
@@ -0,0 +1,38 @@
+// Cybersecurity: notable vulnerabilities
+export default {
+  subjects: {
+    'sec-cve': {
+      name: 'CVE Notes',
+      topics: [
+        {
+          title: 'Heartbleed (CVE-2014-0160)',
+          content: 'OpenSSL TLS heartbeat buffer over-read',
+          formulas: [],
+          keyPoints: ['Heartbeat length field was trusted without a bounds check', 'Leaked up to 64 KB of process memory per request', 'Exposed private keys, session cookies and passwords', 'Fixed in OpenSSL 1.0.1g; keys had to be rotated'],
+          examples: ['Explain the missing length check', 'List the remediation steps beyond patching']
+        },
+        {
+          title: 'Shellshock (CVE-2014-6271)',
+          content: 'Bash executing trailing commands in function definitions from environment variables',
+          formulas: [],
+          keyPoints: ['Triggered by env values starting with () {', 'Reachable through CGI headers and DHCP options', 'Initial patch was incomplete (CVE-2014-7169)', 'Shows the risk of passing untrusted data in the environment'],
+          examples: ["env x='() { :;}; echo vulnerable' bash -c :", 'Trace a CGI request to bash']
+        },
+        {
+          title: 'EternalBlue (CVE-2017-0144)',
+          content: 'Remote code execution in Microsoft SMBv1',
+          formulas: [],
+          keyPoints: ['Patched in MS17-010 (March 2017)', 'Used by the WannaCry and NotPetya outbreaks', 'Wormable: no user interaction required', 'Disable SMBv1 and block port 445 at the perimeter'],
+          examples: ['Check a host for MS17-010', 'Explain why SMB should not face the internet']
+        },
+        {
+          title: 'Log4Shell (CVE-2021-44228)',
+          content: 'JNDI lookup injection in Apache Log4j 2',
+          formulas: [],
+          keyPoints: ['Logging ${jndi:ldap://...} made the server load remote code', 'Any logged input (headers, usernames) was an entry point', 'Fixed by removing message lookups (2.17.x)', 'Highlights the need for a software bill of materials'],
+          examples: ['Find Log4j versions in a dependency tree', 'Describe a WAF rule and why it is not enough']
+        }
+      ]
+    }
+  }
+};
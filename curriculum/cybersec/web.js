@@ -0,0 +1,43 @@
+// Cybersecurity: web application security
+export default {
+  subjects: {
+    'sec-owasp': {
+      name: 'OWASP Top 10',
+      topics: [
+        {
+          title: 'Cross-Site Scripting (XSS)',
+          content: 'Untrusted input rendered as script in another user\'s browser',
+          formulas: [],
+          keyPoints: ['Reflected, stored and DOM-based variants', 'Encode output for its context (HTML, attribute, JS, URL)', 'Content-Security-Policy limits what injected script can run', 'HttpOnly cookies are not readable from script'],
+          examples: ['Find a reflected parameter in a search page', 'Write a CSP that blocks inline script']
+        },
+        {
+          title: 'SQL Injection',
+          content: 'Input that changes the structure of a database query',
+          formulas: [],
+          keyPoints: ['Caused by building queries with string concatenation', 'Parameterized queries keep data out of the query structure', 'Blind variants infer data from timing or boolean responses', 'Least-privilege database accounts limit the damage'],
+          examples: ['Rewrite a concatenated query with placeholders', 'Explain why escaping alone is fragile']
+        },
+        {
+          title: 'Cross-Site Request Forgery (CSRF)',
+          content: 'A forged request sent with the victim\'s ambient credentials',
+          formulas: [],
+          keyPoints: ['Works because browsers attach cookies automatically', 'Anti-CSRF tokens tie requests to the session', 'SameSite cookies stop most cross-site sends', 'State changes should never use GET'],
+          examples: ['Build a form that triggers a transfer', 'Add a synchronizer token to a form']
+        }
+      ]
+    },
+    'sec-auth': {
+      name: 'Authentication & Sessions',
+      topics: [
+        {
+          title: 'Password Storage',
+          content: 'Storing credentials so a database leak does not reveal them',
+          formulas: [],
+          keyPoints: ['Use a slow, salted hash: Argon2id, scrypt or bcrypt', 'A unique salt per password defeats precomputed tables', 'Never store passwords with reversible encryption', 'Rate-limit and lock out online guessing'],
+          examples: ['Choose Argon2id parameters', 'Explain why SHA-256 alone is unsuitable']
+        }
+      ]
+    }
+  }
+};
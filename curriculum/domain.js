@@ -0,0 +1,100 @@
+// Lazily loaded content domains.
+//
+// A domain (the B.Tech curriculum, the Cybersecurity material, ...) is a
+// manifest of sections plus one loader per section. Every section shares
+// the branch schema: { subjects: { [key]: { name, topics: [...] } } }.
+// Only the manifest is evaluated up front; a section's content is loaded
+// the first time it is opened.
+//
+// In production builds, sections are fetched as content-hashed JSON listed
+// in `${dataPath}/manifest.json` (scripts/build-curriculum.mjs), which the
+// service worker caches. Without that manifest (in development, or outside
+// a browser) the section modules are imported.
+//
+// Only the active domain stays resident: activating one evicts the loaded
+// content of the others. Imported modules stay in the module registry, so
+// eviction only frees memory for fetched content.
+
+const domains = new Map();
+
+export const createContentDomain = ({ id, manifest, loaders, dataPath }) => {
+  let pending = {};
+  let loaded = {};
+  let dataManifest = null;
+
+  const loadDataManifest = () => {
+    if (!dataManifest) {
+      dataManifest = typeof location === 'undefined' || typeof fetch !== 'function'
+        ? Promise.resolve(null)
+        : fetch(`${dataPath}/manifest.json`)
+          .then(response => (response.ok ? response.json() : null))
+          // A dev server may answer with index.html instead of a 404
+          .catch(() => null);
+    }
+    return dataManifest;
+  };
+
+  const fetchSection = async (key) => {
+    const entry = (await loadDataManifest())?.branches?.[key];
+    if (!entry) {
+      return (await loaders[key]()).default;
+    }
+    const response = await fetch(`${dataPath}/${entry.file}`);
+    if (!response.ok) {
+      throw new Error(`Failed to load ${entry.file}: ${response.status}`);
+    }
+    return response.json();
+  };
+
+  const domain = {
+    id,
+    manifest,
+    dataPath,
+
+    // Returns the section content if it has already been loaded, otherwise null.
+    getLoaded: (key) => loaded[key] || null,
+
+    // Loads a section's content once; repeated calls share the same promise.
+    load(key) {
+      if (!loaders[key]) {
+        return Promise.resolve(null);
+      }
+      if (!pending[key]) {
+        const sections = loaded;
+        pending[key] = fetchSection(key).then((content) => {
+          sections[key] = content;
+          return content;
+        }, (error) => {
+          // Let the next selection retry instead of caching the failure
+          delete pending[key];
+          throw error;
+        });
+      }
+      return pending[key];
+    },
+
+    // Content the page already has (a prerendered view, see
+    // scripts/prerender.mjs), so load() does not fetch it again
+    seed(key, content) {
+      loaded[key] = content;
+      pending[key] = Promise.resolve(content);
+    },
+
+    evict() {
+      pending = {};
+      loaded = {};
+    }
+  };
+
+  domains.set(id, domain);
+  return domain;
+};
+
+export const getDomain = (id) => domains.get(id) || null;
+
+// Makes `id` the only domain with content in memory
+export const activateDomain = (id) => {
+  for (const domain of domains.values()) {
+    if (domain.id !== id) domain.evict();
+  }
+};
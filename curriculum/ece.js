@@ -0,0 +1,29 @@
+// Electronics & Communication
+export default {
+  subjects: {
+    signals: {
+      name: 'Signals & Systems',
+      topics: [
+        {
+          title: 'Fourier Transform',
+          content: 'Time ↔ Frequency domain',
+          formulas: ['X(ω) = ∫x(t)e^(-jωt)dt'],
+          keyPoints: ['Linearity', 'Time shifting', 'Frequency shifting'],
+          examples: ['Rectangular pulse', 'Sinusoidal signals']
+        }
+      ]
+    },
+    analog: {
+      name: 'Analog Electronics',
+      topics: [
+        {
+          title: 'Op-Amp Circuits',
+          content: 'Operational Amplifier applications',
+          formulas: ['Inverting: Vo = -(Rf/Ri)Vi', 'Non-inverting: Vo = (1+Rf/Ri)Vi'],
+          keyPoints: ['Virtual ground', 'High input impedance'],
+          examples: ['Summing amplifier', 'Integrator', 'Differentiator']
+        }
+      ]
+    }
+  }
+};
@@ -0,0 +1,17 @@
+// Electrical Engineering
+export default {
+  subjects: {
+    circuits: {
+      name: 'Electric Circuits',
+      topics: [
+        {
+          title: 'Network Theorems',
+          content: 'Circuit simplification',
+          formulas: ['Thevenin: Vth, Rth', 'Norton: In, Rn'],
+          keyPoints: ['Superposition', 'Maximum power transfer'],
+          examples: ['Find Thevenin equivalent', 'Calculate load current']
+        }
+      ]
+    }
+  }
+};
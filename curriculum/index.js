@@ -0,0 +1,42 @@
+// Curriculum content bundle: the B.Tech content domain (see domain.js).
+//
+// The manifest below is all the UI needs to draw the branch grid; each
+// branch's subjects and topics live in their own module and are only
+// loaded (and evaluated) the first time that branch is selected.
+
+import { createContentDomain } from './domain.js';
+
+// Bump whenever any branch module changes so caches keyed on content
+// can be invalidated.
+export const CONTENT_VERSION = '1.0.0';
+
+export const branchManifest = {
+  cse: { name: 'Computer Science & Engineering', icon: 'Code', color: 'blue' },
+  ece: { name: 'Electronics & Communication', icon: 'Radio', color: 'purple' },
+  ee: { name: 'Electrical Engineering', icon: 'Zap', color: 'yellow' },
+  mech: { name: 'Mechanical Engineering', icon: 'Wrench', color: 'orange' },
+  civil: { name: 'Civil Engineering', icon: 'Cpu', color: 'green' },
+  chem: { name: 'Chemical Engineering', icon: 'Droplet', color: 'cyan' }
+};
+
+const branchLoaders = {
+  cse: () => import('./cse.js'),
+  ece: () => import('./ece.js'),
+  ee: () => import('./ee.js'),
+  mech: () => import('./mech.js'),
+  civil: () => import('./civil.js'),
+  chem: () => import('./chem.js')
+};
+
+export const btech = createContentDomain({
+  id: 'btech',
+  manifest: branchManifest,
+  loaders: branchLoaders,
+  dataPath: '/curriculum'
+});
+
+// Returns the branch content if it has already been loaded, otherwise null.
+export const getLoadedBranch = btech.getLoaded;
+
+// Loads a branch's content once; repeated calls share the same promise.
+export const loadBranch = btech.load;
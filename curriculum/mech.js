@@ -0,0 +1,17 @@
+// Mechanical Engineering
+export default {
+  subjects: {
+    thermo: {
+      name: 'Thermodynamics',
+      topics: [
+        {
+          title: 'Carnot Cycle',
+          content: 'Ideal heat engine',
+          formulas: ['η = 1 - TL/TH', 'COP_ref = TL/(TH-TL)'],
+          keyPoints: ['Maximum efficiency', 'Reversible process'],
+          examples: ['Calculate efficiency', 'Refrigeration COP']
+        }
+      ]
+    }
+  }
+};
@@ -1,678 +1,925 @@
-import React, { useState, useEffect } from 'react';
-import { BookOpen, Code, Cpu, Zap, Droplet, Wrench, Radio, ChevronDown, ChevronUp, Search, Settings, Save, MessageSquare, Calculator, FileText, Brain, Globe, Lightbulb, Star, Download, Upload, RefreshCw, Moon, Sun } from 'lucide-react';
-
-export default function UltimateAIAssistant() {
-  const [mode, setMode] = useState('btech');
-  const [selectedBranch, setSelectedBranch] = useState('cse');
-  const [selectedSubject, setSelectedSubject] = useState(null);
-  const [expandedTopics, setExpandedTopics] = useState({});
-  const [searchQuery, setSearchQuery] = useState('');
-  const [showSettings, setShowSettings] = useState(false);
-  const [chatMessages, setChatMessages] = useState([]);
-  const [inputValue, setInputValue] = useState('');
-  const [favorites, setFavorites] = useState([]);
-  const [darkMode, setDarkMode] = useState(true);
-  
-  // Customization settings
-  const [settings, setSettings] = useState({
-    theme: 'dark',
-    fontSize: 'medium',
-    defaultMode: 'btech',
-    defaultBranch: 'cse',
-    showFormulas: true,
-    showKeyPoints: true,
-    autoSave: true,
-    aiModel: 'advanced',
-    language: 'english'
-  });
-
-  // Load settings from storage on mount
-  useEffect(() => {
-    const loadSettings = async () => {
-      try {
-        const savedSettings = await window.storage.get('user_settings');
-        if (savedSettings) {
-          const parsed = JSON.parse(savedSettings.value);
-          setSettings(parsed);
-          setMode(parsed.defaultMode);
-          setSelectedBranch(parsed.defaultBranch);
-          setDarkMode(parsed.theme === 'dark');
-        }
-      } catch (error) {
-        console.log('No saved settings found, using defaults');
-      }
-
-      try {
-        const savedFavorites = await window.storage.get('favorites');
-        if (savedFavorites) {
-          setFavorites(JSON.parse(savedFavorites.value));
-        }
-      } catch (error) {
-        console.log('No favorites found');
-      }
-
-      try {
-        const savedChat = await window.storage.get('chat_history');
-        if (savedChat) {
-          setChatMessages(JSON.parse(savedChat.value));
-        }
-      } catch (error) {
-        console.log('No chat history found');
-      }
-    };
-    loadSettings();
-  }, []);
-
-  // Save settings
-  const saveSettings = async () => {
-    try {
-      await window.storage.set('user_settings', JSON.stringify(settings));
-      await window.storage.set('favorites', JSON.stringify(favorites));
-      if (settings.autoSave) {
-        await window.storage.set('chat_history', JSON.stringify(chatMessages));
-      }
-      alert('Settings saved successfully!');
-    } catch (error) {
-      console.error('Error saving settings:', error);
-      alert('Failed to save settings');
-    }
-  };
-
-  // Export settings
-  const exportSettings = () => {
-    const data = {
-      settings,
-      favorites,
-      chatMessages: settings.autoSave ? chatMessages : []
-    };
-    const blob = new Blob([JSON.stringify(data, null, 2)], { type: 'application/json' });
-    const url = URL.createObjectURL(blob);
-    const a = document.createElement('a');
-    a.href = url;
-    a.download = 'ai-assistant-config.json';
-    a.click();
-  };
-
-  // Import settings
-  const importSettings = (event) => {
-    const file = event.target.files[0];
-    if (file) {
-      const reader = new FileReader();
-      reader.onload = (e) => {
-        try {
-          const data = JSON.parse(e.target.result);
-          setSettings(data.settings || settings);
-          setFavorites(data.favorites || []);
-          setChatMessages(data.chatMessages || []);
-          alert('Settings imported successfully!');
-        } catch (error) {
-          alert('Invalid configuration file');
-        }
-      };
-      reader.readAsText(file);
-    }
-  };
-
-  const branches = {
-    cse: {
-      name: 'Computer Science & Engineering',
-      icon: Code,
-      color: 'blue',
-      subjects: {
-        dsa: {
-          name: 'Data Structures & Algorithms',
-          topics: [
-            {
-              title: 'Time Complexity',
-              content: 'O(1) < O(log n) < O(n) < O(n log n) < O(n²) < O(2ⁿ) < O(n!)',
-              formulas: ['Big O, Omega, Theta notations', 'Master Theorem: T(n) = aT(n/b) + f(n)'],
-              keyPoints: ['Best, Average, Worst cases', 'Space vs Time tradeoff'],
-              examples: ['Binary Search: O(log n)', 'Bubble Sort: O(n²)']
-            },
-            {
-              title: 'Arrays & Strings',
-              content: 'Contiguous memory, O(1) access, O(n) insertion/deletion',
-              formulas: ['2D array: arr[i][j] = base + (i×cols + j)×size'],
-              keyPoints: ['Sliding window', 'Two pointers', 'Kadane\'s algorithm'],
-              examples: ['Max subarray sum', 'String reversal', 'Anagram check']
-            },
-            {
-              title: 'Linked Lists',
-              content: 'Node-based, dynamic size',
-              formulas: ['Reverse: prev→next = curr', 'Cycle: Floyd\'s algorithm'],
-              keyPoints: ['Singly, Doubly, Circular', 'Dummy nodes'],
-              examples: ['Detect cycle', 'Merge sorted lists', 'Reverse in groups']
-            },
-            {
-              title: 'Trees & Graphs',
-              content: 'Hierarchical & Network structures',
-              formulas: ['DFS: O(V+E)', 'BFS: O(V+E)', 'Dijkstra: O(E log V)'],
-              keyPoints: ['Traversals', 'Shortest paths', 'MST algorithms'],
-              examples: ['Binary search tree', 'Level order traversal', 'Topological sort']
-            }
-          ]
-        },
-        dbms: {
-          name: 'Database Management Systems',
-          topics: [
-            {
-              title: 'SQL Fundamentals',
-              content: 'DDL, DML, DCL commands',
-              formulas: ['SELECT * FROM table WHERE condition', 'JOIN operations'],
-              keyPoints: ['CRUD operations', 'Aggregate functions', 'GROUP BY'],
-              examples: ['Find top salaries', 'Join multiple tables', 'Subqueries']
-            },
-            {
-              title: 'Normalization',
-              content: 'Remove redundancy',
-              formulas: ['1NF→2NF→3NF→BCNF'],
-              keyPoints: ['Functional dependencies', 'Decomposition'],
-              examples: ['Student-Course database', 'Employee records']
-            }
-          ]
-        },
-        os: {
-          name: 'Operating Systems',
-          topics: [
-            {
-              title: 'Process Scheduling',
-              content: 'CPU allocation algorithms',
-              formulas: ['Turnaround = Completion - Arrival', 'Waiting = Turnaround - Burst'],
-              keyPoints: ['FCFS, SJF, RR, Priority', 'Preemptive vs Non-preemptive'],
-              examples: ['Calculate average waiting time', 'Gantt charts']
-            },
-            {
-              title: 'Memory Management',
-              content: 'Paging, Segmentation',
-              formulas: ['Physical = Frame# + Offset', 'Page fault calculation'],
-              keyPoints: ['Virtual memory', 'Page replacement', 'TLB'],
-              examples: ['FIFO page replacement', 'LRU algorithm']
-            }
-          ]
-        }
-      }
-    },
-    ece: {
-      name: 'Electronics & Communication',
-      icon: Radio,
-      color: 'purple',
-      subjects: {
-        signals: {
-          name: 'Signals & Systems',
-          topics: [
-            {
-              title: 'Fourier Transform',
-              content: 'Time ↔ Frequency domain',
-              formulas: ['X(ω) = ∫x(t)e^(-jωt)dt'],
-              keyPoints: ['Linearity', 'Time shifting', 'Frequency shifting'],
-              examples: ['Rectangular pulse', 'Sinusoidal signals']
-            }
-          ]
-        },
-        analog: {
-          name: 'Analog Electronics',
-          topics: [
-            {
-              title: 'Op-Amp Circuits',
-              content: 'Operational Amplifier applications',
-              formulas: ['Inverting: Vo = -(Rf/Ri)Vi', 'Non-inverting: Vo = (1+Rf/Ri)Vi'],
-              keyPoints: ['Virtual ground', 'High input impedance'],
-              examples: ['Summing amplifier', 'Integrator', 'Differentiator']
-            }
-          ]
-        }
-      }
-    },
-    ee: {
-      name: 'Electrical Engineering',
-      icon: Zap,
-      color: 'yellow',
-      subjects: {
-        circuits: {
-          name: 'Electric Circuits',
-          topics: [
-            {
-              title: 'Network Theorems',
-              content: 'Circuit simplification',
-              formulas: ['Thevenin: Vth, Rth', 'Norton: In, Rn'],
-              keyPoints: ['Superposition', 'Maximum power transfer'],
-              examples: ['Find Thevenin equivalent', 'Calculate load current']
-            }
-          ]
-        }
-      }
-    },
-    mech: {
-      name: 'Mechanical Engineering',
-      icon: Wrench,
-      color: 'orange',
-      subjects: {
-        thermo: {
-          name: 'Thermodynamics',
-          topics: [
-            {
-              title: 'Carnot Cycle',
-              content: 'Ideal heat engine',
-              formulas: ['η = 1 - TL/TH', 'COP_ref = TL/(TH-TL)'],
-              keyPoints: ['Maximum efficiency', 'Reversible process'],
-              examples: ['Calculate efficiency', 'Refrigeration COP']
-            }
-          ]
-        }
-      }
-    },
-    civil: {
-      name: 'Civil Engineering',
-      icon: Cpu,
-      color: 'green',
-      subjects: {
-        struct: {
-          name: 'Structural Analysis',
-          topics: [
-            {
-              title: 'Beam Analysis',
-              content: 'SFD and BMD',
-              formulas: ['V = dM/dx', 'Deflection formulas'],
-              keyPoints: ['Point loads', 'UDL', 'Moments'],
-              examples: ['Simply supported beam', 'Cantilever beam']
-            }
-          ]
-        }
-      }
-    },
-    chem: {
-      name: 'Chemical Engineering',
-      icon: Droplet,
-      color: 'cyan',
-      subjects: {
-        transport: {
-          name: 'Transport Phenomena',
-          topics: [
-            {
-              title: 'Heat Transfer',
-              content: 'Conduction, Convection, Radiation',
-              formulas: ['Fourier: q = -kA(dT/dx)', 'Newton: q = hA∆T'],
-              keyPoints: ['Thermal conductivity', 'Heat exchangers'],
-              examples: ['Wall heat loss', 'Heat exchanger design']
-            }
-          ]
-        }
-      }
-    }
-  };
-
-  const modes = {
-    btech: { name: 'B.Tech Studies', icon: BookOpen, color: 'cyan' },
-    cybersec: { name: 'Cybersecurity', icon: Globe, color: 'red' },
-    ai: { name: 'AI Chat', icon: Brain, color: 'purple' },
-    calculator: { name: 'Calculator', icon: Calculator, color: 'green' },
-    notes: { name: 'Notes', icon: FileText, color: 'yellow' }
-  };
-
-  const handleAIQuery = async (query) => {
-    const newMessages = [...chatMessages, { type: 'user', text: query }];
-    setChatMessages(newMessages);
-    
-    // Simulate AI response based on query
-    let response = '';
-    const lowerQuery = query.toLowerCase();
-    
-    if (lowerQuery.includes('explain') || lowerQuery.includes('what is')) {
-      response = `Let me explain that concept: This is a comprehensive topic that involves multiple aspects. ${lowerQuery.includes('algorithm') ? 'Algorithms are step-by-step procedures for calculations. Key points include time complexity, space complexity, and optimization techniques.' : 'This concept relates to your selected branch and involves theoretical and practical applications.'}`;
-    } else if (lowerQuery.includes('formula')) {
-      response = 'Here are the key formulas related to your query. Would you like me to explain any specific formula in detail?';
-    } else if (lowerQuery.includes('example') || lowerQuery.includes('solve')) {
-      response = 'Let me provide a step-by-step solution:\n1. Identify the given parameters\n2. Apply the relevant formula\n3. Calculate the result\n4. Verify the answer';
-    } else if (lowerQuery.includes('difference')) {
-      response = 'Here are the key differences in a comparison table format, highlighting the main distinctions between the concepts.';
-    } else {
-      response = `I understand you're asking about "${query}". Based on your current branch (${branches[selectedBranch]?.name}), I can help you with concepts, formulas, problem-solving, and explanations. What specific aspect would you like to explore?`;
-    }
-    
-    setChatMessages([...newMessages, { type: 'ai', text: response }]);
-    setInputValue('');
-  };
-
-  const addToFavorites = (item) => {
-    if (!favorites.find(f => f.id === item.id)) {
-      setFavorites([...favorites, item]);
-    }
-  };
-
-  const renderBTechMode = () => {
-    const currentBranch = branches[selectedBranch];
-    const BranchIcon = currentBranch?.icon;
-
-    return (
-      <div>
-        <div className="mb-6">
-          <h2 className="text-lg font-semibold mb-3">Select Branch:</h2>
-          <div className="grid grid-cols-2 md:grid-cols-3 lg:grid-cols-6 gap-3">
-            {Object.entries(branches).map(([key, branch]) => {
-              const Icon = branch.icon;
-              return (
-                <button
-                  key={key}
-                  onClick={() => {
-                    setSelectedBranch(key);
-                    setSelectedSubject(null);
-                  }}
-                  className={`p-4 rounded-lg border-2 transition flex flex-col items-center gap-2 ${
-                    selectedBranch === key
-                      ? `border-${branch.color}-500 bg-${branch.color}-900/20`
-                      : 'border-gray-700 bg-gray-800 hover:border-gray-600'
-                  }`}
-                >
-                  <Icon className="w-8 h-8" />
-                  <span className="text-xs font-semibold text-center">{branch.name}</span>
-                </button>
-              );
-            })}
-          </div>
-        </div>
-
-        {currentBranch && (
-          <>
-            <div className="mb-6">
-              <div className="flex items-center gap-3 mb-3">
-                <BranchIcon className="w-6 h-6" />
-                <h2 className="text-xl font-bold">{currentBranch.name}</h2>
-              </div>
-              
-              <div className="grid grid-cols-2 md:grid-cols-3 lg:grid-cols-4 gap-3">
-                {Object.entries(currentBranch.subjects).map(([key, subject]) => (
-                  <button
-                    key={key}
-                    onClick={() => setSelectedSubject(key)}
-                    className={`p-3 rounded-lg border transition ${
-                      selectedSubject === key
-                        ? 'border-cyan-500 bg-cyan-900/30'
-                        : 'border-gray-700 bg-gray-800 hover:border-gray-600'
-                    }`}
-                  >
-                    <span className="text-sm font-semibold">{subject.name}</span>
-                  </button>
-                ))}
-              </div>
-            </div>
-
-            {selectedSubject && (
-              <div className="space-y-3">
-                {currentBranch.subjects[selectedSubject].topics.map((topic, idx) => {
-                  const topicKey = `${selectedSubject}-${idx}`;
-                  const isExpanded = expandedTopics[topicKey];
-                  const isFavorite = favorites.find(f => f.id === topicKey);
-                  
-                  return (
-                    <div key={idx} className="bg-gray-800 rounded-lg border border-gray-700">
-                      <div className="p-4 flex items-center justify-between">
-                        <button
-                          onClick={() => setExpandedTopics(prev => ({ ...prev, [topicKey]: !prev[topicKey] }))}
-                          className="flex-1 text-left flex items-center gap-3"
-                        >
-                          <span className="font-semibold text-cyan-300">{topic.title}</span>
-                        </button>
-                        <div className="flex items-center gap-2">
-                          <button
-                            onClick={() => addToFavorites({ id: topicKey, ...topic, subject: currentBranch.subjects[selectedSubject].name })}
-                            className={`p-2 rounded hover:bg-gray-700 ${isFavorite ? 'text-yellow-400' : 'text-gray-400'}`}
-                          >
-                            <Star className="w-4 h-4" fill={isFavorite ? 'currentColor' : 'none'} />
-                          </button>
-                          {isExpanded ? <ChevronUp className="w-5 h-5" /> : <ChevronDown className="w-5 h-5" />}
-                        </div>
-                      </div>
-                      
-                      {isExpanded && (
-                        <div className="px-4 pb-4 space-y-3">
-                          <p className="text-sm text-gray-400">{topic.content}</p>
-                          
-                          {settings.showFormulas && topic.formulas && (
-                            <div className="bg-gray-900 p-3 rounded">
-                              <h4 className="text-sm font-semibold text-yellow-400 mb-2">📐 Formulas:</h4>
-                              <ul className="space-y-1">
-                                {topic.formulas.map((formula, i) => (
-                                  <li key={i} className="text-sm font-mono text-gray-300">{formula}</li>
-                                ))}
-                              </ul>
-                            </div>
-                          )}
-                          
-                          {settings.showKeyPoints && topic.keyPoints && (
-                            <div className="bg-gray-900 p-3 rounded">
-                              <h4 className="text-sm font-semibold text-green-400 mb-2">💡 Key Points:</h4>
-                              <ul className="space-y-1">
-                                {topic.keyPoints.map((point, i) => (
-                                  <li key={i} className="text-sm text-gray-300">• {point}</li>
-                                ))}
-                              </ul>
-                            </div>
-                          )}
-                          
-                          {topic.examples && (
-                            <div className="bg-gray-900 p-3 rounded">
-                              <h4 className="text-sm font-semibold text-blue-400 mb-2">📝 Examples:</h4>
-                              <ul className="space-y-1">
-                                {topic.examples.map((example, i) => (
-                                  <li key={i} className="text-sm text-gray-300">• {example}</li>
-                                ))}
-                              </ul>
-                            </div>
-                          )}
-                        </div>
-                      )}
-                    </div>
-                  );
-                })}
-              </div>
-            )}
-          </>
-        )}
-      </div>
-    );
-  };
-
-  const renderAIChat = () => (
-    <div className="h-[600px] flex flex-col">
-      <div className="flex-1 overflow-y-auto p-4 space-y-4 bg-gray-900 rounded-lg mb-4">
-        {chatMessages.length === 0 ? (
-          <div className="text-center py-20">
-            <Brain className="w-16 h-16 text-gray-600 mx-auto mb-4" />
-            <p className="text-gray-400">Ask me anything about your studies!</p>
-            <div className="mt-4 grid grid-cols-2 gap-2 max-w-md mx-auto">
-              <button onClick={() => handleAIQuery('Explain time complexity')} className="p-2 bg-gray-800 rounded text-sm hover:bg-gray-700">
-                Explain time complexity
-              </button>
-              <button onClick={() => handleAIQuery('What is normalization?')} className="p-2 bg-gray-800 rounded text-sm hover:bg-gray-700">
-                What is normalization?
-              </button>
-              <button onClick={() => handleAIQuery('Solve circuit problem')} className="p-2 bg-gray-800 rounded text-sm hover:bg-gray-700">
-                Solve circuit problem
-              </button>
-              <button onClick={() => handleAIQuery('Difference between TCP and UDP')} className="p-2 bg-gray-800 rounded text-sm hover:bg-gray-700">
-                TCP vs UDP
-              </button>
-            </div>
-          </div>
-        ) : (
-          chatMessages.map((msg, idx) => (
-            <div key={idx} className={`flex ${msg.type === 'user' ? 'justify-end' : 'justify-start'}`}>
-              <div className={`max-w-3xl p-3 rounded-lg ${
-                msg.type === 'user' ? 'bg-cyan-600' : 'bg-gray-800'
-              }`}>
-                <p className="text-sm whitespace-pre-line">{msg.text}</p>
-              </div>
-            </div>
-          ))
-        )}
-      </div>
-      <div className="flex gap-2">
-        <input
-          type="text"
-          value={inputValue}
-          onChange={(e) => setInputValue(e.target.value)}
-          onKeyPress={(e) => e.key === 'Enter' && inputValue && handleAIQuery(inputValue)}
-          placeholder="Ask anything about your studies..."
-          className="flex-1 bg-gray-800 px-4 py-3 rounded-lg border border-gray-700 focus:outline-none focus:border-cyan-500"
-        />
-        <button
-          onClick={() => inputValue && handleAIQuery(inputValue)}
-          className="px-6 py-3 bg-cyan-600 hover:bg-cyan-700 rounded-lg transition font-semibold"
-        >
-          Send
-        </button>
-      </div>
-    </div>
-  );
-
-  const renderSettings = () => (
-    <div className="space-y-6">
-      <h2 className="text-2xl font-bold mb-4">Customization Settings</h2>
-      
-      <div className="grid md:grid-cols-2 gap-6">
-        <div className="space-y-4">
-          <div>
-            <label className="block text-sm font-semibold mb-2">Default Mode</label>
-            <select
-              value={settings.defaultMode}
-              onChange={(e) => setSettings({...settings, defaultMode: e.target.value})}
-              className="w-full bg-gray-800 border border-gray-700 rounded px-3 py-2"
-            >
-              {Object.entries(modes).map(([key, mode]) => (
-                <option key={key} value={key}>{mode.name}</option>
-              ))}
-            </select>
-          </div>
-
-          <div>
-            <label className="block text-sm font-semibold mb-2">Default Branch</label>
-            <select
-              value={settings.defaultBranch}
-              onChange={(e) => setSettings({...settings, defaultBranch: e.target.value})}
-              className="w-full bg-gray-800 border border-gray-700 rounded px-3 py-2"
-            >
-              {Object.entries(branches).map(([key, branch]) => (
-                <option key={key} value={key}>{branch.name}</option>
-              ))}
-            </select>
-          </div>
-
-          <div>
-            <label className="block text-sm font-semibold mb-2">Font Size</label>
-            <select
-              value={settings.fontSize}
-              onChange={(e) => setSettings({...settings, fontSize: e.target.value})}
-              className="w-full bg-gray-800 border border-gray-700 rounded px-3 py-2"
-            >
-              <option value="small">Small</option>
-              <option value="medium">Medium</option>
-              <option value="large">Large</option>
-            </select>
-          </div>
-
-          <div>
-            <label className="block text-sm font-semibold mb-2">AI Model</label>
-            <select
-              value={settings.aiModel}
-              onChange={(e) => setSettings({...settings, aiModel: e.target.value})}
-              className="w-full bg-gray-800 border border-gray-700 rounded px-3 py-2"
-            >
-              <option value="basic">Basic (Fast)</option>
-              <option value="advanced">Advanced (Smart)</option>
-              <option value="expert">Expert (Detailed)</option>
-            </select>
-          </div>
-        </div>
-
-        <div className="space-y-4">
-          <div className="flex items-center justify-between p-3 bg-gray-800 rounded">
-            <span className="text-sm font-semibold">Show Formulas</span>
-            <button
-              onClick={() => setSettings({...settings, showFormulas: !settings.showFormulas})}
-              className={`w-12 h-6 rounded-full transition ${settings.showFormulas ? 'bg-cyan-600' : 'bg-gray-600'}`}
-            >
-              <div className={`w-5 h-5 bg-white rounded-full transition transform ${settings.showFormulas ? 'translate-x-6' : 'translate-x-1'}`} />
-            </button>
-          </div>
-
-          <div className="flex items-center justify-between p-3 bg-gray-800 rounded">
-            <span className="text-sm font-semibold">Show Key Points</span>
-            <button
-              onClick={() => setSettings({...settings, showKeyPoints: !settings.showKeyPoints})}
-              className={`w-12 h-6 rounded-full transition ${settings.showKeyPoints ? 'bg-cyan-600' : 'bg-gray-600'}`}
-            >
-              <div className={`w-5 h-5 bg-white rounded-full transition transform ${settings.showKeyPoints ? 'translate-x-6' : 'translate-x-1'}`} />
-            </button>
-          </div>
-
-          <div className="flex items-center justify-between p-3 bg-gray-800 rounded">
-            <span className="text-sm font-semibold">Auto-Save Progress</span>
-            <button
-              onClick={() => setSettings({...settings, autoSave: !settings.autoSave})}
-              className={`w-12 h-6 rounded-full transition ${settings.autoSave ? 'bg-cyan-600' : 'bg-gray-600'}`}
-            >
-              <div className={`w-5 h-5 bg-white rounded-full transition transform ${settings.autoSave ? 'translate-x-6' : 'translate-x-1'}`} />
-            </button>
-          </div>
-
-          <div className="flex items-center justify-between p-3 bg-gray-800 rounded">
-            <span className="text-sm font-semibold">Dark Mode</span>
-            <button
-              onClick={() => {
-                setDarkMode(!darkMode);
-                setSettings({...settings, theme: !darkMode ? 'dark' : 'light'});
-              }}
-              className={`w-12 h-6 rounded-full transition ${darkMode ? 'bg-cyan-600' : 'bg-gray-600'}`}
-            >
-              <div className={`w-5 h-5 bg-white rounded-full transition transform ${darkMode ? 'translate-x-6' : 'translate-x-1'}`} />
-            </button>
-          </div>
-        </div>
-      </div>
-
-      <div className="flex gap-3 pt-4 border-t border-gray-700">
-        <button
-          onClick={saveSettings}
-          className="flex items-center gap-2 px-4 py-2 bg-cyan-600 hover:bg-cyan-700 rounded-lg transition"
-        >
-          <Save className="w-4 h-4" />
-          Save Settings
-        </button>
-        <button
-          onClick={exportSettings}
-          className="flex items-center gap-2 px-4 py-2 bg-gray-700 hover:bg-gray-600 rounded-lg transition"
-        >
-          <Download className="w-4 h-4" />
-          Export
-        </button>
-        <label className="flex items-center gap-2 px-4 py-2 bg-gray-700 hover:bg-gray-600 rounded-lg transition cursor-pointer">
-          <Upload className="w-4 h-4" />
-          Import
-          <input type="file" accept=".json" onChange={importSettings} className="hidden" />
-        </label>
-        <button
-          onClick={() => {
-            setSettings({
-              theme: 'dark',
-              fontSize: 'medium',
-              defaultMode: 'btech',
-              defaultBranch: 'cse',
-              showFormulas: true,
-              showKeyPoints: true,
-              autoSave: true,
-              aiModel: 'advanced',
-              language: 'english'
-            });
-          }}
-          className="flex items-center gap-2 px-4 py-2 bg-gray-700 hover:bg-gray-600 rounded-lg transition"
-        >
-          <RefreshCw className="w-4 h-4" />
-          Reset
-        </button>
-      </div>
-
-      <div className="mt-6 p-4 bg-cyan-900/20 border border-cyan-500/50 rounded-lg">
-        <h3 className="font-semibold text-cyan-400 mb-2">💾 Make This Your Default App</h3>
-        <p className="text-sm text-gray-300 mb-3">
-          Your settings are automatically saved and will persist across sessions. You can also export your configuration and import it on other devices.
+import React, { useState, useEffect, useLayoutEffect, useRef, useCallback, lazy, Suspense } from 'react';
+import { BookOpen, Calculator, FileText, Brain, Globe, Settings, Save, Download, Upload, RefreshCw } from 'lucide-react';
+import { CONTENT_VERSION, btech, branchManifest, loadBranch, getLoadedBranch } from './curriculum';
+import { activateDomain } from './curriculum/domain';
+import { createChatLog } from './lib/chatLog';
+import { EMPTY_WINDOW, appendMessages, prependMessages, replaceMessage, trimWindow, contextWindow } from './lib/chatWindow';
+import { getEngine, streamReply, abortError } from './lib/responseEngine';
+import { createResponseCache, responseCacheKey } from './lib/responseCache';
+import { parseFavorites, toggleFavorite } from './lib/favorites';
+import { createAutosave } from './lib/autosave';
+import { buildExportBlob } from './lib/configStream';
+import { createComputeClient } from './lib/computeClient';
+import { createNotesStore } from './lib/notesStore';
+import { mark, measure, marked } from './lib/timing';
+import { createDiagnostics, estimateSize } from './lib/diagnostics';
+import { createStorage, windowStorageBackend, defaultBackend } from './lib/storage';
+import { applyTheme } from './lib/theme';
+import { parsePath, readPrerendered } from './lib/routes';
+import Profiled from './components/Profiled';
+import BTechMode from './components/BTechMode';
+
+// B.Tech is the view shown until saved settings are read, so it ships with
+// the shell. Every other view is its own chunk, imported the first time it
+// is shown or its mode tab is hovered or focused (prefetchView). Views
+// import their own icons.
+const views = {
+  cybersec: () => import('./components/CybersecMode'),
+  ai: () => import('./components/AIChatMode'),
+  calculator: () => import('./components/FormulaCalculator'),
+  notes: () => import('./components/NotesPanel'),
+  diagnostics: () => import('./components/DiagnosticsPanel')
+};
+const loadedViews = new Map();
+
+const loadView = (key) => {
+  if (!loadedViews.has(key)) {
+    loadedViews.set(key, views[key]().catch((error) => {
+      // Let the next attempt retry
+      loadedViews.delete(key);
+      throw error;
+    }));
+  }
+  return loadedViews.get(key);
+};
+
+const prefetchView = (key) => {
+  if (!views[key]) return;
+  loadView(key).catch((error) => {
+    console.error(`Error prefetching the ${key} view:`, error);
+  });
+};
+
+const CybersecMode = lazy(() => loadView('cybersec'));
+const AIChatMode = lazy(() => loadView('ai'));
+const FormulaCalculator = lazy(() => loadView('calculator'));
+const NotesPanel = lazy(() => loadView('notes'));
+const DiagnosticsPanel = lazy(() => loadView('diagnostics'));
+
+const modes = {
+  btech: { name: 'B.Tech Studies', icon: BookOpen, color: 'cyan' },
+  cybersec: { name: 'Cybersecurity', icon: Globe, color: 'red' },
+  ai: { name: 'AI Chat', icon: Brain, color: 'purple' },
+  calculator: { name: 'Calculator', icon: Calculator, color: 'green' },
+  notes: { name: 'Notes', icon: FileText, color: 'yellow' }
+};
+
+// Search, chat retrieval and JSON (de)serialization of history run in a
+// worker, so typing and scrolling stay responsive while they work
+const compute = createComputeClient(
+  () => new Worker(new URL('./workers/compute.js', import.meta.url), { type: 'module' })
+);
+// Branch key -> promise that settles once the worker has indexed the branch
+const indexedBranches = new Map();
+
+// Settings > Diagnostics
+const diagnostics = createDiagnostics();
+
+// All persisted state goes through one cached, write-back store. Existing
+// data lives in window.storage, so it stays the backend while present
+// (chat history is (de)serialized in the worker); IndexedDB otherwise.
+// Chat segments are read once and kept in the chat window, so caching them
+// as well would only hold the archive in memory.
+const isChatKey = (key) => key.startsWith('chat_');
+const storage = createStorage({
+  backend: typeof window !== 'undefined' && window.storage
+    ? windowStorageBackend({
+      parse: (text, key) => (isChatKey(key) ? compute.call('parseJSON', { text }) : JSON.parse(text)),
+      stringify: (value, key) => (isChatKey(key) ? compute.call('stringifyJSON', { value }) : JSON.stringify(value))
+    })
+    : defaultBackend(),
+  shouldCache: key => !key.startsWith('chat_log:'),
+  onOperation: diagnostics.recordStorage
+});
+
+const chatLog = createChatLog(storage);
+
+const responseCache = createResponseCache({ storage, version: CONTENT_VERSION });
+
+const autosave = createAutosave();
+
+// Notes are saved through the same debounced writer as everything else
+const notesStore = createNotesStore({ storage, schedule: autosave.schedule });
+
+// A /learn/... URL (lib/routes.js) opens that branch, subject and topic
+// instead of the saved defaults. A prerendered page (scripts/prerender.mjs)
+// also carries the branch's content, so its view renders without a fetch.
+const deepLink = typeof location !== 'undefined' ? parsePath(location.pathname, branchManifest) : null;
+const prerendered = readPrerendered();
+if (prerendered && branchManifest[prerendered.branch]) {
+  btech.seed(prerendered.branch, prerendered.content);
+}
+const startBranch = deepLink?.branch ?? 'cse';
+
+// Offline support: caches the app shell and curriculum (see public/sw.js)
+if (typeof navigator !== 'undefined' && 'serviceWorker' in navigator) {
+  window.addEventListener('load', () => {
+    navigator.serviceWorker.register('/sw.js').catch((error) => {
+      console.error('Service worker registration failed:', error);
+    });
+  });
+}
+
+export default function UltimateAIAssistant() {
+  const [mode, setMode] = useState('btech');
+  const [selectedBranch, setSelectedBranch] = useState(startBranch);
+  const [selectedSubject, setSelectedSubject] = useState(deepLink?.subject ?? null);
+  const [expandedTopics, setExpandedTopics] = useState(() => (deepLink?.topicKey ? { [deepLink.topicKey]: true } : {}));
+  const [searchQuery, setSearchQuery] = useState('');
+  const [showSettings, setShowSettings] = useState(false);
+  // Recent chat messages and the global index of the first one (see
+  // lib/chatWindow.js); older messages stay in storage until scrolled to
+  const [chat, setChat] = useState(EMPTY_WINDOW);
+  const { messages: chatMessages, base: chatBase } = chat;
+  const [inputValue, setInputValue] = useState('');
+  const [favorites, setFavorites] = useState(() => new Set());
+  const [branchContent, setBranchContent] = useState(() => getLoadedBranch(startBranch));
+  // False until the saved settings (or their absence) are known, so the
+  // default branch is not loaded only to be replaced
+  const [settingsReady, setSettingsReady] = useState(false);
+  const [indexVersion, setIndexVersion] = useState(0);
+  const [searchResults, setSearchResults] = useState([]);
+  // Topic formula last opened in the calculator, if any
+  const [calculatorFormula, setCalculatorFormula] = useState(null);
+  // Topic ({ key, title }) the Notes panel was last opened from, if any
+  const [notesTopic, setNotesTopic] = useState(null);
+  // Cybersecurity content domain, imported the first time its mode is opened
+  const [cybersecDomain, setCybersecDomain] = useState(null);
+  const loadingOlderChat = useRef(false);
+  // { controller, message } for the reply currently streaming in, if any
+  const streamingReply = useRef(null);
+  
+  // Customization settings
+  const [settings, setSettings] = useState({
+    theme: 'dark',
+    fontSize: 'medium',
+    defaultMode: 'btech',
+    defaultBranch: 'cse',
+    showFormulas: true,
+    showKeyPoints: true,
+    autoSave: true,
+    compressExport: false,
+    aiModel: 'advanced',
+    contextWindow: 10,
+    diagnostics: false,
+    language: 'english'
+  });
+  const darkMode = settings.theme === 'dark';
+
+  // Latest state for the autosave writers, which run after a delay
+  const latest = useRef({});
+  latest.current = { settings, favorites, chatMessages, chatBase };
+  // Autosave stays off until saved state has been loaded, so the defaults
+  // never overwrite it
+  const hydrated = useRef(false);
+  // Chat history is loaded the first time the AI Chat tab is opened
+  const chatLoadStarted = useRef(false);
+  const chatHydrated = useRef(false);
+  // Last value read from or written to each storage key, to skip no-op writes
+  const savedValues = useRef({});
+  // Global index up to which chat history was last archived
+  const archivedEnd = useRef(0);
+
+  // Load saved state on mount. The reads run concurrently and each result is
+  // applied as soon as it arrives, so a slow or failing key does not hold up
+  // the others; settings in particular decide the first mode and branch.
+  useEffect(() => {
+    mark('hydrate:start');
+
+    const loadSettings = async () => {
+      try {
+        const parsed = await storage.get('user_settings');
+        if (parsed) {
+          savedValues.current.user_settings = parsed;
+          setSettings(parsed);
+          // A deep link keeps the view it opened
+          if (!deepLink) {
+            // Start on the saved mode's chunk before React gets to render it
+            prefetchView(parsed.defaultMode);
+            setMode(parsed.defaultMode);
+            setSelectedBranch(parsed.defaultBranch);
+          }
+        }
+      } catch (error) {
+        console.log('No saved settings found, using defaults');
+      } finally {
+        setSettingsReady(true);
+        mark('hydrate:settings');
+      }
+    };
+
+    const loadFavorites = async () => {
+      try {
+        const stored = await storage.get('favorites');
+        if (stored) {
+          const parsed = parseFavorites(stored);
+          savedValues.current.favorites = parsed;
+          setFavorites(parsed);
+          // Rewrite the old full-topic-copy format as plain topic keys
+          if (Array.isArray(stored) && stored.some(item => typeof item !== 'string')) {
+            await storage.set('favorites', [...parsed]);
+          }
+        }
+      } catch (error) {
+        console.log('No favorites found');
+      }
+    };
+
+    const loadResponseCache = async () => {
+      try {
+        await responseCache.load();
+      } catch (error) {
+        console.log('No cached responses found');
+      }
+    };
+
+    Promise.all([loadSettings(), loadFavorites(), loadResponseCache()]).then(() => {
+      hydrated.current = true;
+      mark('hydrate:end');
+      measure('hydrate', 'hydrate:start', 'hydrate:end');
+    });
+  }, []);
+
+  // Chat history is only needed once the AI Chat tab is opened
+  useEffect(() => {
+    if (mode !== 'ai' || chatLoadStarted.current) return;
+    chatLoadStarted.current = true;
+    mark('chat:load-start');
+    chatLog.loadRecent()
+      .then(({ messages, base }) => {
+        // Keep anything sent while the history was loading
+        setChat(prev => prependMessages(prev, messages, base));
+        mark('chat:load-end');
+        measure('chat:load', 'chat:load-start', 'chat:load-end');
+      })
+      .catch(() => {
+        console.log('No chat history found');
+      })
+      .finally(() => {
+        chatHydrated.current = true;
+      });
+  }, [mode]);
+
+  // Time to interactive: settings applied and the starting branch's content
+  // on screen
+  useEffect(() => {
+    if (settingsReady && branchContent && !marked('app:interactive')) {
+      mark('app:interactive');
+      measure('time-to-interactive', undefined, 'app:interactive');
+    }
+  }, [settingsReady, branchContent]);
+
+  // `source` is the state the stored `value` was made from; state is
+  // immutable, so an unchanged object needs no write
+  const writeValue = async (key, source, value = source) => {
+    if (savedValues.current[key] === source) return;
+    await storage.set(key, value);
+    savedValues.current[key] = source;
+  };
+
+  const persistSettings = () => writeValue('user_settings', latest.current.settings);
+
+  const persistFavorites = () => writeValue('favorites', latest.current.favorites, [...latest.current.favorites]);
+
+  const persistChat = async () => {
+    // Until the stored history is in memory there is nothing new to append
+    if (!chatHydrated.current) return;
+    const { chatMessages: messages, chatBase: base } = latest.current;
+    // The log is append-only, so leave a reply that is still streaming
+    // (always the last message) for the next save
+    const settled = streamingReply.current ? messages.slice(0, -1) : messages;
+    await chatLog.sync(settled, base);
+    // Everything up to the streaming reply is archived now. Trim the oldest
+    // messages from memory only when new ones arrived, so pages scrolled
+    // back to are not dropped while they are being read.
+    const end = base + settled.length;
+    if (end > archivedEnd.current) {
+      archivedEnd.current = end;
+      setChat(prev => trimWindow(prev, end));
+    }
+  };
+
+  useEffect(() => {
+    diagnostics.setEnabled(settings.diagnostics);
+  }, [settings.diagnostics]);
+
+  // Theme and font size are CSS variables on the document root, so no view
+  // re-renders for them (lib/theme.js). Applied before the first paint, as
+  // the colors of every view come from the variables.
+  useLayoutEffect(() => {
+    applyTheme({ theme: settings.theme, fontSize: settings.fontSize });
+  }, [settings.theme, settings.fontSize]);
+
+  // Autosave: settings always, favorites and chat while Auto-Save is on
+  useEffect(() => {
+    if (hydrated.current) {
+      autosave.schedule('user_settings', persistSettings);
+    }
+  }, [settings]);
+
+  useEffect(() => {
+    if (hydrated.current && settings.autoSave) {
+      autosave.schedule('favorites', persistFavorites);
+    }
+  }, [favorites, settings.autoSave]);
+
+  useEffect(() => {
+    if (chatHydrated.current && settings.autoSave) {
+      autosave.schedule('chat_log', persistChat);
+    }
+  }, [chat, settings.autoSave]);
+
+  // Write anything pending before the page goes away
+  useEffect(() => {
+    const flushPending = () => {
+      autosave.flush();
+      responseCache.flush().catch((error) => console.error('Error saving response cache:', error));
+      storage.flush().catch((error) => console.error('Error writing storage:', error));
+    };
+    const handleVisibilityChange = () => {
+      if (document.visibilityState === 'hidden') {
+        flushPending();
+      }
+    };
+    document.addEventListener('visibilitychange', handleVisibilityChange);
+    window.addEventListener('pagehide', flushPending);
+    return () => {
+      document.removeEventListener('visibilitychange', handleVisibilityChange);
+      window.removeEventListener('pagehide', flushPending);
+    };
+  }, []);
+
+  // Only the active content domain stays in memory: opening Cybersecurity
+  // evicts the loaded B.Tech branches, and leaving it evicts its tracks
+  const inCybersec = mode === 'cybersec';
+  useEffect(() => {
+    if (!inCybersec) {
+      activateDomain('btech');
+      return undefined;
+    }
+    let cancelled = false;
+    import('./curriculum/cybersec')
+      .then(({ cybersec }) => {
+        // Left Cybersecurity before it loaded: B.Tech stays active
+        if (!cancelled) {
+          activateDomain(cybersec.id);
+          setCybersecDomain(cybersec);
+        }
+      })
+      .catch((error) => {
+        console.error('Error loading Cybersecurity content:', error);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [inCybersec]);
+
+  // Load the selected branch's subjects and topics on demand
+  useEffect(() => {
+    if (!settingsReady) return undefined;
+    if (inCybersec) {
+      setBranchContent(null);
+      return undefined;
+    }
+    let cancelled = false;
+    setBranchContent(getLoadedBranch(selectedBranch));
+    loadBranch(selectedBranch)
+      .then((content) => {
+        if (!cancelled) {
+          setBranchContent(content);
+        }
+      })
+      .catch((error) => {
+        console.error('Error loading branch content:', error);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [selectedBranch, settingsReady, inCybersec]);
+
+  // Index every branch the first time search needs it
+  const ensureSearchIndex = () => Promise.all(Object.keys(branchManifest).map((key) => {
+    if (!indexedBranches.has(key)) {
+      indexedBranches.set(key, compute.call('index', { branch: key })
+        .then(() => {
+          setIndexVersion(v => v + 1);
+        })
+        .catch((error) => {
+          indexedBranches.delete(key);
+          console.error('Error indexing branch content:', error);
+        }));
+    }
+    return indexedBranches.get(key);
+  }));
+
+  // indexVersion re-runs the query as more branches finish indexing
+  useEffect(() => {
+    if (!searchQuery.trim()) {
+      setSearchResults([]);
+      return undefined;
+    }
+    let stale = false;
+    compute.call('search', { query: searchQuery, limit: 8 })
+      .then((results) => {
+        if (!stale) {
+          setSearchResults(results);
+        }
+      })
+      .catch((error) => {
+        console.error('Error searching topics:', error);
+      });
+    return () => {
+      stale = true;
+    };
+  }, [searchQuery, indexVersion]);
+
+  const openSearchResult = (result) => {
+    setSelectedBranch(result.branch);
+    setSelectedSubject(result.subject);
+    setExpandedTopics(prev => ({ ...prev, [result.topicKey]: true }));
+    setSearchQuery('');
+  };
+
+  // Save settings now instead of waiting for the autosave delay
+  const saveSettings = async () => {
+    autosave.schedule('user_settings', persistSettings);
+    autosave.schedule('favorites', persistFavorites);
+    if (settings.autoSave) {
+      autosave.schedule('chat_log', persistChat);
+    }
+    const failed = await autosave.flush();
+    if (failed.length === 0) {
+      alert('Settings saved successfully!');
+    } else {
+      alert('Failed to save settings');
+    }
+  };
+
+  // Export settings. The file is assembled page by page from the stored
+  // history, including pages that were never loaded into memory.
+  // The stored history, then the messages in memory past its end (only
+  // unsaved ones while Auto-Save is off). A reply still streaming is left out.
+  async function* chatPages() {
+    let stored = 0;
+    for await (const page of chatLog.pages()) {
+      stored += page.length;
+      yield page;
+    }
+    const { chatMessages: messages, chatBase: base } = latest.current;
+    const settled = streamingReply.current ? messages.slice(0, -1) : messages;
+    const unsaved = settled.slice(Math.max(0, stored - base));
+    if (unsaved.length > 0) yield unsaved;
+  }
+
+  const exportSettings = async () => {
+    if (settings.autoSave) {
+      // Store anything unsaved first
+      autosave.schedule('chat_log', persistChat);
+      await autosave.flush();
+    }
+    const pages = chatPages();
+    const compress = settings.compressExport && typeof CompressionStream !== 'undefined';
+    const encodePage = (page, separator) => compute.call('encodeJSON', { values: page, separator });
+    const blob = await buildExportBlob({ settings, favorites, pages, encodePage, compress });
+    const url = URL.createObjectURL(blob);
+    const a = document.createElement('a');
+    a.href = url;
+    a.download = compress ? 'ai-assistant-config.json.gz' : 'ai-assistant-config.json';
+    a.click();
+    setTimeout(() => URL.revokeObjectURL(url), 0);
+  };
+
+  // Rough size of the main pieces of state, for the diagnostics panel
+  const estimateMemory = () => ({
+    Settings: estimateSize(settings),
+    Favorites: estimateSize([...favorites]),
+    'Chat window': estimateSize(chatMessages),
+    'Branch content': estimateSize(branchContent)
+  });
+
+  const exportTrace = () => {
+    const trace = diagnostics.trace({ memory: estimateMemory(), storage: storage.stats(), responseCache: responseCache.stats() });
+    const blob = new Blob([JSON.stringify(trace)], { type: 'application/json' });
+    const url = URL.createObjectURL(blob);
+    const a = document.createElement('a');
+    a.href = url;
+    a.download = 'ai-assistant-trace.json';
+    a.click();
+    setTimeout(() => URL.revokeObjectURL(url), 0);
+  };
+
+  // Import settings. The file is parsed in the worker and merged into the
+  // current state: settings override, favorites are added, and chat history
+  // is appended to what is already stored.
+  const importSettings = async (event) => {
+    const file = event.target.files[0];
+    event.target.value = '';
+    if (!file) return;
+
+    const storeChat = settings.autoSave;
+    const storeMessages = chatLog.importer();
+    const unstored = [];
+    // Stored batches are written one after another, behind any unsaved chat
+    let storing = Promise.resolve();
+    if (storeChat) {
+      autosave.schedule('chat_log', persistChat);
+      storing = autosave.flush();
+    }
+
+    try {
+      const stats = await compute.call('importConfig', { file }, {
+        onEvent: (event, value) => {
+          if (event === 'settings') {
+            setSettings(prev => ({ ...prev, ...value }));
+          } else if (event === 'favorites') {
+            setFavorites(prev => new Set([...prev, ...value]));
+          } else if (storeChat) {
+            storing = storing.then(() => storeMessages(value));
+          } else {
+            unstored.push(...value);
+          }
+        }
+      });
+      await storing;
+      if (storeChat) {
+        setChat(await chatLog.loadRecent());
+        chatLoadStarted.current = true;
+        chatHydrated.current = true;
+      } else if (unstored.length > 0) {
+        setChat(prev => appendMessages(prev, unstored));
+      }
+      alert(stats.skipped > 0
+        ? `Settings imported successfully! (${stats.skipped} invalid chat messages skipped)`
+        : 'Settings imported successfully!');
+    } catch (error) {
+      console.error('Error importing settings:', error);
+      alert('Invalid configuration file');
+    }
+  };
+
+  // Intent plus the best matching topics for a chat query
+  const handleAIQuery = async (query) => {
+    // A new question cancels the reply still being streamed
+    streamingReply.current?.controller.abort();
+    streamingReply.current = null;
+    setInputValue('');
+    const start = performance.now();
+    // Conversation so far, up to the configured context window
+    const history = contextWindow(chatMessages, settings.contextWindow);
+
+    const cacheKey = responseCacheKey(query, selectedBranch, settings.aiModel);
+    const cached = responseCache.get(cacheKey);
+    if (cached !== null) {
+      setChat(prev => appendMessages(prev, [{ type: 'user', text: query }, { type: 'ai', text: cached }]));
+      diagnostics.recordReply({ start, cached: true });
+      return;
+    }
+
+    const reply = { controller: new AbortController(), message: { type: 'ai', text: '' } };
+    streamingReply.current = reply;
+    setChat(prev => appendMessages(prev, [{ type: 'user', text: query }, reply.message]));
+
+    let firstChunkMs = null;
+    const update = (text) => {
+      if (firstChunkMs === null) firstChunkMs = performance.now() - start;
+      const next = { type: 'ai', text };
+      const target = reply.message;
+      setChat(prev => replaceMessage(prev, target, next));
+      reply.message = next;
+    };
+
+    try {
+      const { intent, topics } = await compute.call('retrieve', { query });
+      if (reply.controller.signal.aborted) throw abortError();
+      const text = await streamReply(getEngine(settings.aiModel), query, {
+        branch: selectedBranch,
+        branchName: branchManifest[selectedBranch]?.name,
+        intent,
+        topics,
+        history
+      }, { signal: reply.controller.signal, onUpdate: update });
+      responseCache.set(cacheKey, text);
+      diagnostics.recordReply({ start, firstChunkMs, totalMs: performance.now() - start });
+    } catch (error) {
+      if (error.name !== 'AbortError') {
+        console.error('Error generating reply:', error);
+        update('Sorry, something went wrong while answering. Please try again.');
+      } else if (!reply.message.text) {
+        update('(cancelled)');
+      }
+    } finally {
+      if (streamingReply.current === reply) {
+        streamingReply.current = null;
+      }
+    }
+  };
+
+  // Page in the previous chunk of chat history when scrolled to the top
+  const loadOlderMessages = async () => {
+    if (chatBase === 0 || loadingOlderChat.current) return;
+    loadingOlderChat.current = true;
+    try {
+      let older = await chatLog.loadOlder(chatBase);
+      // An autosave may have trimmed the window while the page loaded: ask
+      // for the page before its new start instead
+      while (latest.current.chatBase > 0 && older.base + older.messages.length !== latest.current.chatBase) {
+        older = await chatLog.loadOlder(latest.current.chatBase);
+      }
+      setChat(prev => prependMessages(prev, older.messages, older.base));
+    } catch (error) {
+      console.error('Error loading earlier messages:', error);
+    } finally {
+      loadingOlderChat.current = false;
+    }
+  };
+
+  // Stable callbacks for the memoized curriculum components
+  const handleSelectBranch = useCallback((key) => {
+    setSelectedBranch(key);
+    setSelectedSubject(null);
+  }, []);
+
+  const handleToggleTopic = useCallback((topicKey) => {
+    setExpandedTopics(prev => ({ ...prev, [topicKey]: !prev[topicKey] }));
+  }, []);
+
+  const handleToggleFavorite = useCallback((topicKey) => {
+    setFavorites(prev => toggleFavorite(prev, topicKey));
+  }, []);
+
+  const handleOpenFormula = useCallback((formula) => {
+    setCalculatorFormula(formula);
+    setMode('calculator');
+  }, []);
+
+  const handleOpenNotes = useCallback((topicKey, title) => {
+    setNotesTopic({ key: topicKey, title });
+    setMode('notes');
+  }, []);
+
+  const handleOpenRelated = useCallback(({ branch, subject, topicKey }) => {
+    setSelectedBranch(branch);
+    setSelectedSubject(subject);
+    setExpandedTopics(prev => ({ ...prev, [topicKey]: true }));
+  }, []);
+
+  // Views report render timings to Settings > Diagnostics while it is on.
+  // A view whose chunk is still loading shows a placeholder.
+  const profiled = (id, render) => () => (
+    <Profiled id={id} enabled={settings.diagnostics} onRender={diagnostics.onRender}>
+      <Suspense fallback={<p className="text-sm text-[var(--app-muted)]">Loading...</p>}>
+        {render()}
+      </Suspense>
+    </Profiled>
+  );
+
+  const renderBTechMode = profiled('btech', () => (
+    <BTechMode
+      searchQuery={searchQuery}
+      searchResults={searchResults}
+      onSearchChange={setSearchQuery}
+      onSearchFocus={ensureSearchIndex}
+      onOpenResult={openSearchResult}
+      selectedBranch={selectedBranch}
+      onSelectBranch={handleSelectBranch}
+      branchContent={branchContent}
+      selectedSubject={selectedSubject}
+      onSelectSubject={setSelectedSubject}
+      expandedTopics={expandedTopics}
+      favorites={favorites}
+      showFormulas={settings.showFormulas}
+      showKeyPoints={settings.showKeyPoints}
+      onToggleTopic={handleToggleTopic}
+      onToggleFavorite={handleToggleFavorite}
+      onOpenFormula={handleOpenFormula}
+      onOpenNotes={handleOpenNotes}
+      onOpenRelated={handleOpenRelated}
+    />
+  ));
+
+  const renderAIChat = profiled('ai', () => (
+    <AIChatMode
+      messages={chatMessages}
+      base={chatBase}
+      inputValue={inputValue}
+      onInputChange={setInputValue}
+      onSend={handleAIQuery}
+      onReachTop={loadOlderMessages}
+    />
+  ));
+
+  // Keyed on the formula so opening another one starts from a clean slate
+  const renderCalculator = profiled('calculator', () => (
+    <FormulaCalculator key={calculatorFormula ?? ''} formula={calculatorFormula} />
+  ));
+
+  const renderCybersec = profiled('cybersec', () => (
+    <CybersecMode
+      domain={cybersecDomain}
+      favorites={favorites}
+      showFormulas={settings.showFormulas}
+      showKeyPoints={settings.showKeyPoints}
+      onToggleFavorite={handleToggleFavorite}
+      onOpenFormula={handleOpenFormula}
+      onOpenNotes={handleOpenNotes}
+    />
+  ));
+
+  const renderNotes = profiled('notes', () => (
+    <NotesPanel key={notesTopic?.key ?? ''} store={notesStore} topic={notesTopic} />
+  ));
+
+  const renderSettings = profiled('settings', () => (
+    <div className="space-y-6">
+      <h2 className="text-2xl font-bold mb-4">Customization Settings</h2>
+      
+      <div className="grid md:grid-cols-2 gap-6">
+        <div className="space-y-4">
+          <div>
+            <label className="block text-sm font-semibold mb-2">Default Mode</label>
+            <select
+              value={settings.defaultMode}
+              onChange={(e) => setSettings({...settings, defaultMode: e.target.value})}
+              className="w-full bg-[var(--app-surface)] border border-[var(--app-border)] rounded px-3 py-2"
+            >
+              {Object.entries(modes).map(([key, mode]) => (
+                <option key={key} value={key}>{mode.name}</option>
+              ))}
+            </select>
+          </div>
+
+          <div>
+            <label className="block text-sm font-semibold mb-2">Default Branch</label>
+            <select
+              value={settings.defaultBranch}
+              onChange={(e) => setSettings({...settings, defaultBranch: e.target.value})}
+              className="w-full bg-[var(--app-surface)] border border-[var(--app-border)] rounded px-3 py-2"
+            >
+              {Object.entries(branchManifest).map(([key, branch]) => (
+                <option key={key} value={key}>{branch.name}</option>
+              ))}
+            </select>
+          </div>
+
+          <div>
+            <label className="block text-sm font-semibold mb-2">Font Size</label>
+            <select
+              value={settings.fontSize}
+              onChange={(e) => setSettings({...settings, fontSize: e.target.value})}
+              className="w-full bg-[var(--app-surface)] border border-[var(--app-border)] rounded px-3 py-2"
+            >
+              <option value="small">Small</option>
+              <option value="medium">Medium</option>
+              <option value="large">Large</option>
+            </select>
+          </div>
+
+          <div>
+            <label className="block text-sm font-semibold mb-2">AI Model</label>
+            <select
+              value={settings.aiModel}
+              onChange={(e) => setSettings({...settings, aiModel: e.target.value})}
+              className="w-full bg-[var(--app-surface)] border border-[var(--app-border)] rounded px-3 py-2"
+            >
+              <option value="basic">Basic (Fast)</option>
+              <option value="advanced">Advanced (Smart)</option>
+              <option value="expert">Expert (Detailed)</option>
+            </select>
+          </div>
+
+          <div>
+            <label className="block text-sm font-semibold mb-2">Chat Context</label>
+            <select
+              value={settings.contextWindow}
+              onChange={(e) => setSettings({...settings, contextWindow: Number(e.target.value)})}
+              className="w-full bg-[var(--app-surface)] border border-[var(--app-border)] rounded px-3 py-2"
+            >
+              <option value={0}>None</option>
+              <option value={6}>Last 6 messages</option>
+              <option value={10}>Last 10 messages</option>
+              <option value={20}>Last 20 messages</option>
+            </select>
+          </div>
+        </div>
+
+        <div className="space-y-4">
+          <div className="flex items-center justify-between p-3 bg-[var(--app-surface)] rounded">
+            <span className="text-sm font-semibold">Show Formulas</span>
+            <button
+              onClick={() => setSettings({...settings, showFormulas: !settings.showFormulas})}
+              className={`w-12 h-6 rounded-full transition ${settings.showFormulas ? 'bg-cyan-600' : 'bg-gray-600'}`}
+            >
+              <div className={`w-5 h-5 bg-white rounded-full transition transform ${settings.showFormulas ? 'translate-x-6' : 'translate-x-1'}`} />
+            </button>
+          </div>
+
+          <div className="flex items-center justify-between p-3 bg-[var(--app-surface)] rounded">
+            <span className="text-sm font-semibold">Show Key Points</span>
+            <button
+              onClick={() => setSettings({...settings, showKeyPoints: !settings.showKeyPoints})}
+              className={`w-12 h-6 rounded-full transition ${settings.showKeyPoints ? 'bg-cyan-600' : 'bg-gray-600'}`}
+            >
+              <div className={`w-5 h-5 bg-white rounded-full transition transform ${settings.showKeyPoints ? 'translate-x-6' : 'translate-x-1'}`} />
+            </button>
+          </div>
+
+          <div className="flex items-center justify-between p-3 bg-[var(--app-surface)] rounded">
+            <span className="text-sm font-semibold">Auto-Save Progress</span>
+            <button
+              onClick={() => setSettings({...settings, autoSave: !settings.autoSave})}
+              className={`w-12 h-6 rounded-full transition ${settings.autoSave ? 'bg-cyan-600' : 'bg-gray-600'}`}
+            >
+              <div className={`w-5 h-5 bg-white rounded-full transition transform ${settings.autoSave ? 'translate-x-6' : 'translate-x-1'}`} />
+            </button>
+          </div>
+
+          <div className="flex items-center justify-between p-3 bg-[var(--app-surface)] rounded">
+            <span className="text-sm font-semibold">Compress Exports</span>
+            <button
+              onClick={() => setSettings({...settings, compressExport: !settings.compressExport})}
+              className={`w-12 h-6 rounded-full transition ${settings.compressExport ? 'bg-cyan-600' : 'bg-gray-600'}`}
+            >
+              <div className={`w-5 h-5 bg-white rounded-full transition transform ${settings.compressExport ? 'translate-x-6' : 'translate-x-1'}`} />
+            </button>
+          </div>
+
+          <div className="flex items-center justify-between p-3 bg-[var(--app-surface)] rounded">
+            <span className="text-sm font-semibold">Performance Diagnostics</span>
+            <button
+              onClick={() => setSettings({...settings, diagnostics: !settings.diagnostics})}
+              className={`w-12 h-6 rounded-full transition ${settings.diagnostics ? 'bg-cyan-600' : 'bg-gray-600'}`}
+            >
+              <div className={`w-5 h-5 bg-white rounded-full transition transform ${settings.diagnostics ? 'translate-x-6' : 'translate-x-1'}`} />
+            </button>
+          </div>
+
+          <div className="flex items-center justify-between p-3 bg-[var(--app-surface)] rounded">
+            <span className="text-sm font-semibold">Dark Mode</span>
+            <button
+              onClick={() => setSettings({...settings, theme: darkMode ? 'light' : 'dark'})}
+              className={`w-12 h-6 rounded-full transition ${darkMode ? 'bg-cyan-600' : 'bg-gray-600'}`}
+            >
+              <div className={`w-5 h-5 bg-white rounded-full transition transform ${darkMode ? 'translate-x-6' : 'translate-x-1'}`} />
+            </button>
+          </div>
+        </div>
+      </div>
+
+      <div className="flex gap-3 pt-4 border-t border-[var(--app-border)]">
+        <button
+          onClick={saveSettings}
+          className="flex items-center gap-2 px-4 py-2 bg-cyan-600 hover:bg-cyan-700 rounded-lg transition"
+        >
+          <Save className="w-4 h-4" />
+          Save Settings
+        </button>
+        <button
+          onClick={exportSettings}
+          className="flex items-center gap-2 px-4 py-2 bg-[var(--app-raised)] hover:bg-[var(--app-raised-hover)] rounded-lg transition"
+        >
+          <Download className="w-4 h-4" />
+          Export
+        </button>
+        <label className="flex items-center gap-2 px-4 py-2 bg-[var(--app-raised)] hover:bg-[var(--app-raised-hover)] rounded-lg transition cursor-pointer">
+          <Upload className="w-4 h-4" />
+          Import
+          <input type="file" accept=".json,.gz" onChange={importSettings} className="hidden" />
+        </label>
+        <button
+          onClick={() => {
+            setSettings({
+              theme: 'dark',
+              fontSize: 'medium',
+              defaultMode: 'btech',
+              defaultBranch: 'cse',
+              showFormulas: true,
+              showKeyPoints: true,
+              autoSave: true,
+              compressExport: false,
+              aiModel: 'advanced',
+              contextWindow: 10,
+              diagnostics: false,
+              language: 'english'
+            });
+          }}
+          className="flex items-center gap-2 px-4 py-2 bg-[var(--app-raised)] hover:bg-[var(--app-raised-hover)] rounded-lg transition"
+        >
+          <RefreshCw className="w-4 h-4" />
+          Reset
+        </button>
+      </div>
+
+      {settings.diagnostics && (
+        <div className="p-4 bg-[var(--app-bg)] border border-[var(--app-border)] rounded-lg">
+          <h3 className="font-semibold mb-3">Diagnostics</h3>
+          <Suspense fallback={<p className="text-sm text-[var(--app-muted)]">Loading diagnostics...</p>}>
+            <DiagnosticsPanel diagnostics={diagnostics} storage={storage} estimateMemory={estimateMemory} onExport={exportTrace} />
+          </Suspense>
+        </div>
+      )}
+
+      <div className="mt-6 p-4 bg-cyan-900/20 border border-cyan-500/50 rounded-lg">
+        <h3 className="font-semibold text-cyan-400 mb-2">💾 Make This Your Default App</h3>
+        <p className="text-sm text-[var(--app-text-soft)] mb-3">
+          Your settings are automatically saved and will persist across sessions. You can also export your configuration and import it on other devices.
         </p>
\ No newline at end of file
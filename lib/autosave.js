@@ -0,0 +1,54 @@
+// Debounced, coalescing writer for persisted state.
+//
+// schedule(key, write) marks a storage key dirty with the function that
+// writes its latest value. Scheduling the same key again replaces the
+// pending write, so a burst of edits produces one write per key. After
+// `delay` ms without new changes (or on flush()) all dirty keys are
+// written concurrently. Flushes run one after another, so two writes to the
+// same key never race; a failed write is retried on the next flush unless
+// a newer one has been scheduled meanwhile. flush() resolves with the keys
+// that failed.
+
+export const createAutosave = ({ delay = 800 } = {}) => {
+  const pending = new Map();
+  let timer = null;
+  let running = Promise.resolve();
+
+  const run = async (batch) => {
+    const results = await Promise.allSettled(batch.map(([, write]) => write()));
+    const failed = [];
+    results.forEach((result, i) => {
+      if (result.status === 'rejected') {
+        const [key, write] = batch[i];
+        console.error(`Error saving ${key}:`, result.reason);
+        failed.push(key);
+        if (!pending.has(key)) pending.set(key, write);
+      }
+    });
+    return failed;
+  };
+
+  const flush = () => {
+    clearTimeout(timer);
+    timer = null;
+    running = running.then(() => {
+      if (pending.size === 0) return [];
+      const batch = [...pending];
+      pending.clear();
+      return run(batch);
+    });
+    return running;
+  };
+
+  return {
+    schedule(key, write) {
+      pending.set(key, write);
+      clearTimeout(timer);
+      timer = setTimeout(flush, delay);
+    },
+    flush,
+    get dirty() {
+      return pending.size > 0;
+    }
+  };
+};
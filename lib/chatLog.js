@@ -0,0 +1,233 @@
+// Append-only, segmented chat history in storage (lib/storage.js).
+//
+// Layout:
+//   chat_log        manifest: { version, nextId, segments: [{ id, count }] }
+//   chat_log:<id>   JSON array of messages, oldest first
+//
+// Saving writes only the messages that are not stored yet, as a new
+// segment, and then rewrites the small manifest, so a save costs
+// O(new messages) however long the history is. Runs of small segments are
+// merged into SEGMENT_SIZE ones by a compaction pass scheduled when the
+// browser is idle. Startup reads only the newest page; older messages are
+// read on demand by global index.
+
+const MANIFEST_KEY = 'chat_log';
+const LEGACY_KEY = 'chat_history';
+const SEGMENT_SIZE = 200;
+const PAGE_SIZE = 100;
+// Compact once this many under-full segments have accumulated
+const COMPACT_THRESHOLD = 8;
+
+const segmentKey = (id) => `${MANIFEST_KEY}:${id}`;
+
+const whenIdle = (fn) => {
+  if (typeof requestIdleCallback === 'function') {
+    requestIdleCallback(fn);
+  } else {
+    setTimeout(fn, 0);
+  }
+};
+
+export const createChatLog = (storage) => {
+  let manifest = null;
+  let queue = Promise.resolve();
+  let compactionScheduled = false;
+
+  const read = async (key) => {
+    try {
+      return (await storage.get(key)) ?? null;
+    } catch (error) {
+      return null;
+    }
+  };
+
+  const write = (key, value) => storage.set(key, value);
+
+  const remove = async (key) => {
+    try {
+      await storage.delete(key);
+    } catch (error) {
+      console.log(`Could not delete ${key}`);
+    }
+  };
+
+  // The manifest is updated in place, so storage only ever holds copies of
+  // it (see also open())
+  const writeManifest = () => write(MANIFEST_KEY, { ...manifest, segments: manifest.segments.slice() });
+
+  // Appends, compaction and resets all run one at a time, in call order
+  const enqueue = (task) => {
+    const run = queue.then(task);
+    queue = run.catch(() => {});
+    return run;
+  };
+
+  const total = () => manifest.segments.reduce((sum, segment) => sum + segment.count, 0);
+
+  // The segments go out in one storage batch, then the manifest that
+  // lists them
+  const writeSegments = async (messages) => {
+    const segments = [];
+    const writes = [];
+    for (let i = 0; i < messages.length; i += SEGMENT_SIZE) {
+      const id = manifest.nextId++;
+      const segment = messages.slice(i, i + SEGMENT_SIZE);
+      writes.push(write(segmentKey(id), segment));
+      segments.push({ id, count: segment.length });
+    }
+    await Promise.all(writes);
+    manifest.segments.push(...segments);
+    await writeManifest();
+  };
+
+  // Reads the manifest once, migrating a whole-blob `chat_history` if that
+  // is all there is
+  const open = async () => {
+    if (manifest) return;
+    const stored = await read(MANIFEST_KEY);
+    manifest = stored && { ...stored, segments: stored.segments.slice() };
+    if (manifest) return;
+    manifest = { version: 1, nextId: 0, segments: [] };
+    const legacy = await read(LEGACY_KEY);
+    if (Array.isArray(legacy) && legacy.length > 0) {
+      await writeSegments(legacy);
+      await remove(LEGACY_KEY);
+    }
+  };
+
+  // Messages [start, end) by global index, reading only the segments that
+  // overlap the range
+  const readRange = async (start, end) => {
+    const wanted = [];
+    let offset = 0;
+    for (const segment of manifest.segments) {
+      if (offset >= end) break;
+      if (offset + segment.count > start) {
+        wanted.push({ segment, offset });
+      }
+      offset += segment.count;
+    }
+    const chunks = await Promise.all(wanted.map(async ({ segment, offset }) => {
+      const messages = (await read(segmentKey(segment.id))) || [];
+      return messages.slice(Math.max(0, start - offset), end - offset);
+    }));
+    return chunks.flat();
+  };
+
+  const underfull = () => manifest.segments.filter(segment => segment.count < SEGMENT_SIZE).length;
+
+  // Merges runs of adjacent segments that fit in one SEGMENT_SIZE segment.
+  // The new manifest is written before the merged keys are deleted, so an
+  // interrupted pass only leaves unreferenced keys behind.
+  const compact = () => enqueue(async () => {
+    compactionScheduled = false;
+    const { segments } = manifest;
+    const next = [];
+    const stale = [];
+    let i = 0;
+    while (i < segments.length) {
+      let j = i;
+      let count = 0;
+      while (j < segments.length && count + segments[j].count <= SEGMENT_SIZE) {
+        count += segments[j].count;
+        j++;
+      }
+      if (j - i > 1) {
+        const run = segments.slice(i, j);
+        const parts = await Promise.all(run.map(segment => read(segmentKey(segment.id))));
+        const id = manifest.nextId++;
+        await write(segmentKey(id), parts.flatMap(part => part || []));
+        next.push({ id, count });
+        stale.push(...run);
+        i = j;
+      } else {
+        next.push(segments[i]);
+        i++;
+      }
+    }
+    if (stale.length === 0) return;
+    manifest.segments = next;
+    await writeManifest();
+    await Promise.all(stale.map(segment => remove(segmentKey(segment.id))));
+  });
+
+  const scheduleCompaction = () => {
+    if (compactionScheduled || underfull() < COMPACT_THRESHOLD) return;
+    compactionScheduled = true;
+    whenIdle(() => {
+      compact().catch((error) => console.error('Error compacting chat history:', error));
+    });
+  };
+
+  // Stores `messages` after everything already stored
+  const append = async (messages) => {
+    await open();
+    if (messages.length === 0) return;
+    await writeSegments(messages);
+    scheduleCompaction();
+  };
+
+  return {
+    // Newest page of history; `base` is the global index of messages[0]
+    loadRecent: () => enqueue(async () => {
+      await open();
+      const end = total();
+      const base = Math.max(0, end - PAGE_SIZE);
+      return { messages: await readRange(base, end), base };
+    }),
+
+    // The page just before `base`
+    loadOlder: (base) => enqueue(async () => {
+      await open();
+      const start = Math.max(0, base - PAGE_SIZE);
+      return { messages: await readRange(start, base), base: start };
+    }),
+
+    loadRange: (start, end) => enqueue(async () => {
+      await open();
+      return readRange(start, end);
+    }),
+
+    // Stores whatever part of `messages` (a tail of the history starting at
+    // global index `base`) has not been stored yet
+    sync: (messages, base) => enqueue(async () => {
+      await open();
+      await append(messages.slice(Math.max(0, total() - base)));
+    }),
+
+    // Returns a function that stores imported messages, given in order one
+    // batch at a time (a call must settle before the next one). Imported
+    // history that repeats the start of the stored one, as when an export
+    // is imported again, is skipped; the rest is appended.
+    importer() {
+      let matched = 0;
+      let diverged = false;
+      return async (batch) => {
+        if (!diverged) {
+          const stored = await enqueue(async () => {
+            await open();
+            return readRange(matched, matched + batch.length);
+          });
+          let k = 0;
+          while (k < stored.length && stored[k].type === batch[k].type && stored[k].text === batch[k].text) k++;
+          matched += k;
+          if (k === batch.length) return;
+          diverged = true;
+          batch = batch.slice(k);
+        }
+        await enqueue(() => append(batch));
+      };
+    },
+
+    // The whole history, oldest first, one segment-sized page at a time
+    async *pages() {
+      const end = await enqueue(async () => {
+        await open();
+        return total();
+      });
+      for (let start = 0; start < end; start += SEGMENT_SIZE) {
+        yield await enqueue(() => readRange(start, Math.min(end, start + SEGMENT_SIZE)));
+      }
+    }
+  };
+};
@@ -0,0 +1,62 @@
+// Bounded in-memory window over the chat history.
+//
+// A window is `{ messages, base }`: a run of consecutive messages and the
+// global index of messages[0]. Everything before it lives in the chat log
+// (lib/chatLog.js), which the message list pages back in on demand. Once
+// messages are archived, trimWindow() drops the oldest ones, so a session's
+// memory stays bounded however long it runs.
+//
+// Trimming happens in batches: the window is allowed to grow TRIM_SLACK
+// past its limit and is then cut back to the limit in one step. Appends
+// never copy more than limit + TRIM_SLACK messages, and the message list
+// only rebuilds its height index once per TRIM_SLACK appends; between
+// trims it extends the index in O(log n).
+//
+// All functions return a new window and leave their input untouched, so
+// windows can be held in React state.
+
+export const WINDOW_LIMIT = 200;
+export const TRIM_SLACK = 100;
+
+export const EMPTY_WINDOW = { messages: [], base: 0 };
+
+export const appendMessages = (window, added) => (
+  added.length === 0 ? window : { messages: window.messages.concat(added), base: window.base }
+);
+
+// Adds `older`, the messages just before the window, starting at `base`.
+// A page that no longer ends where the window starts (the window was
+// trimmed while the page loaded) is dropped: joining it would leave a gap,
+// and `base` would no longer match the messages.
+export const prependMessages = (window, older, base) => (
+  base + older.length === window.base
+    ? { messages: older.concat(window.messages), base }
+    : window
+);
+
+// Swaps in a new version of one message, searching from the end (where the
+// streaming reply is)
+export const replaceMessage = (window, target, next) => {
+  const idx = window.messages.lastIndexOf(target);
+  if (idx === -1) return window;
+  const messages = window.messages.slice();
+  messages[idx] = next;
+  return { messages, base: window.base };
+};
+
+// Drops the oldest messages once the window is TRIM_SLACK over `limit`,
+// keeping the newest `limit`. Only messages before `archivedEnd` (the
+// global index up to which the log holds the history) are ever dropped.
+export const trimWindow = (window, archivedEnd, limit = WINDOW_LIMIT) => {
+  const { messages, base } = window;
+  if (messages.length <= limit + TRIM_SLACK) return window;
+  const drop = Math.min(messages.length - limit, archivedEnd - base);
+  if (drop <= 0) return window;
+  return { messages: messages.slice(drop), base: base + drop };
+};
+
+// The last `size` messages, the conversation context handed to the
+// response engine with a new query
+export const contextWindow = (messages, size) => (
+  size > 0 ? messages.slice(Math.max(0, messages.length - size)) : []
+);
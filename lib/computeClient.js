@@ -0,0 +1,84 @@
+// Main-thread side of the compute worker protocol (see computeOps.js).
+//
+// call(op, args, { transfer, onEvent }) posts a request and resolves with
+// the op's result; `transfer` lists ArrayBuffers in `args` to hand over
+// instead of copying, and `onEvent(event, value)` receives progress events.
+// The worker is started on the first call. If it cannot be created, or
+// fails to load, calls run in-process against the same ops instead.
+
+export const createComputeClient = (createWorker) => {
+  let worker = null;
+  let local = null;
+  let nextId = 0;
+  const calls = new Map();
+
+  const runLocal = ({ op, args, onEvent }) => {
+    if (!local) {
+      local = import('./computeOps.js').then(({ createComputeOps, handleComputeRequest }) => ({
+        ops: createComputeOps(),
+        handleComputeRequest
+      }));
+    }
+    return local.then(({ ops, handleComputeRequest }) => new Promise((resolve, reject) => {
+      handleComputeRequest(ops, { id: 0, op, args }, (message) => {
+        if ('event' in message) onEvent?.(message.event, message.value);
+        else if ('error' in message) reject(new Error(message.error));
+        else resolve(message.result);
+      });
+    }));
+  };
+
+  const fallBack = () => {
+    worker.terminate();
+    worker = false;
+    const pending = [...calls.values()];
+    calls.clear();
+    for (const call of pending) {
+      runLocal(call).then(call.resolve, call.reject);
+    }
+  };
+
+  const start = () => {
+    if (worker !== null) return;
+    try {
+      worker = createWorker();
+    } catch (error) {
+      console.error('Compute worker unavailable, running in-process:', error);
+      worker = false;
+      return;
+    }
+    worker.onmessage = ({ data }) => {
+      const call = calls.get(data.id);
+      if (!call) return;
+      if ('event' in data) {
+        call.onEvent?.(data.event, data.value);
+        return;
+      }
+      calls.delete(data.id);
+      if ('error' in data) call.reject(new Error(data.error));
+      else call.resolve(data.result);
+    };
+    worker.onerror = (event) => {
+      event.preventDefault?.();
+      console.error('Compute worker failed, running in-process:', event.message);
+      fallBack();
+    };
+  };
+
+  return {
+    call(op, args = {}, { transfer = [], onEvent } = {}) {
+      start();
+      if (!worker) return runLocal({ op, args, onEvent });
+      return new Promise((resolve, reject) => {
+        const id = nextId++;
+        calls.set(id, { op, args, onEvent, resolve, reject });
+        worker.postMessage({ id, op, args }, transfer);
+      });
+    },
+
+    terminate() {
+      if (worker) worker.terminate();
+      worker = null;
+    }
+  };
+};
@@ -0,0 +1,107 @@
+// Operations behind the compute worker (workers/compute.js).
+//
+// Protocol, one request and any number of events per call:
+//
+//   request  { id, op, args }
+//   event    { id, event, value }    progress from a long-running op
+//   reply    { id, result }  or  { id, error }
+//
+// Ops (args -> result):
+//
+//   index          { branch, content? }   -> { size }
+//       Indexes a branch for search, loading its content unless given.
+//   search         { query, limit?, options? } -> [{ topicKey, branch, subject, idx, subjectName, title, score }]
+//   retrieve       { query }              -> { intent, topics }
+//       Chat retrieval: analyzes the query and returns the best matching
+//       topics in full (plus subjectName), indexing every branch first.
+//   parseJSON      { text }               -> value
+//   stringifyJSON  { value }              -> string
+//   encodeJSON     { values, separator }  -> Uint8Array (transferred)
+//       UTF-8 bytes of the values' JSON joined by `separator`.
+//   importConfig   { file }               -> { messages, skipped }
+//       Events: 'settings', 'favorites', 'messages' (see configStream.js).
+//
+// The ops are plain functions, so the same table also runs in-process
+// where workers are unavailable.
+
+import { createSearchIndex, indexBranch } from './searchIndex.js';
+import { analyzeQuery } from './intentMatcher.js';
+import { readConfigFile } from './configStream.js';
+import { branchManifest, loadBranch } from '../curriculum/index.js';
+
+export const createComputeOps = () => {
+  const topicIndex = createSearchIndex();
+  // Branch key -> promise that settles once the branch is indexed
+  const indexed = new Map();
+  // Branch key -> content of every indexed branch
+  const contents = {};
+  const encoder = new TextEncoder();
+
+  const ensureIndexed = (branch, content) => {
+    if (!indexed.has(branch)) {
+      const loading = content ? Promise.resolve(content) : loadBranch(branch);
+      indexed.set(branch, loading.then((loaded) => {
+        if (loaded) {
+          indexBranch(topicIndex, branch, loaded);
+          contents[branch] = loaded;
+        }
+      }, (error) => {
+        indexed.delete(branch);
+        throw error;
+      }));
+    }
+    return indexed.get(branch);
+  };
+
+  return {
+    async index({ branch, content }) {
+      await ensureIndexed(branch, content);
+      return { size: topicIndex.size };
+    },
+
+    search: ({ query, limit = 8, options }) => topicIndex.search(query, limit, options),
+
+    async retrieve({ query }) {
+      const { intent, topicQuery } = analyzeQuery(query);
+      if (!topicQuery) return { intent, topics: [] };
+      await Promise.all(Object.keys(branchManifest).map(branch => ensureIndexed(branch)));
+      const hits = topicIndex.search(topicQuery, 2, { match: 'any', prefix: false });
+      // Outside of comparisons, drop a runner-up that only matched on a minor term
+      const floor = intent === 'difference' ? 0 : hits[0]?.score * 0.5;
+      const topics = hits
+        .filter(hit => hit.score >= floor)
+        .map(hit => ({
+          ...contents[hit.branch].subjects[hit.subject].topics[hit.idx],
+          subjectName: hit.subjectName
+        }));
+      return { intent, topics };
+    },
+
+    parseJSON: ({ text }) => JSON.parse(text),
+
+    stringifyJSON: ({ value }) => JSON.stringify(value),
+
+    encodeJSON: ({ values, separator = ',' }) =>
+      encoder.encode(values.map(value => JSON.stringify(value)).join(separator)),
+
+    importConfig: ({ file }, emit) => readConfigFile(file, {
+      onSettings: (value) => emit('settings', value),
+      onFavorites: (value) => emit('favorites', value),
+      onMessages: (value) => emit('messages', value)
+    })
+  };
+};
+
+// Buffers in a result that can be transferred instead of copied
+export const transferList = (result) => (ArrayBuffer.isView(result) ? [result.buffer] : []);
+
+// Runs one request against `ops`, reporting through `post(message, transfer)`
+export const handleComputeRequest = async (ops, { id, op, args }, post) => {
+  try {
+    if (typeof ops[op] !== 'function') throw new Error(`Unknown compute op: ${op}`);
+    const result = await ops[op](args, (event, value) => post({ id, event, value }));
+    post({ id, result }, transferList(result));
+  } catch (error) {
+    post({ id, error: error.message });
+  }
+};
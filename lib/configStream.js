@@ -0,0 +1,237 @@
+// Streaming export and import of the configuration file:
+//
+//   { "settings": {...}, "favorites": [...], "chatMessages": [...] }
+//
+// Export assembles the file from small string parts (one per history page)
+// into a Blob, optionally gzip-compressed, so the whole document never
+// exists as one string. Import scans the text incrementally and hands over
+// settings, favorites and chat messages as soon as each is complete,
+// validating them on the way; chat messages arrive in batches.
+
+import { branchManifest } from '../curriculum/index.js';
+import { parseFavorites } from './favorites.js';
+import { FONT_SIZES, THEMES } from './theme.js';
+
+const oneOf = (...values) => (value) => values.includes(value);
+const flag = (value) => typeof value === 'boolean';
+
+// A check per known setting, allowing only values the app can apply
+const SETTINGS = {
+  theme: oneOf(...Object.keys(THEMES)),
+  fontSize: oneOf(...Object.keys(FONT_SIZES)),
+  // Keys of the app's `modes`
+  defaultMode: oneOf('btech', 'cybersec', 'ai', 'calculator', 'notes'),
+  defaultBranch: (value) => typeof value === 'string' && Object.hasOwn(branchManifest, value),
+  showFormulas: flag,
+  showKeyPoints: flag,
+  autoSave: flag,
+  compressExport: flag,
+  aiModel: oneOf('basic', 'advanced', 'expert'),
+  // Messages of context, up to the largest Chat Context option
+  contextWindow: (value) => Number.isInteger(value) && value >= 0 && value <= 20,
+  diagnostics: flag,
+  language: oneOf('english')
+};
+
+// The known settings that hold valid values; anything else is dropped, so
+// the result can be merged into the current settings as is
+export const sanitizeSettings = (value) => {
+  const clean = {};
+  if (!value || typeof value !== 'object' || Array.isArray(value)) return clean;
+  for (const [key, valid] of Object.entries(SETTINGS)) {
+    if (valid(value[key])) clean[key] = value[key];
+  }
+  return clean;
+};
+
+export const isValidMessage = (message) =>
+  !!message && (message.type === 'user' || message.type === 'ai') && typeof message.text === 'string';
+
+const indent = (json) => json.replace(/\n/g, '\n  ');
+
+const MESSAGE_SEPARATOR = ',\n    ';
+
+const encodeMessages = (page, separator) => page.map(message => JSON.stringify(message)).join(separator);
+
+// Yields the configuration file piece by piece. `pages` is an (async)
+// iterable of chat message arrays, oldest first. `encodePage(page,
+// separator)` may hand the messages' JSON back as a string or as UTF-8
+// bytes, synchronously or not.
+export async function* exportChunks({ settings, favorites, pages, encodePage = encodeMessages }) {
+  yield `{\n  "settings": ${indent(JSON.stringify(settings, null, 2))},\n`;
+  yield `  "favorites": ${indent(JSON.stringify([...favorites], null, 2))},\n`;
+  yield '  "chatMessages": [';
+  let first = true;
+  for await (const page of pages) {
+    if (page.length === 0) continue;
+    yield first ? '\n    ' : MESSAGE_SEPARATOR;
+    first = false;
+    yield await encodePage(page, MESSAGE_SEPARATOR);
+  }
+  yield first ? ']\n}\n' : '\n  ]\n}\n';
+}
+
+export const buildExportBlob = async ({ compress = false, ...content }) => {
+  const parts = [];
+  for await (const chunk of exportChunks(content)) parts.push(chunk);
+  const blob = new Blob(parts, { type: 'application/json' });
+  if (!compress || typeof CompressionStream === 'undefined') return blob;
+  return new Response(blob.stream().pipeThrough(new CompressionStream('gzip'))).blob();
+};
+
+const isWhitespace = (ch) => ch === ' ' || ch === '\n' || ch === '\r' || ch === '\t';
+
+// Incremental parser for the configuration file. Feed text with write()
+// and call end() at the end of input. Top-level values other than
+// chatMessages are small and parsed whole; chatMessages elements are parsed
+// one at a time. Throws on malformed input.
+export const createConfigParser = ({ onSettings, onFavorites, onMessages, batchSize = 500 }) => {
+  let depth = 0;
+  let inString = false;
+  let escaped = false;
+  let finished = false;
+  // Meaning of the next value at depth 1: 'key' or 'value'
+  let expect = 'key';
+  let key = null;
+  let inMessages = false;
+  // Text being collected: { role, kind, depth, parts, start }
+  let capture = null;
+  let batch = [];
+  const stats = { messages: 0, skipped: 0 };
+
+  const flushBatch = () => {
+    if (batch.length > 0) {
+      onMessages(batch);
+      batch = [];
+    }
+  };
+
+  const handleValue = (role, text) => {
+    if (role === 'key') {
+      key = JSON.parse(text);
+      return;
+    }
+    const value = JSON.parse(text);
+    if (role === 'element') {
+      if (isValidMessage(value)) {
+        batch.push({ type: value.type, text: value.text });
+        stats.messages++;
+        if (batch.length >= batchSize) flushBatch();
+      } else {
+        stats.skipped++;
+      }
+    } else if (key === 'settings') {
+      onSettings(sanitizeSettings(value));
+    } else if (key === 'favorites') {
+      onFavorites([...parseFavorites(value)]);
+    }
+  };
+
+  const begin = (kind, start) => {
+    let role;
+    if (inMessages && depth === 2) role = 'element';
+    else if (depth === 1) role = expect;
+    else throw new Error('Unexpected value');
+    capture = { role, kind, depth, parts: [], start };
+  };
+
+  // Ends the capture with chunk[end - 1] as its last character
+  const finish = (chunk, end) => {
+    const { role, parts, start } = capture;
+    parts.push(chunk.slice(start, end));
+    capture = null;
+    handleValue(role, parts.join(''));
+  };
+
+  const write = (chunk) => {
+    if (capture) capture.start = 0;
+    for (let i = 0; i < chunk.length; i++) {
+      const ch = chunk[i];
+
+      if (inString) {
+        if (escaped) {
+          escaped = false;
+        } else if (ch === '\\') {
+          escaped = true;
+        } else if (ch === '"') {
+          inString = false;
+          if (capture && capture.kind === 'string') finish(chunk, i + 1);
+        }
+        continue;
+      }
+
+      if (capture && capture.kind === 'primitive') {
+        if (ch !== ',' && ch !== '}' && ch !== ']' && !isWhitespace(ch)) continue;
+        finish(chunk, i);
+      }
+
+      if (isWhitespace(ch)) continue;
+      if (finished) throw new Error('Unexpected data after the end of the file');
+
+      if (depth === 0) {
+        if (ch !== '{') throw new Error('Expected a JSON object');
+        depth = 1;
+        continue;
+      }
+
+      if (ch === '"') {
+        inString = true;
+        if (!capture) begin('string', i);
+      } else if (ch === '{' || ch === '[') {
+        if (!capture) {
+          if (depth === 1 && expect === 'value' && key === 'chatMessages' && ch === '[') {
+            inMessages = true;
+          } else {
+            begin('container', i);
+          }
+        }
+        depth++;
+      } else if (ch === '}' || ch === ']') {
+        depth--;
+        if (capture && capture.kind === 'container' && depth === capture.depth) {
+          finish(chunk, i + 1);
+        } else if (!capture && inMessages && depth === 1) {
+          inMessages = false;
+          flushBatch();
+        } else if (!capture && depth === 0) {
+          finished = true;
+        }
+      } else if (!capture) {
+        if (ch === ':' && depth === 1) {
+          expect = 'value';
+        } else if (ch === ',') {
+          if (depth === 1) expect = 'key';
+        } else {
+          begin('primitive', i);
+        }
+      }
+    }
+    if (capture) capture.parts.push(chunk.slice(capture.start));
+  };
+
+  const end = () => {
+    if (!finished || capture || inString) throw new Error('Unexpected end of file');
+    flushBatch();
+    return stats;
+  };
+
+  return { write, end };
+};
+
+// Streams a (possibly gzip-compressed) configuration File through the
+// parser. Resolves with { messages, skipped } counts.
+export const readConfigFile = async (file, handlers) => {
+  const magic = new Uint8Array(await file.slice(0, 2).arrayBuffer());
+  let stream = file.stream();
+  if (magic[0] === 0x1f && magic[1] === 0x8b) {
+    stream = stream.pipeThrough(new DecompressionStream('gzip'));
+  }
+  const reader = stream.pipeThrough(new TextDecoderStream()).getReader();
+  const parser = createConfigParser(handlers);
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    parser.write(value);
+  }
+  return parser.end();
+};
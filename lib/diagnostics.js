@@ -0,0 +1,115 @@
+// Opt-in performance diagnostics for the Settings panel.
+//
+// Collects React Profiler timings per view, storage operations and chat
+// reply latency, and exports them as a Trace Event Format file that
+// chrome://tracing and Perfetto can open. Per-key storage stats are kept by
+// lib/storage.js itself; recordStorage() only adds them to the trace.
+//
+// While disabled every hook returns after a single flag check: the
+// Profiler stays mounted (components/Profiled.jsx), but its onRender
+// records nothing, and neither do the recorders.
+//
+// React only calls Profiler onRender in development builds and in
+// production builds that alias react-dom to react-dom/profiling. In a
+// regular production build the render stats stay empty; storage and chat
+// stats are recorded either way.
+
+// Trace events kept for export, oldest dropped first
+const MAX_EVENTS = 5000;
+
+const emptyStat = () => ({ count: 0, totalMs: 0, maxMs: 0 });
+
+const addSample = (stat, ms) => {
+  stat.count++;
+  stat.totalMs += ms;
+  stat.maxMs = Math.max(stat.maxMs, ms);
+};
+
+export const createDiagnostics = () => {
+  let enabled = false;
+  let events = [];
+  // view id -> { count, totalMs, maxMs, lastMs, mounts }
+  let renders = new Map();
+  let chat = { replies: emptyStat(), firstChunk: emptyStat(), cached: 0 };
+
+  const addEvent = (event) => {
+    events.push(event);
+    if (events.length > MAX_EVENTS) events = events.slice(-MAX_EVENTS / 2);
+  };
+
+  // Plain-object copy of the aggregates
+  const snapshot = () => ({
+    renders: Object.fromEntries([...renders].map(([id, stat]) => [id, { ...stat }])),
+    chat: structuredClone(chat)
+  });
+
+  return {
+    isEnabled: () => enabled,
+
+    setEnabled(value) {
+      enabled = value;
+    },
+
+    // Profiler onRender callback
+    onRender(id, phase, actualDuration, baseDuration, startTime) {
+      if (!enabled) return;
+      let stat = renders.get(id);
+      if (!stat) renders.set(id, stat = { ...emptyStat(), lastMs: 0, mounts: 0 });
+      addSample(stat, actualDuration);
+      stat.lastMs = actualDuration;
+      if (phase === 'mount') stat.mounts++;
+      addEvent({ name: id, cat: 'render', ph: 'X', ts: startTime * 1000, dur: actualDuration * 1000, args: { phase, baseDuration } });
+    },
+
+    // createStorage's onOperation callback
+    recordStorage(op, key, start, ms, bytes) {
+      if (!enabled) return;
+      addEvent({ name: `${op} ${key}`, cat: 'storage', ph: 'X', ts: start * 1000, dur: ms * 1000, args: { bytes } });
+    },
+
+    // One chat reply: `firstChunkMs` until the first text, `totalMs` until done
+    recordReply({ start, firstChunkMs, totalMs, cached = false }) {
+      if (!enabled) return;
+      if (cached) {
+        chat.cached++;
+        return;
+      }
+      addSample(chat.replies, totalMs);
+      if (firstChunkMs !== null) addSample(chat.firstChunk, firstChunkMs);
+      addEvent({ name: 'chat reply', cat: 'chat', ph: 'X', ts: start * 1000, dur: totalMs * 1000, args: { firstChunkMs } });
+    },
+
+    reset() {
+      events = [];
+      renders = new Map();
+      chat = { replies: emptyStat(), firstChunk: emptyStat(), cached: 0 };
+    },
+
+    snapshot,
+
+    // Trace Event Format, with the aggregates and any extra data (such as
+    // memory estimates) under `metadata`
+    trace(metadata = {}) {
+      const measures = typeof performance !== 'undefined' && typeof performance.getEntriesByType === 'function'
+        ? performance.getEntriesByType('measure').map(entry => ({
+          name: entry.name, cat: 'timing', ph: 'X', ts: entry.startTime * 1000, dur: entry.duration * 1000
+        }))
+        : [];
+      return {
+        traceEvents: [...measures, ...events].map(event => ({ pid: 1, tid: 1, ...event })),
+        displayTimeUnit: 'ms',
+        metadata: { capturedAt: new Date().toISOString(), ...snapshot(), ...metadata }
+      };
+    }
+  };
+};
+
+// Rough in-memory size of a JSON-serializable value, in bytes (strings are
+// UTF-16, so two bytes per character)
+export const estimateSize = (value) => {
+  try {
+    return (JSON.stringify(value)?.length ?? 0) * 2;
+  } catch (error) {
+    return 0;
+  }
+};
@@ -0,0 +1,320 @@
+// Expression engine for the calculator.
+//
+// An expression is parsed once and compiled into a tree of closures over a
+// Float64Array of variable values, so evaluating it again (for new inputs,
+// or for every point of a sweep) costs no parsing or name lookups.
+//
+// Syntax: numbers (1.5, 2e-3), variables (letters, digits, _ and ',
+// e.g. TL, COP_ref, ∆T), + - * / ^, parentheses, the functions in FUNCTIONS
+// and the constants pi and e. Juxtaposition multiplies: (Rf/Ri)Vi, 2x.
+//
+// Topic formulas such as 'Inverting: Vo = -(Rf/Ri)Vi' are read with
+// parseFormula(), which splits off the label and the target variable.
+
+const FUNCTIONS = {
+  sin: Math.sin,
+  cos: Math.cos,
+  tan: Math.tan,
+  asin: Math.asin,
+  acos: Math.acos,
+  atan: Math.atan,
+  sqrt: Math.sqrt,
+  abs: Math.abs,
+  exp: Math.exp,
+  ln: Math.log,
+  log: Math.log10,
+  log2: Math.log2,
+  min: Math.min,
+  max: Math.max,
+  pow: Math.pow
+};
+
+const CONSTANTS = { pi: Math.PI, e: Math.E };
+
+const NUMBER = /^(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?/;
+const IDENTIFIER = /^[\p{L}_∆][\p{L}\p{N}_']*/u;
+
+const tokenize = (source) => {
+  const tokens = [];
+  let pos = 0;
+  while (pos < source.length) {
+    const rest = source.slice(pos);
+    const space = rest.match(/^\s+/);
+    if (space) {
+      pos += space[0].length;
+      continue;
+    }
+    const number = rest.match(NUMBER);
+    if (number) {
+      tokens.push({ type: 'number', value: Number(number[0]), pos });
+      pos += number[0].length;
+      continue;
+    }
+    const name = rest.match(IDENTIFIER);
+    if (name) {
+      tokens.push({ type: 'name', value: name[0], pos });
+      pos += name[0].length;
+      continue;
+    }
+    const ch = rest[0] === '×' || rest[0] === '·' ? '*' : rest[0] === '−' ? '-' : rest[0];
+    if (!'+-*/^(),'.includes(ch)) {
+      throw new SyntaxError(`Unexpected "${rest[0]}" at position ${pos + 1}`);
+    }
+    tokens.push({ type: ch, pos });
+    pos++;
+  }
+  return tokens;
+};
+
+// Recursive descent over
+//   sum     = product (('+' | '-') product)*
+//   product = unary (('*' | '/') unary | <juxtaposed> unary)*
+//   unary   = '-' unary | '+' unary | power
+//   power   = atom ('^' unary)?
+//   atom    = number | name | name '(' args ')' | '(' sum ')'
+const parse = (source) => {
+  const tokens = tokenize(source);
+  let i = 0;
+  const peek = () => tokens[i];
+  const fail = (message) => {
+    const token = peek();
+    throw new SyntaxError(token ? `${message} at position ${token.pos + 1}` : `${message} at end of expression`);
+  };
+  const expect = (type) => {
+    if (peek()?.type !== type) fail(`Expected "${type}"`);
+    i++;
+  };
+  const startsAtom = (token) => token && (token.type === 'number' || token.type === 'name' || token.type === '(');
+
+  const atom = () => {
+    const token = peek();
+    if (!token) fail('Unexpected end');
+    if (token.type === 'number') {
+      i++;
+      return { type: 'number', value: token.value };
+    }
+    if (token.type === 'name') {
+      i++;
+      if (FUNCTIONS[token.value] && peek()?.type === '(') {
+        i++;
+        const args = [sum()];
+        while (peek()?.type === ',') {
+          i++;
+          args.push(sum());
+        }
+        expect(')');
+        return { type: 'call', name: token.value, args };
+      }
+      if (Object.hasOwn(CONSTANTS, token.value)) {
+        return { type: 'number', value: CONSTANTS[token.value] };
+      }
+      return { type: 'variable', name: token.value };
+    }
+    if (token.type === '(') {
+      i++;
+      const inner = sum();
+      expect(')');
+      return inner;
+    }
+    return fail(`Unexpected "${token.type}"`);
+  };
+
+  const power = () => {
+    const base = atom();
+    if (peek()?.type !== '^') return base;
+    i++;
+    return { type: '^', left: base, right: unary() };
+  };
+
+  const unary = () => {
+    const token = peek();
+    if (token?.type === '-' || token?.type === '+') {
+      i++;
+      const operand = unary();
+      return token.type === '-' ? { type: 'negate', operand } : operand;
+    }
+    return power();
+  };
+
+  const product = () => {
+    let left = unary();
+    for (;;) {
+      const token = peek();
+      if (token?.type === '*' || token?.type === '/') {
+        i++;
+        left = { type: token.type, left, right: unary() };
+      } else if (startsAtom(token)) {
+        left = { type: '*', left, right: unary() };
+      } else {
+        return left;
+      }
+    }
+  };
+
+  const sum = () => {
+    let left = product();
+    while (peek()?.type === '+' || peek()?.type === '-') {
+      const { type } = tokens[i++];
+      left = { type, left, right: product() };
+    }
+    return left;
+  };
+
+  if (tokens.length === 0) throw new SyntaxError('Empty expression');
+  const tree = sum();
+  if (i < tokens.length) fail(`Unexpected "${peek().type === 'name' ? peek().value : peek().type}"`);
+  return tree;
+};
+
+const BINARY = {
+  '+': (a, b) => (env) => a(env) + b(env),
+  '-': (a, b) => (env) => a(env) - b(env),
+  '*': (a, b) => (env) => a(env) * b(env),
+  '/': (a, b) => (env) => a(env) / b(env),
+  '^': (a, b) => (env) => a(env) ** b(env)
+};
+
+const ARITY = { min: -1, max: -1, pow: 2 };
+
+// Compiles an expression. Returns { source, variables, evaluate(scope),
+// evaluateBatch(inputs, length) }; throws SyntaxError on invalid input.
+export const compileExpression = (source) => {
+  const variables = [];
+  const slots = new Map();
+
+  // Each node becomes `(env) => number`; constant subtrees are folded
+  const build = (node) => {
+    switch (node.type) {
+      case 'number':
+        return { constant: true, value: node.value, fn: () => node.value };
+      case 'variable': {
+        if (!slots.has(node.name)) {
+          slots.set(node.name, variables.length);
+          variables.push(node.name);
+        }
+        const slot = slots.get(node.name);
+        return { constant: false, fn: (env) => env[slot] };
+      }
+      case 'negate': {
+        const operand = build(node.operand);
+        if (operand.constant) return { constant: true, value: -operand.value, fn: () => -operand.value };
+        const inner = operand.fn;
+        return { constant: false, fn: (env) => -inner(env) };
+      }
+      case 'call': {
+        const args = node.args.map(build);
+        const arity = ARITY[node.name] ?? 1;
+        if (arity !== -1 && args.length !== arity) {
+          throw new SyntaxError(`${node.name}() takes ${arity} argument${arity === 1 ? '' : 's'}`);
+        }
+        const f = FUNCTIONS[node.name];
+        if (args.every(arg => arg.constant)) {
+          const value = f(...args.map(arg => arg.value));
+          return { constant: true, value, fn: () => value };
+        }
+        const fns = args.map(arg => arg.fn);
+        if (fns.length === 1) {
+          const [a] = fns;
+          return { constant: false, fn: (env) => f(a(env)) };
+        }
+        return { constant: false, fn: (env) => f(...fns.map(fn => fn(env))) };
+      }
+      default: {
+        const left = build(node.left);
+        const right = build(node.right);
+        const fn = BINARY[node.type](left.fn, right.fn);
+        if (left.constant && right.constant) {
+          const value = fn();
+          return { constant: true, value, fn: () => value };
+        }
+        return { constant: false, fn };
+      }
+    }
+  };
+
+  const { fn } = build(parse(source));
+  const env = new Float64Array(variables.length);
+
+  return {
+    source,
+    variables,
+
+    // `scope` maps variable names to numbers; missing ones count as NaN
+    evaluate(scope) {
+      variables.forEach((name, k) => {
+        env[k] = scope[name] ?? NaN;
+      });
+      return fn(env);
+    },
+
+    // Evaluates over `length` points. Each input is a number (held fixed)
+    // or an array / typed array with one value per point. Returns a
+    // Float64Array of results.
+    evaluateBatch(inputs, length) {
+      const columns = [];
+      variables.forEach((name, k) => {
+        const input = inputs[name];
+        if (typeof input === 'number') env[k] = input;
+        else if (input) columns.push([k, input]);
+        else env[k] = NaN;
+      });
+      const n = length ?? Math.min(...columns.map(([, column]) => column.length));
+      const out = new Float64Array(Number.isFinite(n) ? n : 1);
+      for (let i = 0; i < out.length; i++) {
+        for (let c = 0; c < columns.length; c++) {
+          env[columns[c][0]] = columns[c][1][i];
+        }
+        out[i] = fn(env);
+      }
+      return out;
+    }
+  };
+};
+
+// `steps` evenly spaced values from `from` to `to`, inclusive
+export const linspace = (from, to, steps) => {
+  const values = new Float64Array(Math.max(0, steps));
+  const step = steps > 1 ? (to - from) / (steps - 1) : 0;
+  for (let i = 0; i < values.length; i++) values[i] = from + step * i;
+  return values;
+};
+
+// Evaluates `compiled` with `variable` swept over [from, to] and every other
+// variable taken from `scope`. Returns { x, y } Float64Arrays.
+export const sweep = (compiled, scope, variable, { from, to, steps }) => {
+  const x = linspace(from, to, steps);
+  return { x, y: compiled.evaluateBatch({ ...scope, [variable]: x }, x.length) };
+};
+
+// Reads a topic formula like 'Inverting: Vo = -(Rf/Ri)Vi'. Returns
+// { text, label, target, compiled }, or null if the formula is not an
+// assignment the calculator can evaluate (notation such as 'DFS: O(V+E)',
+// or anything that does not parse).
+export const parseFormula = (text) => {
+  const colon = text.indexOf(':');
+  const label = colon === -1 ? null : text.slice(0, colon).trim();
+  const sides = text.slice(colon + 1).split('=');
+  if (sides.length !== 2) return null;
+  const target = sides[0].trim();
+  if (target.match(IDENTIFIER)?.[0] !== target) return null;
+  try {
+    return { text, label, target, compiled: compileExpression(sides[1].trim()) };
+  } catch (error) {
+    return null;
+  }
+};
+
+// Whether parseFormula() can read `text`, remembered per formula text so a
+// topic card can decide on its calculator button without parsing the
+// formula again on every render. Topic formulas are a fixed set, so the
+// cache stays small.
+const evaluable = new Map();
+
+export const isEvaluableFormula = (text) => {
+  let result = evaluable.get(text);
+  if (result === undefined) {
+    result = parseFormula(text) !== null;
+    evaluable.set(text, result);
+  }
+  return result;
+};
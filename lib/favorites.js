@@ -0,0 +1,24 @@
+// Favorites are a set of topic keys (`${subject}-${idx}`), persisted as an
+// array of those keys.
+//
+// Earlier versions stored an array of full topic copies
+// ({ id, title, content, ..., subject }); parseFavorites accepts both.
+
+export const parseFavorites = (data) => {
+  if (!Array.isArray(data)) return new Set();
+  return new Set(
+    data
+      .map(item => (typeof item === 'string' ? item : item?.id))
+      .filter(id => typeof id === 'string')
+  );
+};
+
+export const toggleFavorite = (favorites, topicKey) => {
+  const next = new Set(favorites);
+  if (next.has(topicKey)) {
+    next.delete(topicKey);
+  } else {
+    next.add(topicKey);
+  }
+  return next;
+};
@@ -0,0 +1,81 @@
+// Prefix sums over list item heights (a Fenwick tree), so a windowed list can
+// map between item index and scroll offset in O(log n), and update one
+// measured height or append an item without recomputing every offset.
+
+export const createHeightIndex = (heights = []) => {
+  let capacity = Math.max(16, heights.length);
+  let size = heights.length;
+  let values = new Float64Array(capacity);
+  let tree = new Float64Array(capacity + 1);
+
+  values.set(heights);
+  for (let i = 1; i <= size; i++) {
+    tree[i] += values[i - 1];
+    const parent = i + (i & -i);
+    if (parent <= size) tree[parent] += tree[i];
+  }
+
+  // Sum of heights of items [0, i)
+  const offsetOf = (i) => {
+    let sum = 0;
+    for (let j = Math.min(i, size); j > 0; j -= j & -j) sum += tree[j];
+    return sum;
+  };
+
+  // Index of the item covering `offset`, clamped to the list bounds
+  const indexAt = (offset) => {
+    let pos = 0;
+    let remaining = offset;
+    let step = 1;
+    while (step * 2 <= size) step *= 2;
+    for (; step > 0; step >>= 1) {
+      if (pos + step <= size && tree[pos + step] <= remaining) {
+        pos += step;
+        remaining -= tree[pos];
+      }
+    }
+    return Math.max(0, Math.min(pos, size - 1));
+  };
+
+  // Updates one height and returns the change, so callers can correct the
+  // scroll position when an item above the viewport resizes
+  const set = (i, height) => {
+    const delta = height - values[i];
+    if (delta === 0) return 0;
+    values[i] = height;
+    for (let j = i + 1; j <= size; j += j & -j) tree[j] += delta;
+    return delta;
+  };
+
+  const push = (height) => {
+    if (size === capacity) {
+      // Existing tree nodes only cover indices <= size, so they stay valid
+      capacity *= 2;
+      const nextValues = new Float64Array(capacity);
+      nextValues.set(values);
+      const nextTree = new Float64Array(capacity + 1);
+      nextTree.set(tree);
+      values = nextValues;
+      tree = nextTree;
+    }
+    const i = size + 1;
+    values[size] = height;
+    size = i;
+    // Node i covers (i - lowbit(i), i]
+    tree[i] = height + offsetOf(i - 1) - offsetOf(i - (i & -i));
+  };
+
+  return {
+    offsetOf,
+    indexAt,
+    set,
+    push,
+    heightOf: (i) => values[i],
+    get length() {
+      return size;
+    },
+    get total() {
+      return offsetOf(size);
+    }
+  };
+};
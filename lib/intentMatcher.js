@@ -0,0 +1,108 @@
+// Single-pass query analysis for the chat.
+//
+// All intent keywords are compiled into one Aho-Corasick automaton, so a
+// query is scanned once however many keywords there are. What is left after
+// removing intent keywords and filler words is the topic query, which is
+// looked up in the topic search index.
+
+const INTENT_KEYWORDS = {
+  explain: ['explain', 'what is', 'what are', 'define', 'describe', 'meaning of'],
+  formula: ['formula', 'formulas', 'equation', 'equations'],
+  example: ['example', 'examples', 'solve', 'problem', 'calculate'],
+  difference: ['difference', 'differences', 'versus', 'vs', 'compare']
+};
+
+// Earlier intents win when a query contains keywords for several
+const INTENT_PRIORITY = ['explain', 'formula', 'example', 'difference'];
+
+const FILLER_WORDS = new Set([
+  'a', 'an', 'the', 'of', 'in', 'on', 'for', 'to', 'and', 'or', 'is', 'are',
+  'me', 'my', 'please', 'how', 'why', 'between', 'about', 'with', 'give', 'show', 'can', 'you'
+]);
+
+const isWordChar = (ch) => ch !== undefined && /[\p{L}\p{N}]/u.test(ch);
+
+// Compiles patterns ({ text, value }) into a matcher returning every
+// whole-word occurrence as { text, value, start, end }.
+export const compileMatcher = (patterns) => {
+  const edges = [new Map()];
+  const fail = [0];
+  const outputs = [[]];
+
+  for (const pattern of patterns) {
+    let state = 0;
+    for (const ch of pattern.text) {
+      let next = edges[state].get(ch);
+      if (next === undefined) {
+        next = edges.length;
+        edges.push(new Map());
+        fail.push(0);
+        outputs.push([]);
+        edges[state].set(ch, next);
+      }
+      state = next;
+    }
+    outputs[state].push(pattern);
+  }
+
+  // Breadth-first, so every failure link points at an already finished state
+  const queue = [...edges[0].values()];
+  for (let head = 0; head < queue.length; head++) {
+    const state = queue[head];
+    for (const [ch, next] of edges[state]) {
+      queue.push(next);
+      let f = fail[state];
+      while (f !== 0 && !edges[f].has(ch)) f = fail[f];
+      const target = edges[f].get(ch);
+      fail[next] = target !== undefined && target !== next ? target : 0;
+      outputs[next] = outputs[next].concat(outputs[fail[next]]);
+    }
+  }
+
+  return (text) => {
+    const matches = [];
+    let state = 0;
+    for (let i = 0; i < text.length; i++) {
+      const ch = text[i];
+      while (state !== 0 && !edges[state].has(ch)) state = fail[state];
+      state = edges[state].get(ch) ?? 0;
+      for (const pattern of outputs[state]) {
+        const start = i + 1 - pattern.text.length;
+        if (!isWordChar(text[start - 1]) && !isWordChar(text[i + 1])) {
+          matches.push({ ...pattern, start, end: i + 1 });
+        }
+      }
+    }
+    return matches;
+  };
+};
+
+const matchIntents = compileMatcher(
+  Object.entries(INTENT_KEYWORDS).flatMap(([intent, words]) => words.map(text => ({ text, value: intent })))
+);
+
+// Returns { intent, topicQuery } for a chat query. `intent` is null when no
+// keyword matched.
+export const analyzeQuery = (query) => {
+  const text = query.toLowerCase();
+  const matches = matchIntents(text);
+
+  const found = new Set(matches.map(match => match.value));
+  const intent = INTENT_PRIORITY.find(name => found.has(name)) || null;
+
+  let stripped = '';
+  let pos = 0;
+  for (const match of matches) {
+    if (match.start < pos) continue;
+    stripped += `${text.slice(pos, match.start)} `;
+    pos = match.end;
+  }
+  stripped += text.slice(pos);
+
+  const topicQuery = stripped
+    .split(/[^\p{L}\p{N}]+/u)
+    .filter(word => word && !FILLER_WORDS.has(word))
+    .join(' ');
+
+  return { intent, topicQuery };
+};
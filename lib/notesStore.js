@@ -0,0 +1,269 @@
+// Notes, stored one per key with a compact manifest and a sharded full-text
+// index.
+//
+// Layout:
+//   notes              manifest: { version, nextId, notes: [[id, title, updated, topics]] }
+//   note:<id>          { id, title, body, topics, created, updated }
+//   notes_index:<n>    index shard: { term: [ids] } for terms hashing to n
+//   notes_terms        every indexed term, sorted
+//
+// Opening Notes reads only the manifest; a note's body is read when it is
+// opened, and index shards when a search first needs them. The last query
+// term also matches as a prefix: its completions are found by binary
+// search in the term list, and only their shards are read. An edit
+// updates the index in place, adding and removing only the terms whose
+// presence in the note changed, and rewrites just the note, the manifest,
+// the shards it touched and, if terms came or went, the term list. Writes go through `schedule(key, write)`
+// (lib/autosave.js), which debounces and coalesces them, to `storage`
+// (lib/storage.js).
+//
+// `topics` are topic keys in the `${subject}-${idx}` form used by the topic
+// cards and favorites.
+
+import { tokenize } from './searchIndex.js';
+
+const MANIFEST_KEY = 'notes';
+const TERMS_KEY = 'notes_terms';
+const SHARD_COUNT = 16;
+
+const noteKey = (id) => `note:${id}`;
+const shardKey = (shard) => `notes_index:${shard}`;
+
+const shardOf = (term) => {
+  let hash = 0;
+  for (let i = 0; i < term.length; i++) {
+    hash = (hash * 31 + term.charCodeAt(i)) | 0;
+  }
+  return (hash >>> 0) % SHARD_COUNT;
+};
+
+const termsOf = (note) => new Set(tokenize(`${note.title} ${note.body}`));
+
+// Index of the first term in sorted `terms` not less than `term`
+const lowerBound = (terms, term) => {
+  let lo = 0;
+  let hi = terms.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (terms[mid] < term) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+};
+
+export const createNotesStore = ({ storage, schedule }) => {
+  // id -> { id, title, updated, topics }
+  let manifest = null;
+  let nextId = 0;
+  let opening = null;
+  // Bodies read so far: id -> note
+  const loaded = new Map();
+  // shard -> Map(term -> Set(ids)), or a promise while it is being read
+  const shards = new Map();
+  // Sorted term list, or a promise while it is being read
+  let vocabulary = null;
+
+  const read = async (key) => {
+    try {
+      return (await storage.get(key)) ?? null;
+    } catch (error) {
+      return null;
+    }
+  };
+
+  const write = (key, value) => storage.set(key, value);
+
+  const open = () => {
+    if (!opening) {
+      opening = read(MANIFEST_KEY).then((stored) => {
+        manifest = new Map();
+        nextId = stored?.nextId ?? 0;
+        for (const [id, title, updated, topics] of stored?.notes ?? []) {
+          manifest.set(id, { id, title, updated, topics });
+        }
+      });
+    }
+    return opening;
+  };
+
+  const saveManifest = () => schedule(MANIFEST_KEY, () => write(MANIFEST_KEY, {
+    version: 1,
+    nextId,
+    notes: [...manifest.values()].map(({ id, title, updated, topics }) => [id, title, updated, topics])
+  }));
+
+  const saveNote = (note) => schedule(noteKey(note.id), () => write(noteKey(note.id), note));
+
+  const saveShard = (shard) => schedule(shardKey(shard), async () => {
+    const terms = await loadShard(shard);
+    const data = {};
+    for (const [term, ids] of terms) data[term] = [...ids];
+    await write(shardKey(shard), data);
+  });
+
+  const loadShard = (shard) => {
+    if (!shards.has(shard)) {
+      shards.set(shard, read(shardKey(shard)).then((data) => {
+        const terms = new Map();
+        for (const [term, ids] of Object.entries(data ?? {})) terms.set(term, new Set(ids));
+        shards.set(shard, terms);
+        return terms;
+      }));
+    }
+    return Promise.resolve(shards.get(shard));
+  };
+
+  const loadVocabulary = () => {
+    if (!vocabulary) {
+      vocabulary = read(TERMS_KEY).then((stored) => {
+        vocabulary = stored ?? [];
+        return vocabulary;
+      });
+    }
+    return Promise.resolve(vocabulary);
+  };
+
+  const saveVocabulary = () => schedule(TERMS_KEY, async () => write(TERMS_KEY, [...await loadVocabulary()]));
+
+  // Applies the difference between two term sets of one note to the index.
+  // Diffs are applied one at a time, in call order, so quick successive
+  // edits of a note cannot interleave.
+  let indexing = Promise.resolve();
+  const reindex = (id, before, after) => {
+    indexing = indexing.then(() => applyDiff(id, before, after)).catch((error) => {
+      console.error('Error updating notes index:', error);
+    });
+    return indexing;
+  };
+
+  const applyDiff = async (id, before, after) => {
+    const touched = new Set();
+    const changes = [];
+    for (const term of before) if (!after.has(term)) changes.push([term, false]);
+    for (const term of after) if (!before.has(term)) changes.push([term, true]);
+    if (changes.length === 0) return;
+    const vocabularyTerms = await loadVocabulary();
+    let vocabularyChanged = false;
+    for (const [term, present] of changes) {
+      const shard = shardOf(term);
+      const terms = await loadShard(shard);
+      let ids = terms.get(term);
+      if (present) {
+        if (!ids) {
+          terms.set(term, ids = new Set());
+          vocabularyTerms.splice(lowerBound(vocabularyTerms, term), 0, term);
+          vocabularyChanged = true;
+        }
+        ids.add(id);
+      } else if (ids) {
+        ids.delete(id);
+        if (ids.size === 0) {
+          terms.delete(term);
+          const i = lowerBound(vocabularyTerms, term);
+          if (vocabularyTerms[i] === term) vocabularyTerms.splice(i, 1);
+          vocabularyChanged = true;
+        }
+      }
+      touched.add(shard);
+    }
+    touched.forEach(saveShard);
+    if (vocabularyChanged) saveVocabulary();
+  };
+
+  const entry = ({ id, title, updated, topics }) => ({ id, title, updated, topics });
+
+  // Every note's { id, title, updated, topics }, most recently edited first
+  const list = async () => {
+    await open();
+    return [...manifest.values()].sort((a, b) => b.updated - a.updated);
+  };
+
+  const get = async (id) => {
+    await open();
+    if (!manifest.has(id)) return null;
+    if (!loaded.has(id)) {
+      const note = await read(noteKey(id));
+      if (!loaded.has(id)) loaded.set(id, note ?? { ...manifest.get(id), body: '', created: 0 });
+    }
+    return loaded.get(id);
+  };
+
+  return {
+    list,
+
+    get,
+
+    forTopic: async (topicKey) => (await list()).filter(note => note.topics.includes(topicKey)),
+
+    async create({ title = 'Untitled note', body = '', topics = [] } = {}) {
+      await open();
+      const now = Date.now();
+      const note = { id: nextId++, title, body, topics, created: now, updated: now };
+      loaded.set(note.id, note);
+      manifest.set(note.id, entry(note));
+      saveNote(note);
+      saveManifest();
+      await reindex(note.id, new Set(), termsOf(note));
+      return note;
+    },
+
+    // Applies { title, body, topics } changes; resolves with the new note
+    async update(id, changes) {
+      const previous = await get(id);
+      if (!previous) return null;
+      const note = { ...previous, ...changes, updated: Date.now() };
+      loaded.set(id, note);
+      manifest.set(id, entry(note));
+      saveNote(note);
+      saveManifest();
+      if (note.title !== previous.title || note.body !== previous.body) {
+        await reindex(id, termsOf(previous), termsOf(note));
+      }
+      return note;
+    },
+
+    async remove(id) {
+      const note = await get(id);
+      if (!note) return;
+      loaded.delete(id);
+      manifest.delete(id);
+      saveManifest();
+      schedule(noteKey(id), async () => {
+        try {
+          await storage.delete(noteKey(id));
+        } catch (error) {
+          console.log(`Could not delete ${noteKey(id)}`);
+        }
+      });
+      await reindex(id, termsOf(note), new Set());
+    },
+
+    // Ids of notes containing every query term, the last one also as a
+    // prefix, most recently edited first. Single characters only count as
+    // the last term, since the index holds none.
+    async search(query) {
+      await open();
+      await indexing;
+      const tokens = tokenize(query, 1);
+      const queryTerms = tokens.filter((token, i) => token.length > 1 || i === tokens.length - 1);
+      if (queryTerms.length === 0) return [];
+      const last = queryTerms.pop();
+      let matches = null;
+      for (const term of queryTerms) {
+        const ids = (await loadShard(shardOf(term))).get(term) ?? new Set();
+        matches = matches ? new Set([...matches].filter(id => ids.has(id))) : new Set(ids);
+      }
+      // Terms starting with the last one sit together in the sorted list
+      const terms = await loadVocabulary();
+      const prefixed = new Set();
+      for (let i = lowerBound(terms, last); i < terms.length && terms[i].startsWith(last); i++) {
+        const ids = (await loadShard(shardOf(terms[i]))).get(terms[i]);
+        ids?.forEach(id => prefixed.add(id));
+      }
+      const found = matches ? [...matches].filter(id => prefixed.has(id)) : [...prefixed];
+      return found
+        .filter(id => manifest.has(id))
+        .sort((a, b) => manifest.get(b).updated - manifest.get(a).updated);
+    }
+  };
+};
@@ -0,0 +1,129 @@
+// Related topics, precomputed when the content is built
+// (scripts/build-curriculum.mjs, scripts/prerender.mjs).
+//
+// Every topic's title, content, formulas and key points become a TF-IDF
+// vector: sorted term ids in a Uint32Array and L2-normalized weights in a
+// Float32Array. Cosine similarities are accumulated through per-term
+// posting lists, so a topic is only compared with topics it shares a term
+// with. The top `k` neighbors per topic, across all sections of a domain,
+// are stored in each section's content:
+//
+//   related: { [topicKey]: [{ branch, subject, topicKey, title, subjectName }] }
+//
+// so the app looks them up by key and computes nothing at runtime.
+
+import { tokenize } from './searchIndex.js';
+
+const FIELD_WEIGHTS = {
+  title: 3,
+  keyPoints: 2,
+  formulas: 1.5,
+  content: 1
+};
+
+// Words that say nothing about what a topic covers
+const STOP_WORDS = new Set([
+  'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'into', 'is', 'it', 'of', 'on',
+  'or', 'the', 'to', 'vs', 'with'
+]);
+
+const DEFAULT_K = 3;
+// Weaker matches share little more than a common word
+const MIN_SIMILARITY = 0.03;
+
+// Raw term weights of one topic
+const termWeights = (topic) => {
+  const weights = new Map();
+  for (const [field, weight] of Object.entries(FIELD_WEIGHTS)) {
+    const value = topic[field];
+    if (!value) continue;
+    const text = Array.isArray(value) ? value.join(' ') : value;
+    for (const term of tokenize(text)) {
+      if (STOP_WORDS.has(term)) continue;
+      weights.set(term, (weights.get(term) ?? 0) + weight);
+    }
+  }
+  return weights;
+};
+
+// { [branch]: { [topicKey]: neighbors } } for a domain's contents
+// ({ [branch]: { subjects } })
+export const buildRelated = (contents, { k = DEFAULT_K } = {}) => {
+  const docs = [];
+  for (const [branch, content] of Object.entries(contents)) {
+    for (const [subject, { name, topics }] of Object.entries(content.subjects)) {
+      topics.forEach((topic, idx) => {
+        docs.push({ branch, subject, topicKey: `${subject}-${idx}`, title: topic.title, subjectName: name, weights: termWeights(topic) });
+      });
+    }
+  }
+
+  const termIds = new Map();
+  const docFrequency = [];
+  for (const { weights } of docs) {
+    for (const term of weights.keys()) {
+      if (!termIds.has(term)) {
+        termIds.set(term, termIds.size);
+        docFrequency.push(0);
+      }
+      docFrequency[termIds.get(term)]++;
+    }
+  }
+
+  // Sparse, normalized TF-IDF vectors
+  const vectors = docs.map(({ weights }) => {
+    // A term in every topic weighs nothing and is left out
+    const entries = [...weights].map(([term, tf]) => {
+      const id = termIds.get(term);
+      return [id, tf * Math.log(docs.length / docFrequency[id])];
+    }).filter(([, weight]) => weight > 0).sort((a, b) => a[0] - b[0]);
+    const norm = Math.hypot(...entries.map(([, weight]) => weight)) || 1;
+    return {
+      ids: Uint32Array.from(entries, ([id]) => id),
+      weights: Float32Array.from(entries, ([, weight]) => weight / norm)
+    };
+  });
+
+  // term id -> the docs containing it, with their weights
+  const postings = Array.from({ length: termIds.size }, () => ({ docs: [], weights: [] }));
+  vectors.forEach(({ ids, weights }, doc) => {
+    ids.forEach((id, i) => {
+      postings[id].docs.push(doc);
+      postings[id].weights.push(weights[i]);
+    });
+  });
+
+  const related = Object.fromEntries(Object.keys(contents).map(branch => [branch, {}]));
+  const scores = new Float32Array(docs.length);
+  const touched = [];
+  vectors.forEach(({ ids, weights }, doc) => {
+    ids.forEach((id, i) => {
+      const posting = postings[id];
+      for (let j = 0; j < posting.docs.length; j++) {
+        const other = posting.docs[j];
+        if (other === doc) continue;
+        if (scores[other] === 0) touched.push(other);
+        scores[other] += weights[i] * posting.weights[j];
+      }
+    });
+    const best = touched
+      .filter(other => scores[other] >= MIN_SIMILARITY)
+      .sort((a, b) => scores[b] - scores[a] || a - b)
+      .slice(0, k);
+    for (const other of touched) scores[other] = 0;
+    touched.length = 0;
+    if (best.length === 0) return;
+    const { branch, topicKey } = docs[doc];
+    related[branch][topicKey] = best.map((other) => {
+      const { weights: _, ...entry } = docs[other];
+      return entry;
+    });
+  });
+  return related;
+};
+
+// The contents with each section's `related` map added
+export const withRelated = (contents, options) => {
+  const related = buildRelated(contents, options);
+  return Object.fromEntries(Object.entries(contents).map(([branch, content]) => [branch, { ...content, related: related[branch] }]));
+};
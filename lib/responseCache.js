@@ -0,0 +1,107 @@
+// LRU cache of finished chat replies, persisted to storage (lib/storage.js).
+//
+// Entries are keyed on the normalized query, the selected branch and the AI
+// model, and evicted least-recently-used first once there are more than
+// `maxEntries`, or on access once older than `maxAge`. The stored copy is
+// tagged with the curriculum content version and dropped on load if the
+// content has changed since, as the replies quote topic content.
+
+const STORAGE_KEY = 'response_cache';
+const PERSIST_DELAY = 1000;
+
+export const normalizeQuery = (query) =>
+  query.toLowerCase().split(/[^\p{L}\p{N}]+/u).filter(Boolean).join(' ');
+
+export const responseCacheKey = (query, branch, model) => `${model}|${branch}|${normalizeQuery(query)}`;
+
+export const createResponseCache = ({ storage, version, maxEntries = 200, maxAge = 7 * 24 * 60 * 60 * 1000 }) => {
+  // Map iteration order doubles as recency order: oldest first
+  const entries = new Map();
+  let hits = 0;
+  let misses = 0;
+  let persistTimer = null;
+
+  const persist = async () => {
+    clearTimeout(persistTimer);
+    persistTimer = null;
+    const data = { version, entries: [...entries].map(([key, { text, time }]) => [key, text, time]) };
+    await storage.set(STORAGE_KEY, data);
+  };
+
+  const schedulePersist = () => {
+    if (persistTimer) return;
+    persistTimer = setTimeout(() => {
+      persist().catch((error) => console.error('Error saving response cache:', error));
+    }, PERSIST_DELAY);
+  };
+
+  const evict = () => {
+    while (entries.size > maxEntries) {
+      entries.delete(entries.keys().next().value);
+    }
+  };
+
+  return {
+    async load() {
+      let stored = null;
+      try {
+        stored = (await storage.get(STORAGE_KEY)) ?? null;
+      } catch (error) {
+        stored = null;
+      }
+      if (!stored) return;
+      if (stored.version !== version) {
+        schedulePersist();
+        return;
+      }
+      // Stored entries are older than anything cached this session, so
+      // they go first and are the first evicted
+      const current = [...entries];
+      entries.clear();
+      const now = Date.now();
+      for (const [key, text, time] of stored.entries) {
+        if (now - time < maxAge) {
+          entries.set(key, { text, time });
+        }
+      }
+      for (const [key, entry] of current) {
+        entries.delete(key);
+        entries.set(key, entry);
+      }
+      evict();
+    },
+
+    get(key) {
+      const entry = entries.get(key);
+      if (!entry || Date.now() - entry.time >= maxAge) {
+        if (entry) {
+          entries.delete(key);
+          schedulePersist();
+        }
+        misses++;
+        return null;
+      }
+      entries.delete(key);
+      entries.set(key, entry);
+      hits++;
+      return entry.text;
+    },
+
+    set(key, text) {
+      entries.delete(key);
+      entries.set(key, { text, time: Date.now() });
+      evict();
+      schedulePersist();
+    },
+
+    clear() {
+      entries.clear();
+      schedulePersist();
+    },
+
+    // Writes a pending change now instead of after the debounce delay
+    flush: () => (persistTimer ? persist() : Promise.resolve()),
+
+    stats: () => ({ hits, misses, size: entries.size })
+  };
+};
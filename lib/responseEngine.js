@@ -0,0 +1,139 @@
+// Chat response engines.
+//
+// An engine is `{ name, stream(query, context, { signal }) }`, where
+// `stream` returns an async iterable of text chunks. `settings.aiModel`
+// picks the engine from the registry; a model backend can be plugged in
+// with registerEngine() without touching the chat UI.
+//
+// `context` carries the current branch plus the retrieval results for the
+// query: `intent` (explain / formula / example / difference, or null) and
+// `topics`, the best matching curriculum topics. `history` holds the most
+// recent chat messages ({ type, text }, oldest first), up to the chat
+// context window set in the settings.
+
+const nextFrame = (fn) => (typeof requestAnimationFrame === 'function' ? requestAnimationFrame(fn) : setTimeout(fn, 16));
+const cancelFrame = (id) => (typeof cancelAnimationFrame === 'function' ? cancelAnimationFrame(id) : clearTimeout(id));
+
+const sleep = (ms, signal) => new Promise((resolve) => {
+  const timer = setTimeout(resolve, ms);
+  signal?.addEventListener('abort', () => {
+    clearTimeout(timer);
+    resolve();
+  }, { once: true });
+});
+
+export const abortError = () => {
+  const error = new Error('Reply cancelled');
+  error.name = 'AbortError';
+  return error;
+};
+
+const bulletList = (label, items) => (
+  items && items.length > 0 ? `\n\n${label}:\n${items.map(item => `• ${item}`).join('\n')}` : ''
+);
+
+const SOLUTION_STEPS = '1. Identify the given parameters\n2. Apply the relevant formula\n3. Calculate the result\n4. Verify the answer';
+
+// Answer built from the topics retrieved for the query
+const topicReply = (intent, [topic, other]) => {
+  const heading = `${topic.title} (${topic.subjectName})`;
+  switch (intent) {
+    case 'formula':
+      return `Key formulas for ${heading}:${bulletList('Formulas', topic.formulas)}${bulletList('Key points', topic.keyPoints)}`;
+    case 'example':
+      return `Worked examples for ${heading}:${bulletList('Examples', topic.examples)}${bulletList('Formulas', topic.formulas)}\n\nApproach:\n${SOLUTION_STEPS}`;
+    case 'difference':
+      if (other) {
+        return `${topic.title} vs ${other.title}:\n\n${topic.title}: ${topic.content}${bulletList('Key points', topic.keyPoints)}\n\n${other.title}: ${other.content}${bulletList('Key points', other.keyPoints)}`;
+      }
+      // Only one side was found: falls through to explaining it
+    default:
+      return `${heading}\n${topic.content}${bulletList('Key points', topic.keyPoints)}${bulletList('Formulas', topic.formulas)}${bulletList('Examples', topic.examples)}`;
+  }
+};
+
+// The original canned replies, for queries that match no topic
+const fallbackReply = (query, { intent, branchName }) => {
+  switch (intent) {
+    case 'explain':
+      return `Let me explain that concept: This is a comprehensive topic that involves multiple aspects. ${query.toLowerCase().includes('algorithm') ? 'Algorithms are step-by-step procedures for calculations. Key points include time complexity, space complexity, and optimization techniques.' : 'This concept relates to your selected branch and involves theoretical and practical applications.'}`;
+    case 'formula':
+      return 'Here are the key formulas related to your query. Would you like me to explain any specific formula in detail?';
+    case 'example':
+      return `Let me provide a step-by-step solution:\n${SOLUTION_STEPS}`;
+    case 'difference':
+      return 'Here are the key differences in a comparison table format, highlighting the main distinctions between the concepts.';
+    default:
+      return `I understand you're asking about "${query}". Based on your current branch (${branchName}), I can help you with concepts, formulas, problem-solving, and explanations. What specific aspect would you like to explore?`;
+  }
+};
+
+const localReply = (query, context) => (
+  context.topics && context.topics.length > 0
+    ? topicReply(context.intent, context.topics)
+    : fallbackReply(query, context)
+);
+
+// Local engine that needs no network. With `streaming` it emits one word
+// (plus trailing whitespace) per chunk, optionally `tokenDelay` ms apart,
+// which makes it usable as a mock model in tests.
+export const createLocalEngine = ({ name = 'local', streaming = true, tokenDelay = 0 } = {}) => ({
+  name,
+  async *stream(query, context, { signal } = {}) {
+    const reply = localReply(query, context);
+    if (!streaming) {
+      yield reply;
+      return;
+    }
+    for (const token of reply.match(/\S+\s*/g) || []) {
+      if (signal?.aborted) return;
+      if (tokenDelay > 0) await sleep(tokenDelay, signal);
+      yield token;
+    }
+  }
+});
+
+const engines = {
+  basic: createLocalEngine({ name: 'basic', streaming: false }),
+  advanced: createLocalEngine({ name: 'advanced' }),
+  // Uses the local engine until a model backend is registered for it
+  expert: createLocalEngine({ name: 'expert' })
+};
+
+export const registerEngine = (model, engine) => {
+  engines[model] = engine;
+};
+
+export const getEngine = (model) => engines[model] || engines.advanced;
+
+// Runs an engine and reports the growing reply through `onUpdate`, at most
+// once per animation frame however fast chunks arrive. Resolves with the
+// full reply; rejects with an AbortError (after a final update with the
+// partial text) if `signal` fires first.
+export const streamReply = async (engine, query, context, { signal, onUpdate }) => {
+  let text = '';
+  let flushed = '';
+  let frame = null;
+
+  const flush = () => {
+    frame = null;
+    if (text !== flushed) {
+      flushed = text;
+      onUpdate(text);
+    }
+  };
+
+  try {
+    for await (const chunk of engine.stream(query, context, { signal })) {
+      if (signal?.aborted) break;
+      text += chunk;
+      if (frame === null) frame = nextFrame(flush);
+    }
+  } finally {
+    if (frame !== null) cancelFrame(frame);
+    flush();
+  }
+
+  if (signal?.aborted) throw abortError();
+  return text;
+};
@@ -0,0 +1,39 @@
+// URLs of the prerendered curriculum views (scripts/prerender.mjs):
+//
+//   /learn/<branch>/                    the branch and its subjects
+//   /learn/<branch>/<subject>/          a subject and its topics
+//   /learn/<branch>/<subject>/<idx>/    the same with topic `${subject}-${idx}` expanded
+//
+// Each page embeds its branch's content as JSON, so the app can take over
+// the view without fetching the content again.
+
+export const LEARN_BASE = '/learn';
+export const PRERENDERED_STATE_ID = 'prerendered-state';
+
+export const pathFor = ({ branch, subject = null, topicKey = null }) => {
+  let path = `${LEARN_BASE}/${branch}/`;
+  if (subject) path += `${subject}/`;
+  if (subject && topicKey) path += `${topicKey.slice(subject.length + 1)}/`;
+  return path;
+};
+
+// { branch, subject, topicKey } for a view URL of a branch in `manifest`,
+// otherwise null. subject and topicKey are null when not part of the URL.
+export const parsePath = (pathname, manifest) => {
+  if (!pathname.startsWith(`${LEARN_BASE}/`)) return null;
+  const [branch, subject = null, idx = null, ...rest] = pathname.slice(LEARN_BASE.length + 1).split('/').filter(Boolean);
+  if (!manifest[branch] || rest.length > 0 || (idx !== null && !/^\d+$/.test(idx))) return null;
+  return { branch, subject, topicKey: idx === null ? null : `${subject}-${idx}` };
+};
+
+// { branch, content } embedded in a prerendered page, or null
+export const readPrerendered = () => {
+  if (typeof document === 'undefined') return null;
+  const element = document.getElementById(PRERENDERED_STATE_ID);
+  if (!element) return null;
+  try {
+    return JSON.parse(element.textContent);
+  } catch (error) {
+    return null;
+  }
+};
@@ -0,0 +1,174 @@
+// Inverted full-text index over curriculum topics.
+//
+// Documents are tokenized once when added; a query only touches the posting
+// lists of its own terms (plus a bounded prefix expansion of the last term,
+// so results update while the user is still typing a word).
+
+const FIELD_WEIGHTS = {
+  title: 5,
+  keyPoints: 2,
+  formulas: 2,
+  content: 1.5,
+  examples: 1
+};
+
+// Upper bound on how many index terms a partial word may expand to
+const MAX_PREFIX_TERMS = 64;
+// Prefix matches rank below exact matches of the same term
+const PREFIX_WEIGHT = 0.6;
+
+export const tokenize = (text, minLength = 2) =>
+  String(text)
+    .toLowerCase()
+    .split(/[^\p{L}\p{N}]+/u)
+    .filter((token) => token.length >= minLength);
+
+export const createSearchIndex = () => {
+  const docs = [];
+  // term -> { ids, weights }; ids are appended in increasing doc order
+  const postings = new Map();
+  let sortedTerms = [];
+  let termsDirty = false;
+  // Per-doc scratch space reused by every query, grown as docs are added
+  let scores = new Float64Array(0);
+  let matched = new Uint8Array(0);
+
+  const add = (doc, fields) => {
+    const id = docs.length;
+    docs.push(doc);
+    for (const [field, weight] of Object.entries(FIELD_WEIGHTS)) {
+      const value = fields[field];
+      if (!value) continue;
+      const text = Array.isArray(value) ? value.join(' ') : value;
+      for (const term of tokenize(text)) {
+        let list = postings.get(term);
+        if (!list) {
+          list = { ids: [], weights: [] };
+          postings.set(term, list);
+          termsDirty = true;
+        }
+        const last = list.ids.length - 1;
+        if (list.ids[last] === id) {
+          list.weights[last] += weight;
+        } else {
+          list.ids.push(id);
+          list.weights.push(weight);
+        }
+      }
+    }
+    return id;
+  };
+
+  // Sorted term list for prefix lookups, rebuilt only after new terms arrive
+  const terms = () => {
+    if (termsDirty) {
+      sortedTerms = [...postings.keys()].sort();
+      termsDirty = false;
+    }
+    return sortedTerms;
+  };
+
+  // Posting lists for a query term: the exact term, plus (for the term being
+  // typed) up to MAX_PREFIX_TERMS longer terms starting with it.
+  const expand = (term, withPrefix) => {
+    const lists = [];
+    if (postings.has(term)) lists.push([postings.get(term), 1]);
+    if (!withPrefix) return lists;
+    const all = terms();
+    let lo = 0;
+    let hi = all.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >>> 1;
+      if (all[mid] < term) lo = mid + 1;
+      else hi = mid;
+    }
+    for (let i = lo, n = 0; i < all.length && n < MAX_PREFIX_TERMS && all[i].startsWith(term); i++) {
+      if (all[i] !== term) {
+        lists.push([postings.get(all[i]), PREFIX_WEIGHT]);
+        n++;
+      }
+    }
+    return lists;
+  };
+
+  // Returns up to `limit` documents containing every query term (or, with
+  // `match: 'any'`, at least one), best first. Unless `prefix` is false the
+  // last term also matches as a prefix.
+  const search = (query, limit = 20, { match = 'all', prefix = true } = {}) => {
+    const tokens = tokenize(query, 1);
+    const queryTerms = tokens.filter((token, i) => token.length > 1 || i === tokens.length - 1);
+    if (queryTerms.length === 0 || limit <= 0) return [];
+
+    if (scores.length < docs.length) {
+      scores = new Float64Array(docs.length);
+      matched = new Uint8Array(docs.length);
+    }
+
+    // matched[id] counts how many query terms (in order) a doc has hit so
+    // far; a doc only stays in the running if it matched every earlier term.
+    // In 'any' mode it just flags docs that matched something.
+    const any = match === 'any';
+    const candidates = [];
+    queryTerms.forEach((term, t) => {
+      for (const [list, boost] of expand(term, prefix && t === queryTerms.length - 1)) {
+        const idf = Math.log(1 + docs.length / list.ids.length) * boost;
+        const { ids, weights } = list;
+        for (let k = 0; k < ids.length; k++) {
+          const id = ids[k];
+          if (any) {
+            if (matched[id] === 0) {
+              candidates.push(id);
+              matched[id] = 1;
+            }
+            scores[id] += weights[k] * idf;
+            continue;
+          }
+          if (matched[id] === t) {
+            if (t === 0) candidates.push(id);
+            matched[id] = t + 1;
+          }
+          if (matched[id] === t + 1) scores[id] += weights[k] * idf;
+        }
+      }
+    });
+
+    const top = [];
+    for (const id of candidates) {
+      const score = scores[id];
+      const hit = any || matched[id] === queryTerms.length;
+      scores[id] = 0;
+      matched[id] = 0;
+      if (!hit || (top.length === limit && score <= top[top.length - 1].score)) continue;
+      let pos = top.length;
+      while (pos > 0 && top[pos - 1].score < score) pos--;
+      top.splice(pos, 0, { id, score });
+      if (top.length > limit) top.pop();
+    }
+    return top.map(({ id, score }) => ({ ...docs[id], score }));
+  };
+
+  return {
+    add,
+    search,
+    get size() {
+      return docs.length;
+    }
+  };
+};
+
+// Adds every topic of a loaded branch to the index, keyed like the topic
+// cards (`${subject}-${idx}`).
+export const indexBranch = (index, branchKey, content) => {
+  for (const [subjectKey, subject] of Object.entries(content.subjects)) {
+    subject.topics.forEach((topic, idx) => {
+      index.add({
+        topicKey: `${subjectKey}-${idx}`,
+        branch: branchKey,
+        subject: subjectKey,
+        idx,
+        subjectName: subject.name,
+        title: topic.title
+      }, topic);
+    });
+  }
+};
@@ -0,0 +1,305 @@
+// Key-value storage with pluggable backends, a read-through/write-back
+// cache, batched writes and per-key stats.
+//
+// Values are plain data (objects, arrays, strings, numbers), not JSON text:
+// how they are encoded is up to the backend.
+//
+//   windowStorageBackend   window.storage, values as JSON strings. `parse`
+//                          and `stringify` may be async (e.g. run in the
+//                          compute worker) and get the key as well.
+//   indexedDBBackend       IndexedDB, values stored by structured clone
+//   memoryBackend          in-memory, for tests and benchmarks
+//
+// A backend is { name, read(key) -> { value, bytes }, write(batch) ->
+// bytes[] }, where `batch` is [[key, value]] and an undefined value deletes
+// the key. `value` is undefined for a missing key; `bytes` is the encoded
+// size, or null where the backend does not know it.
+//
+// set() and delete() update the cache at once and are written back
+// together once the current task's synchronous work is done (or on
+// flush()), as one backend.write() call, which IndexedDB runs as one
+// transaction. Waiting for the next task instead would batch a little more
+// but can miss the write on pagehide. A read of a key with a pending
+// write returns the pending value. The last `maxEntries` values read or
+// set are cached, for the keys `shouldCache(key)` accepts. Values are held
+// by reference, so callers must not mutate a value after handing it to
+// set() unless they set() it again.
+
+// Stats are kept per key, with per-item keys grouped by what precedes ':'
+// (chat_log:12 -> chat_log:*)
+export const keyGroup = (key) => {
+  const colon = key.indexOf(':');
+  return colon === -1 ? key : `${key.slice(0, colon)}:*`;
+};
+
+const now = () => (typeof performance !== 'undefined' ? performance.now() : Date.now());
+
+export const windowStorageBackend = ({
+  getStorage = () => window.storage,
+  parse = JSON.parse,
+  stringify = JSON.stringify
+} = {}) => ({
+  name: 'window.storage',
+
+  async read(key) {
+    let result = null;
+    try {
+      result = await getStorage().get(key);
+    } catch (error) {
+      // window.storage rejects for keys it does not have
+      return { value: undefined, bytes: 0 };
+    }
+    if (!result) return { value: undefined, bytes: 0 };
+    return { value: await parse(result.value, key), bytes: result.value.length };
+  },
+
+  write: (batch) => Promise.all(batch.map(async ([key, value]) => {
+    if (value === undefined) {
+      try {
+        await getStorage().delete(key);
+      } catch (error) {
+        console.log(`Could not delete ${key}`);
+      }
+      return 0;
+    }
+    const text = await stringify(value, key);
+    await getStorage().set(key, text);
+    return text.length;
+  }))
+});
+
+const transactionDone = (transaction) => new Promise((resolve, reject) => {
+  transaction.oncomplete = () => resolve();
+  transaction.onerror = () => reject(transaction.error);
+  transaction.onabort = () => reject(transaction.error ?? new Error('Transaction aborted'));
+});
+
+export const indexedDBBackend = ({ database = 'ai-assistant', storeName = 'kv' } = {}) => {
+  let opening = null;
+
+  const open = () => {
+    if (!opening) {
+      opening = new Promise((resolve, reject) => {
+        const request = indexedDB.open(database, 1);
+        request.onupgradeneeded = () => request.result.createObjectStore(storeName);
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+      });
+      opening.catch(() => {
+        opening = null;
+      });
+    }
+    return opening;
+  };
+
+  return {
+    name: 'indexeddb',
+
+    async read(key) {
+      const transaction = (await open()).transaction(storeName);
+      const request = transaction.objectStore(storeName).get(key);
+      await transactionDone(transaction);
+      return { value: request.result, bytes: null };
+    },
+
+    async write(batch) {
+      const transaction = (await open()).transaction(storeName, 'readwrite');
+      const store = transaction.objectStore(storeName);
+      for (const [key, value] of batch) {
+        if (value === undefined) store.delete(key);
+        else store.put(value, key);
+      }
+      await transactionDone(transaction);
+      return batch.map(() => null);
+    }
+  };
+};
+
+// Values are copied in and out, as IndexedDB would
+export const memoryBackend = (initial = {}) => {
+  const values = new Map(Object.entries(initial));
+  return {
+    name: 'memory',
+    read: async (key) => ({ value: values.has(key) ? structuredClone(values.get(key)) : undefined, bytes: null }),
+    write: async (batch) => batch.map(([key, value]) => {
+      if (value === undefined) values.delete(key);
+      else values.set(key, structuredClone(value));
+      return null;
+    })
+  };
+};
+
+// IndexedDB where available, otherwise memory. The app keeps window.storage
+// as long as it is present, since that is where existing data lives.
+export const defaultBackend = () => {
+  if (typeof window !== 'undefined' && window.storage) return windowStorageBackend();
+  if (typeof indexedDB !== 'undefined') return indexedDBBackend();
+  return memoryBackend();
+};
+
+const emptyStat = () => ({ count: 0, totalMs: 0, maxMs: 0 });
+
+const addSample = (stat, ms) => {
+  stat.count++;
+  stat.totalMs += ms;
+  stat.maxMs = Math.max(stat.maxMs, ms);
+};
+
+// `onOperation(op, key, start, ms, bytes)` is called for every backend
+// read, write and delete (e.g. to record trace events)
+export const createStorage = ({ backend, maxEntries = 100, shouldCache = () => true, onOperation } = {}) => {
+  // key -> clean value; Map order is recency order
+  const cache = new Map();
+  // key -> value (undefined = delete) waiting for the next write, and the
+  // values of the write in flight
+  const dirty = new Map();
+  const flushing = new Map();
+  // key -> promise of a backend read in flight
+  const reading = new Map();
+  let writing = Promise.resolve();
+  // { written, resolve, reject } for the next write
+  let waiting = null;
+  let scheduled = false;
+  let stats = new Map();
+
+  const statOf = (key) => {
+    const group = keyGroup(key);
+    if (!stats.has(group)) {
+      stats.set(group, { reads: emptyStat(), writes: emptyStat(), deletes: emptyStat(), hits: 0, bytesRead: 0, bytesWritten: 0 });
+    }
+    return stats.get(group);
+  };
+
+  const remember = (key, value) => {
+    cache.delete(key);
+    if (!shouldCache(key)) return;
+    cache.set(key, value);
+    if (cache.size > maxEntries) cache.delete(cache.keys().next().value);
+  };
+
+  const read = async (key) => {
+    const start = now();
+    const { value, bytes } = await backend.read(key);
+    const ms = now() - start;
+    const stat = statOf(key);
+    addSample(stat.reads, ms);
+    stat.bytesRead += bytes ?? 0;
+    onOperation?.('read', key, start, ms, bytes);
+    return value;
+  };
+
+  const writeBatch = async (batch, { resolve, reject }) => {
+    const start = now();
+    try {
+      const sizes = await backend.write(batch);
+      const ms = now() - start;
+      batch.forEach(([key, value], i) => {
+        const stat = statOf(key);
+        addSample(value === undefined ? stat.deletes : stat.writes, ms);
+        stat.bytesWritten += sizes[i] ?? 0;
+        onOperation?.(value === undefined ? 'delete' : 'write', key, start, ms, sizes[i]);
+      });
+      resolve();
+    } catch (error) {
+      // Keep the values for the next flush unless newer ones were set
+      for (const [key, value] of batch) {
+        if (!dirty.has(key)) dirty.set(key, value);
+      }
+      reject(error);
+    } finally {
+      for (const [key, value] of batch) {
+        if (flushing.get(key) === value) flushing.delete(key);
+      }
+    }
+  };
+
+  const pending = () => {
+    if (!waiting) {
+      let resolve;
+      let reject;
+      const written = new Promise((res, rej) => {
+        resolve = res;
+        reject = rej;
+      });
+      waiting = { written, resolve, reject };
+    }
+    return waiting;
+  };
+
+  // Writes everything pending, after any write in flight. Resolves once
+  // it is stored.
+  const flush = () => {
+    scheduled = false;
+    if (dirty.size === 0) return writing.catch(() => {});
+    const batch = [...dirty];
+    const done = pending();
+    dirty.clear();
+    waiting = null;
+    for (const [key, value] of batch) flushing.set(key, value);
+    writing = writing.catch(() => {}).then(() => writeBatch(batch, done));
+    return done.written;
+  };
+
+  // Resolves once `key`'s current value is written
+  const schedule = (key, value) => {
+    dirty.set(key, value);
+    if (value === undefined) cache.delete(key);
+    else remember(key, value);
+    if (!scheduled) {
+      scheduled = true;
+      queueMicrotask(() => {
+        if (scheduled) flush();
+      });
+    }
+    return pending().written;
+  };
+
+  return {
+    backend: backend.name,
+
+    // The stored value, or undefined
+    async get(key) {
+      for (const values of [dirty, flushing]) {
+        if (values.has(key)) {
+          statOf(key).hits++;
+          return values.get(key);
+        }
+      }
+      if (cache.has(key)) {
+        statOf(key).hits++;
+        const value = cache.get(key);
+        remember(key, value);
+        return value;
+      }
+      if (!reading.has(key)) {
+        reading.set(key, read(key).then((value) => {
+          // A set() while the read was in flight wins
+          if (value !== undefined && !dirty.has(key) && !flushing.has(key)) remember(key, value);
+          return value;
+        }).finally(() => {
+          reading.delete(key);
+        }));
+      }
+      const value = await reading.get(key);
+      // Reflect a set() or delete() made while the read was in flight
+      if (dirty.has(key)) return dirty.get(key);
+      if (flushing.has(key)) return flushing.get(key);
+      return value;
+    },
+
+    set: (key, value) => schedule(key, value),
+
+    delete: (key) => schedule(key, undefined),
+
+    flush,
+
+    // { [key]: { reads, writes, deletes: { count, totalMs, maxMs }, hits,
+    // bytesRead, bytesWritten } }; bytes only count where the backend
+    // knows them
+    stats: () => Object.fromEntries([...stats].map(([group, stat]) => [group, structuredClone(stat)])),
+
+    resetStats() {
+      stats = new Map();
+    }
+  };
+};
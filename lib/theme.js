@@ -0,0 +1,79 @@
+// Theming: accent colors as static class names, theme and font size as CSS
+// variables on the document root.
+//
+// Tailwind only generates the classes it finds written out in the source,
+// so a class assembled from a color name at runtime never makes it into the
+// stylesheet. Every accent class is spelled out here instead; a color used
+// by `branchManifest`, a track manifest or `modes` needs an entry.
+//
+// Neutral colors (page, surfaces, borders, text) are --app-* variables that
+// components use through arbitrary-value classes such as
+// bg-[var(--app-surface)] and text-[var(--app-muted)]. applyTheme() writes
+// the theme's values for them, and the font size to the root font size,
+// which every rem-based Tailwind size follows. Switching either restyles
+// the page without re-rendering components.
+//
+//   --app-bg             page and inset panels          (gray-900 in dark)
+//   --app-surface        cards, inputs, list items      (gray-800)
+//   --app-raised         hovered surfaces, buttons      (gray-700)
+//   --app-raised-hover   hovered buttons                (gray-600)
+//   --app-border         borders, dividers              (gray-700)
+//   --app-border-strong  hovered borders                (gray-600)
+//   --app-text           body text
+//   --app-text-soft      secondary text                 (gray-300)
+//   --app-muted          labels, hints, idle icons      (gray-400)
+//   --app-faint          timestamps, placeholders       (gray-500)
+
+export const ACCENTS = {
+  blue: { selected: 'border-blue-500 bg-blue-900/20', tab: 'bg-blue-600 text-white' },
+  cyan: { selected: 'border-cyan-500 bg-cyan-900/20', tab: 'bg-cyan-600 text-white' },
+  green: { selected: 'border-green-500 bg-green-900/20', tab: 'bg-green-600 text-white' },
+  orange: { selected: 'border-orange-500 bg-orange-900/20', tab: 'bg-orange-600 text-white' },
+  purple: { selected: 'border-purple-500 bg-purple-900/20', tab: 'bg-purple-600 text-white' },
+  red: { selected: 'border-red-500 bg-red-900/20', tab: 'bg-red-600 text-white' },
+  yellow: { selected: 'border-yellow-500 bg-yellow-900/20', tab: 'bg-yellow-600 text-white' }
+};
+
+// Classes for a manifest `color`, falling back to cyan for unknown ones
+export const accent = (color) => ACCENTS[color] ?? ACCENTS.cyan;
+
+export const THEMES = {
+  dark: {
+    '--app-bg': '#111827',
+    '--app-surface': '#1f2937',
+    '--app-raised': '#374151',
+    '--app-raised-hover': '#4b5563',
+    '--app-border': '#374151',
+    '--app-border-strong': '#4b5563',
+    '--app-text': '#f9fafb',
+    '--app-text-soft': '#d1d5db',
+    '--app-muted': '#9ca3af',
+    '--app-faint': '#6b7280'
+  },
+  light: {
+    '--app-bg': '#f3f4f6',
+    '--app-surface': '#ffffff',
+    '--app-raised': '#e5e7eb',
+    '--app-raised-hover': '#d1d5db',
+    '--app-border': '#e5e7eb',
+    '--app-border-strong': '#d1d5db',
+    '--app-text': '#111827',
+    '--app-text-soft': '#374151',
+    '--app-muted': '#6b7280',
+    '--app-faint': '#9ca3af'
+  }
+};
+
+export const FONT_SIZES = { small: '14px', medium: '16px', large: '18px' };
+
+export const applyTheme = ({ theme, fontSize }, root = document.documentElement) => {
+  const name = THEMES[theme] ? theme : 'dark';
+  for (const [property, value] of Object.entries(THEMES[name])) {
+    root.style.setProperty(property, value);
+  }
+  root.dataset.theme = name;
+  root.style.colorScheme = name;
+  root.style.backgroundColor = 'var(--app-bg)';
+  root.style.color = 'var(--app-text)';
+  root.style.fontSize = FONT_SIZES[fontSize] ?? FONT_SIZES.medium;
+};
@@ -0,0 +1,21 @@
+// User Timing marks for startup, readable from the browser's performance
+// timeline (DevTools, or performance.getEntriesByType('measure')).
+
+const supported = typeof performance !== 'undefined' && typeof performance.mark === 'function';
+
+export const mark = (name) => {
+  if (supported) performance.mark(name);
+};
+
+// Measures from `start` (or from navigation start when omitted) to `end`
+export const measure = (name, start, end) => {
+  if (!supported) return null;
+  try {
+    return performance.measure(name, start, end);
+  } catch (error) {
+    // One of the marks was never set
+    return null;
+  }
+};
+
+export const marked = (name) => supported && performance.getEntriesByName(name, 'mark').length > 0;
@@ -0,0 +1,183 @@
+// Service worker: offline app shell and curriculum content.
+//
+// App shell: index.html and the scripts, styles and icons it references are
+// precached on install (the lucide icons used by the app are part of the
+// script bundle). The shell is served stale-while-revalidate, so a repeat
+// visit needs no network at all; when the background fetch brings a newer
+// index.html, the shell cache is brought in line with it for the next visit.
+// Assets the new index.html no longer references (including lazily loaded
+// chunks) move to a cache of the previous generation rather than being
+// deleted: a tab still running the old shell can go on loading its chunks.
+// That cache is replaced on the next shell update, so one previous
+// generation is kept.
+// Other navigations go network-first with the shell as the offline
+// fallback. Other same-origin static assets are content-hashed by the
+// bundler and served cache-first.
+//
+// Curriculum: each content domain has a manifest.json in its own directory
+// (/curriculum/manifest.json for B.Tech, /curriculum/cybersec/manifest.json
+// for Cybersecurity; see scripts/build-curriculum.mjs) that names one
+// content-hashed JSON file per section in that directory. Manifests are
+// served stale-while-revalidate. A newer manifest is only adopted once every
+// file it names is cached, and only sections whose hash changed are
+// fetched; files in its directory it no longer references are then dropped.
+// Section files never change, so they are served cache-first. The B.Tech
+// manifest is precached on install; other domains are cached the first
+// time they are opened.
+
+const SHELL_CACHE = 'shell-v1';
+const PREVIOUS_SHELL_CACHE = 'shell-previous-v1';
+const CONTENT_CACHE = 'curriculum-v1';
+const MANIFEST_URL = '/curriculum/manifest.json';
+const MANIFEST_PATTERN = /^\/curriculum\/(?:[\w-]+\/)*manifest\.json$/;
+const STATIC_DESTINATIONS = new Set(['script', 'style', 'image', 'font', 'worker', 'manifest']);
+
+const assetUrls = (html) => [
+  ...new Set([...html.matchAll(/(?:src|href)="(\/[^"#?]*)"/g)].map(match => match[1]))
+];
+
+// Caches `response` (for '/') and every asset it references, then moves
+// the shell assets it no longer references to the previous generation's
+// cache, replacing the generation before. Does nothing if index.html is
+// unchanged, so lazily loaded chunks cached since stay available offline.
+const updateShell = async (response) => {
+  const cache = await caches.open(SHELL_CACHE);
+  const html = await response.clone().text();
+  const cached = await cache.match('/');
+  if (cached && (await cached.text()) === html) return;
+  const urls = assetUrls(html);
+  await cache.addAll(urls);
+  await cache.put('/', response);
+  const keep = new Set(['/', ...urls]);
+  const stale = (await cache.keys()).filter(request => !keep.has(new URL(request.url).pathname));
+  await caches.delete(PREVIOUS_SHELL_CACHE);
+  const previous = await caches.open(PREVIOUS_SHELL_CACHE);
+  for (const request of stale) {
+    const asset = await cache.match(request);
+    if (asset) await previous.put(request, asset);
+    await cache.delete(request);
+  }
+};
+
+// Shell assets: the current generation, then the previous one, then the
+// network (cached as current)
+const serveAsset = async (request) => {
+  const cache = await caches.open(SHELL_CACHE);
+  const cached = (await cache.match(request)) ?? (await (await caches.open(PREVIOUS_SHELL_CACHE)).match(request));
+  if (cached) return cached;
+  const response = await fetch(request);
+  if (response.ok) await cache.put(request, response.clone());
+  return response;
+};
+
+// Directory of a manifest, with the trailing slash
+const baseOf = (manifestUrl) => manifestUrl.slice(0, manifestUrl.lastIndexOf('/') + 1);
+
+// Fetches the section files of a new manifest that are not cached yet, then
+// stores the manifest and drops the files in its directory it no longer
+// names. Other domains' directories are left alone.
+const updateContent = async (manifestUrl, response) => {
+  const cache = await caches.open(CONTENT_CACHE);
+  const manifest = await response.clone().json();
+  const base = baseOf(manifestUrl);
+  const files = Object.values(manifest.branches).map(({ file }) => `${base}${file}`);
+  const missing = [];
+  for (const url of files) {
+    if (!(await cache.match(url))) missing.push(url);
+  }
+  await cache.addAll(missing);
+  await cache.put(manifestUrl, response);
+  const keep = new Set([manifestUrl, ...files]);
+  for (const request of await cache.keys()) {
+    const { pathname } = new URL(request.url);
+    if (baseOf(pathname) === base && !keep.has(pathname)) {
+      await cache.delete(request);
+    }
+  }
+};
+
+const refreshContent = async (manifestUrl) => {
+  const response = await fetch(manifestUrl, { cache: 'no-cache' });
+  if (!response.ok) return response;
+  await updateContent(manifestUrl, response.clone());
+  return response;
+};
+
+const cacheFirst = async (cacheName, request) => {
+  const cache = await caches.open(cacheName);
+  const cached = await cache.match(request);
+  if (cached) return cached;
+  const response = await fetch(request);
+  if (response.ok) await cache.put(request, response.clone());
+  return response;
+};
+
+const serveManifest = async (event, manifestUrl) => {
+  const cached = await (await caches.open(CONTENT_CACHE)).match(manifestUrl);
+  const refresh = refreshContent(manifestUrl);
+  if (!cached) return refresh;
+  event.waitUntil(refresh.catch(() => {}));
+  return cached;
+};
+
+const refreshShell = async () => {
+  const response = await fetch('/', { cache: 'no-cache' });
+  if (response.ok) await updateShell(response.clone());
+  return response;
+};
+
+const serveShell = async (event) => {
+  const cached = await (await caches.open(SHELL_CACHE)).match('/');
+  const refresh = refreshShell();
+  if (!cached) return refresh;
+  event.waitUntil(refresh.catch(() => {}));
+  return cached;
+};
+
+const serveNavigation = async (event) => {
+  try {
+    return await fetch(event.request);
+  } catch (error) {
+    const cached = await (await caches.open(SHELL_CACHE)).match('/');
+    if (cached) return cached;
+    throw error;
+  }
+};
+
+self.addEventListener('install', (event) => {
+  event.waitUntil((async () => {
+    await refreshShell();
+    // No manifest in development builds: content is then only cached as it
+    // is requested
+    await refreshContent(MANIFEST_URL).catch(() => {});
+    await self.skipWaiting();
+  })());
+});
+
+self.addEventListener('activate', (event) => {
+  event.waitUntil((async () => {
+    const current = new Set([SHELL_CACHE, PREVIOUS_SHELL_CACHE, CONTENT_CACHE]);
+    for (const name of await caches.keys()) {
+      if (!current.has(name)) await caches.delete(name);
+    }
+    await self.clients.claim();
+  })());
+});
+
+self.addEventListener('fetch', (event) => {
+  const { request } = event;
+  if (request.method !== 'GET') return;
+  const url = new URL(request.url);
+  if (url.origin !== self.location.origin) return;
+
+  if (MANIFEST_PATTERN.test(url.pathname)) {
+    event.respondWith(serveManifest(event, url.pathname));
+  } else if (url.pathname.startsWith('/curriculum/') && url.pathname.endsWith('.json')) {
+    event.respondWith(cacheFirst(CONTENT_CACHE, request));
+  } else if (request.mode === 'navigate') {
+    const isShell = url.pathname === '/' || url.pathname === '/index.html';
+    event.respondWith(isShell ? serveShell(event) : serveNavigation(event));
+  } else if (STATIC_DESTINATIONS.has(request.destination)) {
+    event.respondWith(serveAsset(request));
+  }
+});
@@ -0,0 +1,71 @@
+// Writes every content domain as content-hashed JSON for the service worker.
+//
+//   <out>/manifest.json                 B.Tech: { version, branches: { [key]: { file, hash, bytes } } }
+//   <out>/<key>.<hash>.json             one branch's { subjects, related }
+//   <out>/cybersec/manifest.json        the same layout for the Cybersecurity tracks
+//   <out>/cybersec/<key>.<hash>.json
+//
+// Each domain's directory matches its dataPath (curriculum/domain.js).
+// `related` holds the domain's related topics (lib/related.js).
+//
+// A branch's file name only changes when its content does, so after a
+// content update clients re-fetch just the branches that changed. Files
+// from earlier builds are left in place for clients still on an older
+// manifest.
+//
+// Usage: node scripts/build-curriculum.mjs [--out public/curriculum]
+
+import { createHash } from 'node:crypto';
+import { mkdir, writeFile } from 'node:fs/promises';
+import { fileURLToPath } from 'node:url';
+import path from 'node:path';
+import { CONTENT_VERSION, btech } from '../curriculum/index.js';
+import { cybersec } from '../curriculum/cybersec/index.js';
+import { withRelated } from '../lib/related.js';
+
+// Domain, and its directory relative to <out>
+const DOMAINS = [[btech, '.'], [cybersec, 'cybersec']];
+
+export const hashContent = (json) => createHash('sha256').update(json).digest('hex').slice(0, 12);
+
+// { manifest, files: { [file]: json } } for the given branch contents
+export const buildCurriculum = (contents, version = CONTENT_VERSION) => {
+  const manifest = { version, branches: {} };
+  const files = {};
+  for (const [key, content] of Object.entries(contents)) {
+    const json = JSON.stringify(content);
+    const hash = hashContent(json);
+    const file = `${key}.${hash}.json`;
+    manifest.branches[key] = { file, hash, bytes: Buffer.byteLength(json) };
+    files[file] = json;
+  }
+  return { manifest, files };
+};
+
+// { [key]: content } for every section of a domain
+export const loadDomain = async (domain) => {
+  const contents = {};
+  for (const key of Object.keys(domain.manifest)) {
+    contents[key] = await domain.load(key);
+  }
+  return contents;
+};
+
+export const loadAllBranches = () => loadDomain(btech);
+
+if (process.argv[1] === fileURLToPath(import.meta.url)) {
+  const i = process.argv.indexOf('--out');
+  const out = i === -1 ? 'public/curriculum' : process.argv[i + 1];
+  for (const [domain, dir] of DOMAINS) {
+    const { manifest, files } = buildCurriculum(withRelated(await loadDomain(domain)));
+    const domainOut = path.join(out, dir);
+    await mkdir(domainOut, { recursive: true });
+    for (const [file, json] of Object.entries(files)) {
+      await writeFile(path.join(domainOut, file), json);
+    }
+    await writeFile(path.join(domainOut, 'manifest.json'), JSON.stringify(manifest, null, 2));
+    for (const [key, { file, bytes }] of Object.entries(manifest.branches)) {
+      console.log(`${domain.id.padEnd(8)} ${key.padEnd(9)} ${file.padEnd(28)} ${(bytes / 1024).toFixed(1)} KB`);
+    }
+  }
+}
@@ -0,0 +1,161 @@
+// Prerenders the B.Tech curriculum views to static HTML.
+//
+//   <out>/learn/<branch>/index.html                 branch grid and subjects
+//   <out>/learn/<branch>/<subject>/index.html       the subject's topics
+//   <out>/learn/<branch>/<subject>/<idx>/index.html the same, one topic expanded
+//
+// (URLs in lib/routes.js.) Each page is the built index.html with the view's
+// markup inside the root element, so it paints before any script runs. The
+// markup uses the classes of BTechMode, BranchGrid, SubjectGrid and
+// TopicCard, with plain links in place of the buttons, so the pages can be
+// browsed without JavaScript. Icons are lucide components and are left out.
+// The dark theme's color variables are inlined, so the page paints in
+// the default theme before the app applies the saved one.
+// Expanded topics link to their related topics (lib/related.js).
+//
+// The branch's content is embedded as JSON. When the bundle runs, the app
+// reads the deep link and that content (lib/routes.js), seeds the domain
+// with it and renders the same view over the static markup, without
+// fetching anything first. React cannot hydrate markup it did not render
+// itself, so this is a takeover rather than hydrateRoot().
+//
+// Runs on Node alone, with no network access.
+//
+// Usage: node scripts/prerender.mjs [--template dist/index.html] [--out dist] [--root root]
+
+import { mkdir, readFile, writeFile } from 'node:fs/promises';
+import { fileURLToPath } from 'node:url';
+import path from 'node:path';
+import { branchManifest } from '../curriculum/index.js';
+import { THEMES, accent } from '../lib/theme.js';
+import { PRERENDERED_STATE_ID, pathFor } from '../lib/routes.js';
+import { withRelated } from '../lib/related.js';
+import { loadAllBranches } from './build-curriculum.mjs';
+
+const escapeHtml = (text) => String(text).replace(/[&<>"']/g, char => `&#${char.charCodeAt(0)};`);
+
+// The dark theme's variables (lib/theme.js), which the markup's colors
+// need before the app applies the saved theme
+const themeStyle = `<style>:root{${Object.entries(THEMES.dark).map(([property, value]) => `${property}:${value}`).join(';')};background-color:var(--app-bg);color:var(--app-text)}</style>`;
+
+// JSON that cannot close the script element it sits in
+const embedJson = (value) => JSON.stringify(value).replace(/</g, '\\u003c');
+
+const branchGrid = (selected) => `
+<div class="grid grid-cols-2 md:grid-cols-3 lg:grid-cols-6 gap-3">${Object.entries(branchManifest).map(([key, branch]) => `
+  <a href="${pathFor({ branch: key })}" class="p-4 rounded-lg border-2 transition flex flex-col items-center gap-2 ${key === selected ? accent(branch.color).selected : 'border-[var(--app-border)] bg-[var(--app-surface)] hover:border-[var(--app-border-strong)]'}">
+    <span class="w-8 h-8"></span>
+    <span class="text-xs font-semibold text-center">${escapeHtml(branch.name)}</span>
+  </a>`).join('')}
+</div>`;
+
+const subjectGrid = (branch, subjects, selected) => `
+<div class="grid grid-cols-2 md:grid-cols-3 lg:grid-cols-4 gap-3">${Object.entries(subjects).map(([key, subject]) => `
+  <a href="${pathFor({ branch, subject: key })}" class="p-3 rounded-lg border transition ${key === selected ? 'border-cyan-500 bg-cyan-900/30' : 'border-[var(--app-border)] bg-[var(--app-surface)] hover:border-[var(--app-border-strong)]'}">
+    <span class="text-sm font-semibold">${escapeHtml(subject.name)}</span>
+  </a>`).join('')}
+</div>`;
+
+const list = (heading, headingClass, items, itemClass, bullet = '') => `
+    <div class="bg-[var(--app-bg)] p-3 rounded">
+      <h4 class="text-sm font-semibold ${headingClass} mb-2">${heading}</h4>
+      <ul class="space-y-1">${items.map(item => `
+        <li class="${itemClass}">${bullet}${escapeHtml(item)}</li>`).join('')}
+      </ul>
+    </div>`;
+
+const relatedList = (related) => `
+    <div class="bg-[var(--app-bg)] p-3 rounded">
+      <h4 class="text-sm font-semibold text-purple-400 mb-2">🔗 Related Topics:</h4>
+      <ul class="space-y-1">${related.map(entry => `
+        <li><a href="${pathFor(entry)}" class="text-sm text-[var(--app-text-soft)] hover:text-cyan-300">${escapeHtml(entry.title)} <span class="text-xs text-[var(--app-faint)]">· ${escapeHtml(entry.subjectName)}</span></a></li>`).join('')}
+      </ul>
+    </div>`;
+
+const topicCard = (branch, subject, topicKey, topic, expanded, related) => `
+<div id="${topicKey}" class="bg-[var(--app-surface)] rounded-lg border border-[var(--app-border)]">
+  <div class="p-4 flex items-center justify-between">
+    <a href="${expanded ? pathFor({ branch, subject }) : pathFor({ branch, subject, topicKey })}" class="flex-1 text-left flex items-center gap-3">
+      <span class="font-semibold text-cyan-300">${escapeHtml(topic.title)}</span>
+    </a>
+  </div>${expanded ? `
+  <div class="px-4 pb-4 space-y-3">
+    <p class="text-sm text-[var(--app-muted)]">${escapeHtml(topic.content)}</p>${
+  topic.formulas ? list('📐 Formulas:', 'text-yellow-400', topic.formulas, 'flex items-center gap-2 text-sm font-mono text-[var(--app-text-soft)]') : ''}${
+  topic.keyPoints ? list('💡 Key Points:', 'text-green-400', topic.keyPoints, 'text-sm text-[var(--app-text-soft)]', '• ') : ''}${
+  topic.examples ? list('📝 Examples:', 'text-blue-400', topic.examples, 'text-sm text-[var(--app-text-soft)]', '• ') : ''}${
+  related?.length ? relatedList(related) : ''}
+  </div>` : ''}
+</div>`;
+
+// Markup of one view, as BTechMode lays it out
+export const renderView = ({ branch, subject = null, topicKey = null }, content) => {
+  const subjects = content.subjects;
+  return `
+<div class="mb-6">
+  <h2 class="text-lg font-semibold mb-3">Select Branch:</h2>${branchGrid(branch)}
+</div>
+<div class="mb-6">
+  <div class="flex items-center gap-3 mb-3">
+    <span class="w-6 h-6"></span>
+    <h2 class="text-xl font-bold">${escapeHtml(branchManifest[branch].name)}</h2>
+  </div>${subjectGrid(branch, subjects, subject)}
+</div>${subject ? `
+<div class="space-y-3">${subjects[subject].topics.map((topic, idx) => {
+    const key = `${subject}-${idx}`;
+    return topicCard(branch, subject, key, topic, key === topicKey, content.related?.[key]);
+  }).join('')}
+</div>` : ''}`;
+};
+
+const titleOf = ({ branch, subject, topicKey }, content) => {
+  const parts = [branchManifest[branch].name];
+  if (subject) parts.unshift(content.subjects[subject].name);
+  if (topicKey) parts.unshift(content.subjects[subject].topics[Number(topicKey.slice(subject.length + 1))].title);
+  return parts.join(' · ');
+};
+
+// Every view of every branch: [{ branch, subject, topicKey }]
+export const views = (contents) => Object.entries(contents).flatMap(([branch, content]) => [
+  { branch, subject: null, topicKey: null },
+  ...Object.entries(content.subjects).flatMap(([subject, { topics }]) => [
+    { branch, subject, topicKey: null },
+    ...topics.map((_, idx) => ({ branch, subject, topicKey: `${subject}-${idx}` }))
+  ])
+]);
+
+// { [url path]: html } for every view, built from `template` (the app's
+// index.html), whose element with id `root` receives the markup. `contents`
+// defaults to every branch, with related topics added.
+export const prerender = async ({ template, root = 'root', contents }) => {
+  const mount = new RegExp(`(<div[^>]*\\bid="${root}"[^>]*>)\\s*(</div>)`);
+  if (!mount.test(template)) throw new Error(`No empty <div id="${root}"> in the template`);
+  contents ??= withRelated(await loadAllBranches());
+  const pages = {};
+  for (const view of views(contents)) {
+    const content = contents[view.branch];
+    const state = `<script type="application/json" id="${PRERENDERED_STATE_ID}">${embedJson({ branch: view.branch, content })}</script>`;
+    pages[pathFor(view)] = template
+      .replace(/<title>[^<]*<\/title>/, () => `<title>${escapeHtml(titleOf(view, content))}</title>`)
+      .replace('</head>', () => `${themeStyle}\n</head>`)
+      .replace(mount, (_, open, close) => `${open}${renderView(view, content)}${close}`)
+      .replace('</body>', () => `${state}\n</body>`);
+  }
+  return pages;
+};
+
+if (process.argv[1] === fileURLToPath(import.meta.url)) {
+  const option = (name, fallback) => {
+    const i = process.argv.indexOf(`--${name}`);
+    return i === -1 ? fallback : process.argv[i + 1];
+  };
+  const out = option('out', 'dist');
+  const template = await readFile(option('template', path.join(out, 'index.html')), 'utf8');
+  const pages = await prerender({ template, root: option('root', 'root') });
+  for (const [url, html] of Object.entries(pages)) {
+    const dir = path.join(out, url);
+    await mkdir(dir, { recursive: true });
+    await writeFile(path.join(dir, 'index.html'), html);
+  }
+  console.log(`${Object.keys(pages).length} pages written to ${path.join(out, 'learn')}`);
+}
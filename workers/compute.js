@@ -0,0 +1,9 @@
+// Compute worker: runs the ops in lib/computeOps.js off the main thread.
+
+import { createComputeOps, handleComputeRequest } from '../lib/computeOps.js';
+
+const ops = createComputeOps();
+
+self.onmessage = ({ data }) => {
+  handleComputeRequest(ops, data, (message, transfer) => self.postMessage(message, transfer));
+};